@@ -1,14 +1,104 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
+from typing import List, Optional
 import numpy as np
+import json
 import math
+import os
+import struct
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 from griffith.geometry import CenterCrackedPlate
 from griffith.fatigue import ParisLawIntegrator
 from griffith.epfm import j_integral
 from griffith.r_curve import RCurveAnalysis
+from griffith import rendering
+from griffith.design_surfaces import DesignSurfaces
+
+# Binary columnar responses: header (magic, version, n_columns, n_rows), then
+# per column a length-prefixed UTF-8 name, then the columns as little-endian float64
+_BINARY_MAGIC = b'GRFB'
+_BINARY_VERSION = 1
+_BINARY_HEADER = struct.Struct('<4sBHQ')
+_BATCH_FORMATS = ('json', 'binary', 'msgpack')
+_BATCH_MAX_ROWS = 1_000_000
+
+# Precomputed surfaces (python -m griffith.design_surfaces), memory-mapped so
+# every worker process shares the same pages
+_DESIGN_SURFACES_DIR = os.environ.get('GRIFFITH_DESIGN_SURFACES')
+design_surfaces = DesignSurfaces(_DESIGN_SURFACES_DIR) if _DESIGN_SURFACES_DIR else None
+
+def _json_safe(obj):
+    # Plain JSON has no NaN/inf: map them to null like orjson does
+    if isinstance(obj, (np.ndarray, np.generic)):
+        obj = obj.tolist()
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _json_safe(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_json_safe(v) for v in obj]
+    return obj
+
+class NumpyJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson, which serializes NumPy arrays and
+    scalars natively (NaN becomes null) instead of walking them element by element.
+    Without orjson the standard json module is used, with the same null mapping.
+    """
+    def render(self, content):
+        if orjson is None:
+            return json.dumps(_json_safe(content), allow_nan=False, separators=(',', ':')).encode('utf-8')
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+def encode_columns(columns):
+    """
+    Packs equally long numeric columns into the binary response format.
+
+    Args:
+        columns (dict): Column name -> 1-D array.
+
+    Returns:
+        bytes: Header, column names and the float64 column block.
+    """
+    arrays = [np.ascontiguousarray(v, dtype='<f8').ravel() for v in columns.values()]
+    n_rows = arrays[0].size if arrays else 0
+    parts = [_BINARY_HEADER.pack(_BINARY_MAGIC, _BINARY_VERSION, len(arrays), n_rows)]
+    for name in columns:
+        encoded = name.encode('utf-8')
+        parts.append(struct.pack('<B', len(encoded)) + encoded)
+    parts.extend(arr.tobytes() for arr in arrays)
+    return b''.join(parts)
+
+def decode_columns(data):
+    """
+    Unpacks encode_columns() output into a dict of float64 arrays.
+    """
+    magic, version, n_columns, n_rows = _BINARY_HEADER.unpack_from(data)
+    if magic != _BINARY_MAGIC or version != _BINARY_VERSION:
+        raise ValueError("Not a Griffith binary response")
+    offset = _BINARY_HEADER.size
+    names = []
+    for _ in range(n_columns):
+        length = data[offset]
+        names.append(bytes(data[offset + 1:offset + 1 + length]).decode('utf-8'))
+        offset += 1 + length
+    block = np.frombuffer(data, dtype='<f8', count=n_columns * n_rows, offset=offset).reshape(n_columns, n_rows)
+    return dict(zip(names, block))
 
-app = FastAPI(title="Griffith Fracture Mechanics API")
+# Returned dicts still pass through jsonable_encoder first: array-heavy
+# endpoints return a NumpyJSONResponse themselves
+app = FastAPI(title="Griffith Fracture Mechanics API", default_response_class=NumpyJSONResponse)
 
 class SifRequest(BaseModel):
     geometry: str # 'CCT'
@@ -25,16 +115,66 @@ class FatigueRequest(BaseModel):
     geometry_factor: float
     stress_unit: str = "Pa" # "Pa" or "MPa"
 
+class InverseDesignRequest(BaseModel):
+    c: float
+    m: float
+    cycles: List[float]
+    solve_for: str # 'stress_range' or 'a_initial'
+    a_final: float
+    a_initial: Optional[float] = None
+    stress_range: Optional[float] = None
+    geometry_factor: float = 1.0
+    geometry: Optional[str] = None # 'CCT' for the secant Y(a); crack lengths are then total lengths 2a
+    width: Optional[float] = None
+    stress_unit: str = "Pa" # "Pa" or "MPa"
+
 class JIntegralRequest(BaseModel):
     k_i: float
     youngs_modulus: float
     plane_stress: bool = True
 
+class DesignLookupRequest(BaseModel):
+    quantity: str # 'remaining_cycles', 'critical_crack_length' or 'instability_stress'
+    crack_length: Optional[float] = None
+    stress_range: Optional[float] = None # in the units of the surfaces' Paris law C
+    geometry_factor: Optional[float] = None
+    width: Optional[float] = None # for CCT surfaces; crack lengths are then total lengths 2a
+    tolerance: float = 1e-2 # largest accepted relative interpolation error
+
 class RCurveRequest(BaseModel):
     initial_crack: float
     youngs_modulus: float = 200e9
     geometry_factor: float = 1.0
 
+# Hardcoded material resistance for demo: R = 150 + 400 * sqrt(da)  (kJ/m^2)
+# Optimization: Use math.sqrt(delta_a) instead of delta_a ** 0.5 for performance
+# ⚡ Bolt Optimization: Pre-multiply 1000 into the formula coefficients to avoid a runtime multiplication
+def material_resistance(delta_a):
+    if np.isscalar(delta_a):
+        return 150000 + 400000 * math.sqrt(delta_a)
+    return 150000 + 400000 * np.sqrt(delta_a)
+
+# Analytical derivative for performance: dR/da = 200 / sqrt(da) (kJ/m^3)
+# ⚡ Bolt Optimization: Pre-multiply 1000 into the formula coefficients to avoid a runtime multiplication
+def material_resistance_derivative(delta_a):
+    if np.isscalar(delta_a):
+        return 200000 / math.sqrt(delta_a)
+    return 200000 / np.sqrt(delta_a)
+
+def _figure_response(figure, fmt):
+    """
+    Wraps rendered image bytes in a Response; Plotly figures are returned as JSON.
+    """
+    if fmt == 'plotly':
+        return NumpyJSONResponse(figure)
+    return Response(content=figure, media_type=rendering.media_type(fmt))
+
+def _check_format(fmt):
+    try:
+        rendering.media_type(fmt)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @app.get("/")
 def read_root():
     return {"message": "Griffith Fracture Mechanics Tool"}
@@ -48,8 +188,10 @@ def calculate_sif(request: SifRequest):
     else:
         raise HTTPException(status_code=400, detail="Geometry not supported")
 
-@app.post("/calculate-fatigue")
-def calculate_fatigue(request: FatigueRequest):
+def _paris_stress_range(request):
+    """
+    Stress range in the units expected by the Paris law coefficient C.
+    """
     stress_range = request.stress_range
 
     # If using typical C values (e.g. 1e-11), they are usually for MPa*sqrt(m).
@@ -90,6 +232,21 @@ def calculate_fatigue(request: FatigueRequest):
         # Convert stress to MPa
         stress_range = stress_range / 1e6
 
+    return stress_range
+
+def _request_stress_range(stress_range, request):
+    """
+    Inverse of _paris_stress_range: a stress range in the units of C, back in
+    the request's stress_unit (Pa for the usual MPa-based C).
+    """
+    if request.stress_unit == "Pa" and request.c < 1e-8:
+        return stress_range * 1e6
+    return stress_range
+
+@app.post("/calculate-fatigue")
+def calculate_fatigue(request: FatigueRequest):
+    stress_range = _paris_stress_range(request)
+
     integrator = ParisLawIntegrator(c=request.c, m=request.m)
     cycles = integrator.predict_cycles(
         stress_range=stress_range,
@@ -99,6 +256,57 @@ def calculate_fatigue(request: FatigueRequest):
     )
     return {"cycles": cycles}
 
+@app.post("/inverse-design")
+def inverse_design(request: InverseDesignRequest):
+    geometry = None
+    if request.geometry == 'CCT':
+        if request.width is None:
+            raise HTTPException(status_code=400, detail="width is required for the CCT geometry")
+        geometry = CenterCrackedPlate(width=request.width, crack_length=request.a_final)
+    elif request.geometry is not None:
+        raise HTTPException(status_code=400, detail="Geometry not supported")
+
+    integrator = ParisLawIntegrator(c=request.c, m=request.m)
+    cycles = np.asarray(request.cycles, dtype=float)
+    if request.solve_for == 'stress_range':
+        if request.a_initial is None:
+            raise HTTPException(status_code=400, detail="a_initial is required to solve for the stress range")
+        result = _request_stress_range(integrator.allowable_stress_range(
+            cycles, request.a_initial, request.a_final, request.geometry_factor, geometry
+        ), request)
+    elif request.solve_for == 'a_initial':
+        if request.stress_range is None:
+            raise HTTPException(status_code=400, detail="stress_range is required to solve for the initial flaw")
+        result = integrator.max_initial_flaw(
+            cycles, _paris_stress_range(request), request.a_final, request.geometry_factor, geometry
+        )
+    else:
+        raise HTTPException(status_code=400, detail="solve_for must be 'stress_range' or 'a_initial'")
+
+    # Returned as a response so the array skips jsonable_encoder; NaN (no feasible value) becomes null
+    return NumpyJSONResponse({request.solve_for: np.atleast_1d(result), "cycles": request.cycles,
+                              "stress_unit": request.stress_unit})
+
+@app.post("/design-lookup")
+def design_lookup(request: DesignLookupRequest):
+    if design_surfaces is None:
+        raise HTTPException(status_code=503, detail="No design surfaces configured (set GRIFFITH_DESIGN_SURFACES)")
+    try:
+        axes = design_surfaces.surface_axes(request.quantity)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    coords = [getattr(request, axis) for axis in axes]
+    missing = [axis for axis, value in zip(axes, coords) if value is None]
+    if missing:
+        raise HTTPException(status_code=422, detail=f"Missing {', '.join(missing)} for {request.quantity}")
+
+    value, error = design_surfaces.lookup(request.quantity, *coords, tolerance=request.tolerance)
+    return {
+        request.quantity: None if math.isnan(value) else value,
+        "relative_error": error,
+        "material": design_surfaces.parameters['material'],
+    }
+
 @app.post("/calculate-j-integral")
 def calculate_j_integral(request: JIntegralRequest):
     j = j_integral(
@@ -110,17 +318,6 @@ def calculate_j_integral(request: JIntegralRequest):
 
 @app.post("/calculate-r-curve")
 def calculate_r_curve(request: RCurveRequest):
-    # Hardcoded material resistance for demo: R = 150 + 400 * sqrt(da)  (kJ/m^2)
-    # Optimization: Use math.sqrt(delta_a) instead of delta_a ** 0.5 for performance
-    # ⚡ Bolt Optimization: Pre-multiply 1000 into the formula coefficients to avoid a runtime multiplication
-    def material_resistance(delta_a):
-        return 150000 + 400000 * math.sqrt(delta_a)
-
-    # Analytical derivative for performance: dR/da = 200 / sqrt(da) (kJ/m^3)
-    # ⚡ Bolt Optimization: Pre-multiply 1000 into the formula coefficients to avoid a runtime multiplication
-    def material_resistance_derivative(delta_a):
-        return 200000 / math.sqrt(delta_a)
-
     analysis = RCurveAnalysis(
         resistance_func=material_resistance,
         resistance_deriv_func=material_resistance_derivative
@@ -141,3 +338,145 @@ def calculate_r_curve(request: RCurveRequest):
         }
     else:
         return {"message": "Stable tearing (no instability found)."}
+
+@app.post("/plot-sif")
+def plot_sif(request: SifRequest, format: str = "png"):
+    _check_format(format)
+    if request.geometry != 'CCT':
+        raise HTTPException(status_code=400, detail="Geometry not supported")
+
+    specimen = CenterCrackedPlate(width=request.width, crack_length=request.crack_length)
+    crack_length = np.linspace(request.width * 0.01, request.width * 0.95, 200)
+    k1 = request.stress * specimen.unit_k1(crack_length)
+    figure = rendering.render_k_curve(crack_length, k1, fmt=format)
+    return _figure_response(figure, format)
+
+@app.post("/plot-fatigue-growth")
+def plot_fatigue_growth(request: FatigueRequest, format: str = "plotly"):
+    _check_format(format)
+    integrator = ParisLawIntegrator(c=request.c, m=request.m)
+    cycles, crack_length = rendering.growth_curve(
+        integrator,
+        _paris_stress_range(request),
+        request.a_initial,
+        request.a_final,
+        request.geometry_factor
+    )
+    figure = rendering.render_growth_curve(cycles, crack_length, fmt=format)
+    return _figure_response(figure, format)
+
+@app.post("/plot-r-curve")
+def plot_r_curve(request: RCurveRequest, format: str = "png"):
+    _check_format(format)
+    analysis = RCurveAnalysis(
+        resistance_func=material_resistance,
+        resistance_deriv_func=material_resistance_derivative
+    )
+    critical_stress = analysis.find_instability_load(
+        initial_crack=request.initial_crack,
+        youngs_modulus=request.youngs_modulus,
+        geometry_factor=request.geometry_factor
+    )
+    if not critical_stress:
+        raise HTTPException(status_code=422, detail="Stable tearing (no instability found).")
+
+    figure = rendering.stability_diagram(analysis, fmt=format)
+    return _figure_response(figure, format)
+
+async def _read_columns(request, columns):
+    """
+    Parses a columnar JSON batch straight into float64 arrays.
+
+    Each field is a number or a list of numbers; scalars are broadcast to the
+    batch length. This replaces per-element pydantic validation with one
+    np.asarray per column plus vectorized shape and finiteness checks.
+
+    Args:
+        request (Request): Incoming request.
+        columns (dict): Column name -> default value (None for required columns).
+
+    Returns:
+        dict: Column name -> 1-D float64 array, all of equal length.
+    """
+    body = await request.body()
+    try:
+        payload = orjson.loads(body) if orjson is not None else json.loads(body)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Request body must be valid JSON")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=422, detail="Request body must be a JSON object of columns")
+
+    arrays = []
+    for name, default in columns.items():
+        value = payload.get(name, default)
+        if value is None:
+            raise HTTPException(status_code=422, detail=f"Missing column '{name}'")
+        try:
+            arr = np.asarray(value, dtype=float)
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=422, detail=f"Column '{name}' must be a number or a list of numbers")
+        if arr.ndim > 1:
+            raise HTTPException(status_code=422, detail=f"Column '{name}' must be one-dimensional")
+        if arr.size == 0:
+            raise HTTPException(status_code=422, detail=f"Column '{name}' must not be empty")
+        if not np.isfinite(arr).all():
+            raise HTTPException(status_code=422, detail=f"Column '{name}' contains non-finite values")
+        arrays.append(arr)
+
+    try:
+        arrays = np.broadcast_arrays(*arrays)
+    except ValueError:
+        raise HTTPException(status_code=422, detail="Columns must have equal lengths")
+    if arrays[0].size > _BATCH_MAX_ROWS:
+        raise HTTPException(status_code=413, detail=f"Batches are limited to {_BATCH_MAX_ROWS} rows")
+    return {name: np.atleast_1d(arr) for name, arr in zip(columns, arrays)}
+
+def _columnar_response(columns, fmt):
+    """
+    Returns result columns as orjson JSON, the binary column format or MessagePack.
+    """
+    if fmt == 'binary':
+        return Response(content=encode_columns(columns), media_type='application/octet-stream')
+    if fmt == 'msgpack':
+        content = msgpack.packb({name: np.asarray(arr).tolist() for name, arr in columns.items()})
+        return Response(content=content, media_type='application/msgpack')
+    return NumpyJSONResponse(columns)
+
+def _check_batch_format(fmt):
+    if fmt not in _BATCH_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported format '{fmt}'. Use one of {list(_BATCH_FORMATS)}.")
+    if fmt == 'msgpack' and msgpack is None:
+        raise HTTPException(status_code=400, detail="MessagePack responses require the msgpack package")
+
+@app.post("/batch/calculate-sif")
+async def batch_calculate_sif(request: Request, format: str = "json"):
+    _check_batch_format(format)
+    columns = await _read_columns(request, {'width': None, 'crack_length': None, 'stress': None})
+    width = columns['width']
+    crack_length = columns['crack_length']
+    if np.any(crack_length <= 0.0) or np.any(crack_length >= width):
+        raise HTTPException(status_code=422, detail="crack_length must lie in (0, width)")
+
+    specimen = CenterCrackedPlate(width=width, crack_length=crack_length)
+    return _columnar_response({'k1': columns['stress'] * specimen.unit_k1(crack_length)}, format)
+
+@app.post("/batch/calculate-fatigue")
+async def batch_calculate_fatigue(request: Request, format: str = "json"):
+    _check_batch_format(format)
+    columns = await _read_columns(request, {
+        'c': None, 'm': None, 'stress_range': None, 'a_initial': None, 'a_final': None, 'geometry_factor': 1.0
+    })
+    c, m = columns['c'], columns['m']
+    if np.ptp(c) or np.ptp(m):
+        raise HTTPException(status_code=422, detail="c and m must be single values per batch")
+    if np.any(columns['a_initial'] <= 0.0) or np.any(columns['a_final'] <= columns['a_initial']):
+        raise HTTPException(status_code=422, detail="Require 0 < a_initial < a_final")
+
+    # Same unit heuristic as _paris_stress_range, row by row
+    stress_range = columns['stress_range']
+    stress_range = np.where((stress_range > 1e5) & (c < 1e-8), stress_range / 1e6, stress_range)
+
+    cycles = ParisLawIntegrator(c=float(c[0]), m=float(m[0])).predict_cycles(
+        stress_range, columns['a_initial'], columns['a_final'], columns['geometry_factor']
+    )
+    return _columnar_response({'cycles': cycles}, format)
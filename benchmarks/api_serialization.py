@@ -0,0 +1,91 @@
+"""
+End-to-end latency and payload size of the API response formats.
+
+Runs the app in-process through the ASGI test client, so it measures
+request parsing, validation, computation and serialization without any
+network. The baseline is the classic FastAPI path: a pydantic model with
+List[float] fields and the default JSONResponse (jsonable_encoder).
+
+Usage:
+    python benchmarks/api_serialization.py --rows 1 1000 100000 --repeats 20
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import numpy as np
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from api.index import app, msgpack  # noqa: E402
+from griffith.geometry import CenterCrackedPlate  # noqa: E402
+
+class BaselineSifBatch(BaseModel):
+    width: float
+    crack_length: List[float]
+    stress: float
+
+baseline_app = FastAPI(default_response_class=JSONResponse)
+
+@baseline_app.post("/batch/calculate-sif")
+def baseline_batch_sif(request: BaselineSifBatch):
+    crack_length = np.asarray(request.crack_length)
+    specimen = CenterCrackedPlate(width=request.width, crack_length=crack_length)
+    return {'k1': (request.stress * specimen.unit_k1(crack_length)).tolist()}
+
+def _measure(client, url, payload, repeats):
+    body = json.dumps(payload)
+    headers = {'content-type': 'application/json'}
+    timings = []
+    size = 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        response = client.post(url, content=body, headers=headers)
+        timings.append(time.perf_counter() - start)
+        response.raise_for_status()
+        size = len(response.content)
+    timings = np.array(timings) * 1000.0
+    return {
+        'p50_ms': float(np.percentile(timings, 50)),
+        'p95_ms': float(np.percentile(timings, 95)),
+        'request_bytes': len(body),
+        'response_bytes': size,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, nargs='+', default=[1, 1000, 100000])
+    parser.add_argument('--repeats', type=int, default=20)
+    args = parser.parse_args()
+
+    client = TestClient(app)
+    baseline = TestClient(baseline_app)
+
+    report = {'single_request': {}, 'batch': {}}
+    single = {'geometry': 'CCT', 'width': 0.1, 'crack_length': 0.01, 'stress': 200e6}
+    report['single_request']['pydantic /calculate-sif'] = _measure(client, '/calculate-sif', single, args.repeats)
+    report['single_request']['columnar /batch/calculate-sif'] = _measure(
+        client, '/batch/calculate-sif', {'width': 0.1, 'crack_length': [0.01], 'stress': 200e6}, args.repeats
+    )
+
+    formats = ['json', 'binary'] + (['msgpack'] if msgpack is not None else [])
+    for rows in args.rows:
+        payload = {'width': 0.1, 'crack_length': np.linspace(0.001, 0.09, rows).tolist(), 'stress': 200e6}
+        results = {'baseline (pydantic + jsonable_encoder)': _measure(
+            baseline, '/batch/calculate-sif', payload, args.repeats
+        )}
+        for fmt in formats:
+            results[fmt] = _measure(client, f'/batch/calculate-sif?format={fmt}', payload, args.repeats)
+        report['batch'][str(rows)] = results
+
+    print(json.dumps(report, indent=2))
+
+if __name__ == '__main__':
+    main()
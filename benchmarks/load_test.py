@@ -0,0 +1,196 @@
+"""
+Local load test of the API with latency percentiles.
+
+Starts api.index:app under uvicorn on 127.0.0.1 (or targets --url), drives it
+with concurrent async httpx clients using a weighted mix of the calculation
+endpoints, and prints throughput, p50/p95/p99 latency and error rates as JSON.
+Everything runs on the loopback interface, so no network access is needed.
+
+Usage:
+    python benchmarks/load_test.py --concurrency 32 --duration 20 --output before.json
+    python benchmarks/load_test.py --mix sif=1,fatigue=1 --workers 2
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+
+def _sif(rng):
+    width = rng.uniform(0.05, 0.5)
+    return {'geometry': 'CCT', 'width': width, 'crack_length': width * rng.uniform(0.02, 0.8),
+            'stress': rng.uniform(50e6, 300e6)}
+
+def _fatigue(rng):
+    a_initial = rng.uniform(0.001, 0.005)
+    return {'c': 1.5e-11, 'm': rng.uniform(2.5, 3.5), 'stress_range': rng.uniform(50e6, 200e6),
+            'a_initial': a_initial, 'a_final': a_initial * rng.uniform(2.0, 20.0),
+            'geometry_factor': rng.uniform(1.0, 1.3)}
+
+def _j_integral(rng):
+    return {'k_i': rng.uniform(10e6, 100e6), 'youngs_modulus': rng.uniform(70e9, 210e9),
+            'plane_stress': bool(rng.integers(2))}
+
+def _r_curve(rng):
+    return {'initial_crack': rng.uniform(0.005, 0.1), 'youngs_modulus': 200e9,
+            'geometry_factor': rng.uniform(1.0, 1.2)}
+
+# Endpoint name -> (path, payload generator, default weight)
+ENDPOINTS = {
+    'sif': ('/calculate-sif', _sif, 4),
+    'fatigue': ('/calculate-fatigue', _fatigue, 3),
+    'j_integral': ('/calculate-j-integral', _j_integral, 2),
+    'r_curve': ('/calculate-r-curve', _r_curve, 1),
+}
+
+def _parse_mix(text):
+    if not text:
+        return {name: spec[2] for name, spec in ENDPOINTS.items()}
+    mix = {}
+    for item in text.split(','):
+        name, _, weight = item.partition('=')
+        if name not in ENDPOINTS:
+            raise SystemExit(f"Unknown endpoint '{name}'. Choose from {sorted(ENDPOINTS)}.")
+        mix[name] = float(weight or 1.0)
+    return mix
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def _start_server(port, workers):
+    command = [sys.executable, '-m', 'uvicorn', 'api.index:app', '--host', '127.0.0.1', '--port', str(port),
+               '--log-level', 'warning', '--workers', str(workers)]
+    return subprocess.Popen(command, cwd=ROOT)
+
+def _wait_until_ready(url, process, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise SystemExit("uvicorn exited before accepting connections")
+        try:
+            if httpx.get(url + '/', timeout=1.0).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    raise SystemExit(f"Server at {url} did not become ready within {timeout:.0f} s")
+
+async def _client(client, names, probabilities, seed, deadline, measure_from, records):
+    rng = np.random.default_rng(seed)
+    while True:
+        now = time.perf_counter()
+        if now >= deadline:
+            return
+        name = names[rng.choice(len(names), p=probabilities)]
+        path, payload, _ = ENDPOINTS[name]
+        start = time.perf_counter()
+        try:
+            response = await client.post(path, json=payload(rng))
+            ok = response.status_code == 200
+        except httpx.HTTPError:
+            ok = False
+        end = time.perf_counter()
+        if start >= measure_from:
+            records.append((name, end - start, ok))
+
+async def _run(url, mix, concurrency, duration, warmup, seed):
+    names = list(mix)
+    weights = np.array([mix[n] for n in names], dtype=float)
+    probabilities = weights / weights.sum()
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    records = []
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30.0) as client:
+        start = time.perf_counter()
+        measure_from = start + warmup
+        deadline = measure_from + duration
+        await asyncio.gather(*(
+            _client(client, names, probabilities, seed + i, deadline, measure_from, records)
+            for i in range(concurrency)
+        ))
+    return records
+
+def _summary(latencies, ok, duration):
+    latencies = np.asarray(latencies) * 1000.0
+    ok = np.asarray(ok, dtype=bool)
+    if latencies.size == 0:
+        return {'requests': 0}
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    return {
+        'requests': int(latencies.size),
+        'throughput_rps': latencies.size / duration,
+        'error_rate': float(1.0 - ok.mean()),
+        'mean_ms': float(latencies.mean()),
+        'p50_ms': float(p50),
+        'p95_ms': float(p95),
+        'p99_ms': float(p99),
+        'max_ms': float(latencies.max()),
+    }
+
+def _git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--url', help='Target an already running server instead of starting uvicorn')
+    parser.add_argument('--concurrency', type=int, default=16, help='Concurrent clients')
+    parser.add_argument('--duration', type=float, default=10.0, help='Measured seconds')
+    parser.add_argument('--warmup', type=float, default=2.0, help='Unmeasured seconds before the measurement')
+    parser.add_argument('--mix', help='Weighted endpoint mix, e.g. sif=4,fatigue=3,j_integral=2,r_curve=1')
+    parser.add_argument('--workers', type=int, default=1, help='uvicorn worker processes')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='Also write the JSON report to this file')
+    args = parser.parse_args()
+
+    mix = _parse_mix(args.mix)
+    process = None
+    url = args.url
+    if url is None:
+        url = f'http://127.0.0.1:{_free_port()}'
+        process = _start_server(int(url.rsplit(':', 1)[1]), args.workers)
+    try:
+        _wait_until_ready(url, process)
+        records = asyncio.run(_run(url, mix, args.concurrency, args.duration, args.warmup, args.seed))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+
+    report = {
+        'revision': _git_revision(),
+        'python': platform.python_version(),
+        'cpu_count': os.cpu_count(),
+        'url': url,
+        'concurrency': args.concurrency,
+        'duration_s': args.duration,
+        'workers': args.workers if process is not None else None,
+        'mix': mix,
+        'overall': _summary([r[1] for r in records], [r[2] for r in records], args.duration),
+        'endpoints': {
+            name: _summary([r[1] for r in records if r[0] == name], [r[2] for r in records if r[0] == name],
+                           args.duration)
+            for name in mix
+        },
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        Path(args.output).write_text(text + '\n')
+
+if __name__ == '__main__':
+    main()
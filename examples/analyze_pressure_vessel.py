@@ -1,51 +1,47 @@
+import numpy as np
+from griffith.lbb import Cylinder
 from griffith.materials import Steel
 
-class PressureVessel:
-    """
-    Simple cylindrical pressure vessel model.
-    """
-    def __init__(self, radius, thickness, pressure):
-        self.radius = radius
-        self.thickness = thickness
-        self.pressure = pressure
-
-    @property
-    def hoop_stress(self):
-        # Sigma = P * r / t
-        return self.pressure * self.radius / self.thickness
-
 def main():
     """
     LBB (Leak-Before-Break) analysis example.
     """
     # Define Vessel
     # Radius 1.0m, Thickness 10mm, Pressure 2 MPa
-    vessel = PressureVessel(radius=1.0, thickness=0.01, pressure=2e6)
+    vessel = Cylinder(radius=1.0, thickness=0.01, pressure=2e6)
 
     # Define Material (High Toughness Steel)
     material = Steel(K_IC=80e6)
 
     print(f"Hoop Stress: {vessel.hoop_stress/1e6:.2f} MPa")
 
-    # Calculate Critical Crack Length
-    # Assuming infinite plate approximation for small crack vs vessel size
-    # Or using a specific geometry factor for cylinder.
-    # For now, default Y=1.0 is used (approx).
-    a_crit = material.critical_crack_length(stress=vessel.hoop_stress)
+    # Axial through-wall crack with the Folias bulging correction, checked
+    # against fracture and plastic collapse (flow stress ~ 1.15 yield)
+    lbb = vessel.leak_before_break(material.k_ic, orientation='axial', flow_stress=1.15 * material.yield_strength)
 
-    print(f"Critical Crack Length (half-length a): {a_crit*1000:.2f} mm")
-    print(f"Total Critical Crack Length (2a): {2*a_crit*1000:.2f} mm")
+    print(f"Critical Crack Length (half-length c): {lbb['critical_half_length']*1000:.2f} mm")
+    print(f"Total Critical Crack Length (2c): {2*lbb['critical_half_length']*1000:.2f} mm")
+    print(f"Through-Wall Crack at Breakthrough (2c): {2*lbb['breakthrough_half_length']*1000:.2f} mm")
     print(f"Wall Thickness: {vessel.thickness*1000:.2f} mm")
 
     # Check LBB
-    # Condition: 2a_crit > t (for leak before unstable fracture)
-    # Actually, usually if 2a_crit > t, then a through-wall crack is stable.
-    # If the critical crack length for SURFACE crack (depth a_crit) > t, then it leaks before break.
-
-    if a_crit > vessel.thickness:
-        print("Result: Leak-Before-Break satisfied (Safe).")
+    # The surface crack must break through the wall without fracture, and the
+    # resulting through-wall crack must be shorter than the critical length.
+    if lbb['leak_before_break']:
+        print(f"Result: Leak-Before-Break satisfied (Safe), margin {lbb['margin']:.1f} on crack length.")
     else:
         print("Result: Break-Before-Leak (Unsafe).")
 
+    # The same screening runs on a whole inventory of segments in one call
+    rng = np.random.default_rng(0)
+    n = 1_000_000
+    inventory = Cylinder(
+        radius=rng.uniform(0.05, 1.0, n),
+        thickness=rng.uniform(0.005, 0.05, n),
+        pressure=rng.uniform(1e6, 15e6, n)
+    )
+    screening = inventory.leak_before_break(material.k_ic, flow_stress=1.15 * material.yield_strength)
+    print(f"Inventory: {np.count_nonzero(~screening['leak_before_break'])} of {n} segments fail LBB screening.")
+
 if __name__ == "__main__":
     main()
@@ -4,3 +4,4 @@ from griffith.geometry import CenterCrackedPlate, SingleEdgeNotchBend
 from griffith.fatigue import ParisLawIntegrator
 from griffith.r_curve import RCurveAnalysis
 from griffith.materials import Material, Steel, Aluminum, Titanium
+from griffith.solvers import find_roots, critical_crack_length, critical_load
@@ -0,0 +1,4 @@
+import sys
+from griffith.cli import main
+
+sys.exit(main())
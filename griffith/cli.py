@@ -0,0 +1,315 @@
+"""
+Batch processing of flaw inventories.
+
+    python -m griffith inventory.csv -o results.csv --workers 4
+
+Streams a CSV (or Parquet, with pyarrow) inventory in chunks, evaluates every
+row with the vectorized kernels and appends the results to the output file
+chunk by chunk, so memory stays bounded by the chunk size.
+"""
+import argparse
+import collections
+import csv
+import itertools
+import multiprocessing
+import sys
+import time
+
+import numpy as np
+
+from griffith.fatigue import _growth_damage, _geometry_growth_damage
+from griffith.geometry import CenterCrackedPlate
+from griffith.lefm import StressIntensityFactor
+from griffith.r_curve import RCurveAnalysis
+from griffith.solvers import critical_crack_length
+
+# Canonical input columns and their defaults (None: no default)
+COLUMNS = {
+    'crack_length': None,
+    'width': None,
+    'geometry_factor': 1.0,
+    'stress': None,
+    'stress_range': None,
+    'k_ic': None,
+    'c': None,
+    'm': None,
+    'youngs_modulus': 200e9,
+    'r0': None,
+    'r1': None,
+    'r_exponent': None,
+}
+GEOMETRIES = ('constant', 'cct')
+# Columns each geometry needs, from the file or --set
+_REQUIRED = {
+    'constant': ('crack_length',),
+    'cct': ('crack_length', 'width'),
+}
+
+_DEFAULT_CHUNKSIZE = 100_000
+_PARQUET_MISSING = "Parquet support requires the pyarrow package"
+
+def _has(columns, *names):
+    return all(name in columns for name in names)
+
+def process_chunk(columns, geometry='constant'):
+    """
+    Evaluates one chunk of flaws.
+
+    Outputs are computed from whichever inputs are present:
+    k1 (crack_length, stress), critical_crack_length (+ k_ic),
+    remaining_cycles (+ c, m, stress_range) and instability_stress
+    (crack_length, youngs_modulus and a power-law R-curve
+    R = r0 + r1 * delta_a^r_exponent in J/m^2).
+
+    Args:
+        columns (dict): Canonical column name -> 1-D float array.
+        geometry (str): 'constant' (K = Y * sigma * sqrt(pi a), Y from
+            geometry_factor) or 'cct' (secant finite width correction, needs
+            width; crack_length is the total length 2a).
+
+    Returns:
+        dict: Output column name -> array.
+    """
+    crack = columns['crack_length']
+    if geometry == 'cct':
+        specimen = CenterCrackedPlate(width=columns['width'], crack_length=crack)
+    else:
+        specimen = StressIntensityFactor(columns['geometry_factor'])
+
+    results = {}
+    if _has(columns, 'stress'):
+        results['k1'] = columns['stress'] * specimen.unit_k1(crack)
+
+    if _has(columns, 'stress', 'k_ic'):
+        if geometry == 'cct':
+            a_c = critical_crack_length(specimen, columns['k_ic'], columns['stress'])
+        else:
+            a_c = StressIntensityFactor.critical_crack_length(columns['k_ic'], columns['stress'],
+                                                              columns['geometry_factor'])
+        results['critical_crack_length'] = a_c
+
+        if _has(columns, 'c', 'm', 'stress_range'):
+            c, m = columns['c'], columns['m']
+            with np.errstate(invalid='ignore', divide='ignore'):
+                if geometry == 'cct':
+                    damage = _geometry_growth_damage(specimen, m, c, crack, a_c)
+                else:
+                    damage = _growth_damage(crack, a_c, c, m, columns['geometry_factor'])
+                cycles = damage / columns['stress_range'] ** m
+            # Cracks already at or beyond the critical size have no remaining life
+            results['remaining_cycles'] = np.where(crack >= a_c, 0.0, cycles)
+
+    if _has(columns, 'r0', 'r1', 'r_exponent'):
+        r0, r1, n = columns['r0'], columns['r1'], columns['r_exponent']
+        analysis = RCurveAnalysis(lambda da: r0 + r1 * da ** n, lambda da: (r1 * n) * da ** (n - 1.0))
+        results['instability_stress'] = analysis.find_geometry_instability(
+            specimen, crack, youngs_modulus=columns['youngs_modulus']
+        )
+
+    return results
+
+def _worker(task):
+    columns, geometry = task
+    return columns['crack_length'], process_chunk(columns, geometry)
+
+def _resolve(header, mapping, constants, geometry='constant'):
+    """
+    Maps canonical column names to file columns; returns {canonical: source}.
+    """
+    sources = {}
+    for name in COLUMNS:
+        source = mapping.get(name, name)
+        if source in header:
+            sources[name] = source
+    unknown = set(mapping) - set(COLUMNS)
+    if unknown:
+        raise SystemExit(f"Unknown column mapping(s): {', '.join(sorted(unknown))}")
+    for name in _REQUIRED[geometry]:
+        if name not in sources and name not in constants:
+            raise SystemExit(f"The {geometry} geometry needs a {name} column "
+                             f"(use --map {name}=<column> or --set {name}=<value>)")
+    return sources
+
+def _complete(columns, n_rows, constants):
+    for name, value in itertools.chain(constants.items(), COLUMNS.items()):
+        if name not in columns and value is not None:
+            columns[name] = np.full(n_rows, value)
+    return columns
+
+def _parse_error(path, lines, first_line, header, usecols):
+    """
+    Locates the first unparsable cell of a chunk for the error message.
+    """
+    for offset, line in enumerate(lines):
+        cells = next(csv.reader([line]))
+        for col in usecols:
+            value = cells[col].strip() if col < len(cells) else ''
+            try:
+                float(value)
+            except ValueError:
+                return SystemExit(f"{path}, line {first_line + offset}: column '{header[col]}' "
+                                  f"has the non-numeric value '{value}'")
+    return SystemExit(f"{path}, lines {first_line}-{first_line + len(lines) - 1}: could not parse the chunk")
+
+def _iter_csv(path, mapping, constants, chunksize, geometry='constant'):
+    with open(path, newline='') as f:
+        header = next(csv.reader([f.readline()]))
+        sources = _resolve(header, mapping, constants, geometry)
+        names = list(sources)
+        usecols = [header.index(sources[name]) for name in names]
+        # Line number of the next chunk's first row, counting the header as line 1
+        first_line = 2
+        while True:
+            lines = list(itertools.islice(f, chunksize))
+            if not lines:
+                return
+            try:
+                block = np.loadtxt(lines, delimiter=',', usecols=usecols, ndmin=2, dtype=float)
+            except ValueError:
+                raise _parse_error(path, lines, first_line, header, usecols) from None
+            first_line += len(lines)
+            yield _complete(dict(zip(names, block.T)), block.shape[0], constants)
+
+def _iter_parquet(path, mapping, constants, chunksize, geometry='constant'):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise SystemExit(_PARQUET_MISSING) from None
+    parquet = pq.ParquetFile(path)
+    sources = _resolve(parquet.schema_arrow.names, mapping, constants, geometry)
+    for batch in parquet.iter_batches(batch_size=chunksize, columns=list(sources.values())):
+        columns = {name: batch.column(source).to_numpy(zero_copy_only=False).astype(float)
+                   for name, source in sources.items()}
+        yield _complete(columns, batch.num_rows, constants)
+
+class _CsvWriter:
+    def __init__(self, path):
+        self._file = sys.stdout if path == '-' else open(path, 'w', newline='')
+        self._header = False
+
+    def write(self, columns):
+        if not self._header:
+            self._file.write(','.join(columns) + '\n')
+            self._header = True
+        # One %-format over the whole chunk is several times faster than np.savetxt's per-row loop
+        block = np.column_stack(list(columns.values()))
+        row_format = '%d,' + ','.join(['%.10g'] * (block.shape[1] - 1)) + '\n'
+        self._file.write((row_format * block.shape[0]) % tuple(block.ravel().tolist()))
+
+    def close(self):
+        if self._file is not sys.stdout:
+            self._file.close()
+
+class _ParquetWriter:
+    def __init__(self, path):
+        try:
+            import pyarrow
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit(_PARQUET_MISSING) from None
+        self._pa = pyarrow
+        self._pq = pq
+        self._path = path
+        self._writer = None
+
+    def write(self, columns):
+        table = self._pa.table({name: np.asarray(values) for name, values in columns.items()})
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self._path, table.schema)
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+def _is_parquet(path):
+    return path.lower().endswith(('.parquet', '.pq'))
+
+def _parse_assignments(items, convert):
+    parsed = {}
+    for item in items or ():
+        name, sep, value = item.partition('=')
+        if not sep:
+            raise SystemExit(f"Expected NAME=VALUE, got '{item}'")
+        parsed[name] = convert(value)
+    return parsed
+
+def _peak_memory_mb():
+    """
+    Peak RSS of this process and its workers in MB, or None where the
+    resource module is unavailable (Windows).
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    scale = 1.0 / 1024.0 if sys.platform != 'darwin' else 1.0 / (1024.0 * 1024.0)
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale
+    return own, children
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='griffith',
+        description='Evaluate K, critical crack size, remaining life and R-curve instability for a flaw inventory.'
+    )
+    parser.add_argument('inventory', help='Input CSV or Parquet file')
+    parser.add_argument('-o', '--output', default='-', help='Output CSV or Parquet file (default: CSV to stdout)')
+    parser.add_argument('--geometry', choices=GEOMETRIES, default='constant')
+    parser.add_argument('--map', action='append', metavar='COLUMN=SOURCE',
+                        help=f"Read a canonical column from another file column. Canonical: {', '.join(COLUMNS)}")
+    parser.add_argument('--set', action='append', metavar='COLUMN=VALUE',
+                        help='Constant value for a column missing from the file')
+    parser.add_argument('--chunksize', type=int, default=_DEFAULT_CHUNKSIZE, help='Rows per chunk')
+    parser.add_argument('--workers', type=int, default=1, help='Worker processes')
+    args = parser.parse_args(argv)
+
+    mapping = _parse_assignments(args.map, str)
+    constants = _parse_assignments(args.set, float)
+    unknown = set(constants) - set(COLUMNS)
+    if unknown:
+        raise SystemExit(f"Unknown column(s) in --set: {', '.join(sorted(unknown))}")
+
+    reader = _iter_parquet if _is_parquet(args.inventory) else _iter_csv
+    writer = _ParquetWriter(args.output) if _is_parquet(args.output) else _CsvWriter(args.output)
+    tasks = ((chunk, args.geometry)
+             for chunk in reader(args.inventory, mapping, constants, args.chunksize, args.geometry))
+
+    start = time.perf_counter()
+    n_rows = 0
+
+    def emit(result):
+        nonlocal n_rows
+        crack_length, outputs = result
+        rows = crack_length.size
+        writer.write({'row': np.arange(n_rows, n_rows + rows), 'crack_length': crack_length, **outputs})
+        n_rows += rows
+
+    pool = multiprocessing.Pool(args.workers) if args.workers > 1 else None
+    try:
+        if pool is None:
+            for task in tasks:
+                emit(_worker(task))
+        else:
+            # Bounded queue of chunks in flight keeps memory independent of the file size
+            pending = collections.deque()
+            for task in tasks:
+                pending.append(pool.apply_async(_worker, (task,)))
+                if len(pending) >= 2 * args.workers:
+                    emit(pending.popleft().get())
+            while pending:
+                emit(pending.popleft().get())
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        writer.close()
+
+    elapsed = time.perf_counter() - start
+    summary = f"{n_rows} rows in {elapsed:.2f} s ({n_rows / max(elapsed, 1e-9):,.0f} rows/s)"
+    memory = _peak_memory_mb()
+    if memory is not None:
+        summary += f", peak memory {memory[0]:.0f} MB (workers {memory[1]:.0f} MB)"
+    print(summary, file=sys.stderr)
+    return 0
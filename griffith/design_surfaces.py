@@ -0,0 +1,402 @@
+"""
+Precomputed design surfaces.
+
+    python -m griffith.design_surfaces surfaces/ --material steel --c 1.5e-11 --m 3 --stress-unit 1e6
+
+Tabulates remaining life, critical crack size and instability stress of one
+material on a fixed (crack length, stress range, geometry) grid as .npy files.
+DesignSurfaces memory-maps them, so every process serving lookups (e.g. the
+uvicorn workers of the API) shares the same page cache instead of holding its
+own copy, and answers lookups by multilinear interpolation in log-log space
+with a per-cell error estimate, computing directly off the grid.
+"""
+import argparse
+import bisect
+import itertools
+import json
+import math
+import os
+
+import numpy as np
+
+from griffith.fatigue import _growth_damage, _geometry_growth_damage
+from griffith.geometry import CenterCrackedPlate
+from griffith.lefm import StressIntensityFactor
+from griffith.materials import Aluminum, Steel, Titanium
+from griffith.r_curve import RCurveAnalysis
+from griffith.solvers import critical_crack_length, critical_load
+
+GEOMETRIES = ('constant', 'cct')
+MATERIALS = {'steel': Steel, 'aluminum': Aluminum, 'titanium': Titanium}
+# Third grid axis: the constant Y, or the plate width W of the CCT (crack lengths are then 2a)
+_GEOMETRY_AXIS = {'constant': 'geometry_factor', 'cct': 'width'}
+_MANIFEST = 'manifest.json'
+_VERSION = 1
+_DEFAULT_TOLERANCE = 1e-2
+
+def surface_axes(geometry='constant'):
+    """
+    Grid axes of every surface, in the order lookups take their coordinates.
+
+    Args:
+        geometry (str): 'constant' or 'cct'.
+
+    Returns:
+        dict: Surface name -> tuple of axis names.
+    """
+    if geometry not in GEOMETRIES:
+        raise ValueError(f"Unknown geometry '{geometry}'. Use one of {', '.join(GEOMETRIES)}.")
+    shape = _GEOMETRY_AXIS[geometry]
+    return {
+        'remaining_cycles': ('crack_length', 'stress_range', shape),
+        'critical_crack_length': ('stress_range', shape),
+        'instability_stress': ('crack_length', shape),
+    }
+
+def _specimen(parameters, coords):
+    if parameters['geometry'] == 'cct':
+        return CenterCrackedPlate(width=coords['width'], crack_length=coords.get('crack_length', 0.0))
+    return StressIntensityFactor(coords['geometry_factor'])
+
+def _critical_length(parameters, coords, specimen):
+    stress = coords['stress_range'] * (parameters['stress_unit'] / (1.0 - parameters['load_ratio']))
+    if parameters['geometry'] == 'cct':
+        return critical_crack_length(specimen, parameters['k_ic'], stress)
+    return StressIntensityFactor.critical_crack_length(parameters['k_ic'], stress, coords['geometry_factor'])
+
+def _compute(name, parameters, coords):
+    """
+    Evaluates a surface directly, with the same kernels as the batch processor.
+
+    Stress ranges are in the units of the Paris law C; the peak stress used for
+    the critical size is stress_range * stress_unit / (1 - load_ratio) in Pa.
+    """
+    specimen = _specimen(parameters, coords)
+    if name == 'critical_crack_length':
+        return _critical_length(parameters, coords, specimen)
+
+    crack = coords['crack_length']
+    if name == 'instability_stress':
+        if parameters['r_curve'] is None:
+            return critical_load(specimen, parameters['k_ic'], crack)
+        r0, r1, n = parameters['r_curve']
+        analysis = RCurveAnalysis(lambda da: r0 + r1 * da ** n, lambda da: (r1 * n) * da ** (n - 1.0))
+        return analysis.find_geometry_instability(specimen, crack, youngs_modulus=parameters['youngs_modulus'])
+
+    a_c = _critical_length(parameters, coords, specimen)
+    c, m = parameters['c'], parameters['m']
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if parameters['geometry'] == 'cct':
+            damage = _geometry_growth_damage(specimen, m, c, crack, a_c)
+        else:
+            damage = _growth_damage(crack, a_c, c, m, coords['geometry_factor'])
+        cycles = damage / coords['stress_range'] ** m
+    return np.where(crack >= a_c, 0.0, cycles)
+
+def _cell_error(log_values, log_axes):
+    """
+    Relative error estimate of multilinear interpolation in every grid cell.
+
+    In 1-D the linear interpolation error is bounded by h^2 / 8 * max|f''|;
+    f'' is estimated from second differences at the nodes, and the bounds of
+    all axes are summed. Cells touching non-finite values get inf.
+    """
+    bound = np.zeros(tuple(n - 1 for n in log_values.shape))
+    for k, x in enumerate(log_axes):
+        h = np.diff(x)
+        moved = np.moveaxis(log_values, k, -1)
+        with np.errstate(invalid='ignore'):
+            slopes = np.diff(moved, axis=-1) / h
+            curvature = np.abs(2.0 * np.diff(slopes, axis=-1) / (h[1:] + h[:-1]))
+        # End nodes take the curvature of their neighbour
+        curvature = np.concatenate([curvature[..., :1], curvature, curvature[..., -1:]], axis=-1)
+        cell = np.fmax(curvature[..., 1:], curvature[..., :-1]) * (0.125 * h * h)
+        cell = np.moveaxis(cell, -1, k)
+        # Largest value over the corners of the cell along the other axes
+        for j in range(cell.ndim):
+            if j != k:
+                lower = np.take(cell, np.arange(cell.shape[j] - 1), axis=j)
+                upper = np.take(cell, np.arange(1, cell.shape[j]), axis=j)
+                cell = np.maximum(lower, upper)
+        bound += cell
+    with np.errstate(over='ignore'):
+        error = np.expm1(bound)
+    return np.where(np.isfinite(error), error, np.inf)
+
+def _save(path, array):
+    # Written next to the target and renamed, so readers never map a partial file
+    tmp_path = f"{path}.tmp.npy"
+    np.save(tmp_path, array)
+    os.replace(tmp_path, path)
+
+def build_design_surfaces(directory, material, c, m, crack_lengths, stress_ranges, geometry_values,
+                          geometry='constant', load_ratio=0.0, stress_unit=1.0, r_curve=None):
+    """
+    Precomputes the design surfaces of one material into a directory.
+
+    Every surface is stored as ln(value) on the grid of its axes, with the
+    relative interpolation error estimate of each cell next to it, plus a
+    manifest with the axes and the parameters needed to compute off-grid points.
+
+    Args:
+        directory (str): Output directory (created if needed).
+        material (Material): Material with K_IC (and E for the R-curve).
+        c (float): Paris Law coefficient C.
+        m (float): Paris Law exponent m.
+        crack_lengths (np.ndarray): Crack length axis (m), in the geometry's convention.
+        stress_ranges (np.ndarray): Stress range axis, in the units of C.
+        geometry_values (np.ndarray): Geometry factor Y ('constant') or plate width W ('cct') axis.
+        geometry (str): 'constant' or 'cct'.
+        load_ratio (float): R = sigma_min / sigma_max, for the peak stress.
+        stress_unit (float): Pa per stress range unit (1e6 for an MPa based C).
+        r_curve (tuple, optional): (r0, r1, exponent) of R = r0 + r1 * delta_a^exponent
+            in J/m^2. Without it the instability stress is the LEFM critical stress.
+
+    Returns:
+        DesignSurfaces: The surfaces, memory-mapped from the directory.
+    """
+    if material.k_ic is None:
+        raise ValueError(f"K_IC not defined for {material.name}")
+    names = surface_axes(geometry)
+    axes = {'crack_length': crack_lengths, 'stress_range': stress_ranges, _GEOMETRY_AXIS[geometry]: geometry_values}
+    for axis_name, values in axes.items():
+        values = np.asarray(values, dtype=float)
+        if values.ndim != 1 or values.size < 3 or np.any(values <= 0.0) or np.any(np.diff(values) <= 0.0):
+            raise ValueError(f"Axis '{axis_name}' needs at least 3 increasing positive values")
+        axes[axis_name] = values
+
+    parameters = {
+        'material': material.name, 'k_ic': float(material.k_ic), 'youngs_modulus': float(material.youngs_modulus),
+        'c': float(c), 'm': float(m), 'geometry': geometry, 'load_ratio': float(load_ratio),
+        'stress_unit': float(stress_unit), 'r_curve': None if r_curve is None else [float(v) for v in r_curve],
+    }
+
+    os.makedirs(directory, exist_ok=True)
+    for axis_name, values in axes.items():
+        _save(os.path.join(directory, f"axis_{axis_name}.npy"), values)
+    for name, axis_names in names.items():
+        grids = np.meshgrid(*(axes[a] for a in axis_names), indexing='ij')
+        values = np.broadcast_to(_compute(name, parameters, dict(zip(axis_names, grids))), grids[0].shape)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_values = np.log(values)
+        error = _cell_error(log_values, [np.log(axes[a]) for a in axis_names])
+        _save(os.path.join(directory, f"{name}.npy"), log_values)
+        _save(os.path.join(directory, f"{name}_error.npy"), error)
+
+    manifest = {'version': _VERSION, 'parameters': parameters, 'surfaces': {k: list(v) for k, v in names.items()}}
+    tmp_path = os.path.join(directory, f"{_MANIFEST}.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(directory, _MANIFEST))
+    return DesignSurfaces(directory)
+
+class _Surface:
+    """
+    One memory-mapped surface with flat views for scalar lookups.
+    """
+    __slots__ = ('axes', 'log_axes', 'log_values', 'error', 'values_flat', 'error_flat', 'strides', 'cell_strides')
+
+    def __init__(self, directory, name, axes, log_axes):
+        self.axes = axes
+        self.log_axes = log_axes
+        self.log_values = np.load(os.path.join(directory, f"{name}.npy"), mmap_mode='r')
+        self.error = np.load(os.path.join(directory, f"{name}_error.npy"), mmap_mode='r')
+        # Element access through a memoryview avoids creating NumPy scalars
+        self.values_flat = memoryview(self.log_values).cast('B').cast('d')
+        self.error_flat = memoryview(self.error).cast('B').cast('d')
+        self.strides = [s // 8 for s in self.log_values.strides]
+        self.cell_strides = [s // 8 for s in self.error.strides]
+
+class DesignSurfaces:
+    """
+    Memory-mapped design surfaces written by build_design_surfaces.
+
+    The surface files are opened with np.load(mmap_mode='r'), so they are
+    read from the OS page cache on demand and shared between processes. A
+    lookup interpolates ln(value) multilinearly in the logarithms of the
+    coordinates, which is exact for power laws. Points off the grid, or in
+    cells whose error estimate exceeds the tolerance, are computed directly.
+    """
+    def __init__(self, directory):
+        """
+        Args:
+            directory (str): Directory written by build_design_surfaces.
+        """
+        with open(os.path.join(directory, _MANIFEST)) as f:
+            manifest = json.load(f)
+        if manifest.get('version') != _VERSION:
+            raise ValueError(f"Unsupported design surface version {manifest.get('version')}")
+        self.directory = directory
+        self.parameters = manifest['parameters']
+        self.axes = {}
+        self._surfaces = {}
+        for name, axis_names in manifest['surfaces'].items():
+            for axis_name in axis_names:
+                if axis_name not in self.axes:
+                    self.axes[axis_name] = np.load(os.path.join(directory, f"axis_{axis_name}.npy"))
+            log_axes = [np.log(self.axes[a]).tolist() for a in axis_names]
+            self._surfaces[name] = _Surface(directory, name, tuple(axis_names), log_axes)
+
+    @property
+    def names(self):
+        return tuple(self._surfaces)
+
+    def _surface(self, name):
+        try:
+            return self._surfaces[name]
+        except KeyError:
+            raise ValueError(f"Unknown surface '{name}'. Use one of {', '.join(self._surfaces)}.") from None
+
+    def surface_axes(self, name):
+        """
+        Axis names of a surface, in the order of the lookup coordinates.
+        """
+        return self._surface(name).axes
+
+    def compute(self, name, *coords):
+        """
+        Evaluates a surface directly, without the grid.
+
+        Args:
+            name (str): Surface name.
+            *coords (float or np.ndarray): One coordinate per surface axis.
+
+        Returns:
+            np.ndarray: Values.
+        """
+        surface = self._surface(name)
+        coords = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in coords))
+        return _compute(name, self.parameters, dict(zip(surface.axes, coords)))
+
+    def interpolate(self, name, *coords):
+        """
+        Interpolates a surface at arbitrary points.
+
+        Args:
+            name (str): Surface name.
+            *coords (float or np.ndarray): One coordinate per surface axis.
+
+        Returns:
+            tuple: (values, relative error estimate), inf error off the grid.
+        """
+        surface = self._surface(name)
+        if len(coords) != len(surface.axes):
+            raise ValueError(f"'{name}' takes the coordinates {', '.join(surface.axes)}")
+        with np.errstate(divide='ignore', invalid='ignore'):
+            logs = np.broadcast_arrays(*(np.log(np.asarray(v, dtype=float)) for v in coords))
+
+        cells, fractions = [], []
+        inside = np.ones(logs[0].shape, dtype=bool)
+        for x, axis in zip(logs, surface.log_axes):
+            axis = np.asarray(axis)
+            i = np.clip(np.searchsorted(axis, x, side='right') - 1, 0, axis.size - 2)
+            cells.append(i)
+            fractions.append((x - axis[i]) / (axis[i + 1] - axis[i]))
+            inside &= (x >= axis[0]) & (x <= axis[-1])
+
+        log_value = 0.0
+        # Zero remaining life is stored as ln 0 = -inf; corners without weight must not turn it into NaN
+        with np.errstate(invalid='ignore'):
+            for corner in itertools.product((0, 1), repeat=len(cells)):
+                weight = 1.0
+                for b, t in zip(corner, fractions):
+                    weight = weight * (t if b else 1.0 - t)
+                corner_value = surface.log_values[tuple(i + b for i, b in zip(cells, corner))]
+                log_value = log_value + np.where(weight != 0.0, weight * corner_value, 0.0)
+        error = np.where(inside, surface.error[tuple(cells)], np.inf)
+        return np.exp(log_value), error
+
+    def _lookup_scalar(self, name, surface, coords, tolerance):
+        offset = 0
+        cell = 0
+        weights = [(0, 1.0)]
+        for x, axis, stride, cell_stride in zip(coords, surface.log_axes, surface.strides, surface.cell_strides):
+            if not x > 0.0:
+                return float(self.compute(name, *coords)), 0.0
+            x = math.log(x)
+            if not axis[0] <= x <= axis[-1]:
+                return float(self.compute(name, *coords)), 0.0
+            i = min(bisect.bisect_right(axis, x) - 1, len(axis) - 2)
+            t = (x - axis[i]) / (axis[i + 1] - axis[i])
+            offset += i * stride
+            cell += i * cell_stride
+            weights = [(o + b * stride, w * (t if b else 1.0 - t)) for o, w in weights for b in (0, 1)]
+
+        error = surface.error_flat[cell]
+        if error > tolerance:
+            return float(self.compute(name, *coords)), 0.0
+        values = surface.values_flat
+        return math.exp(sum(w * values[offset + o] for o, w in weights if w != 0.0)), error
+
+    def lookup(self, name, *coords, tolerance=_DEFAULT_TOLERANCE):
+        """
+        Surface values, interpolated where the grid is accurate enough and
+        computed directly elsewhere.
+
+        Scalar coordinates take a pure Python path (bisect and a flat view of
+        the mapped file), which keeps warm lookups in the microsecond range.
+
+        Args:
+            name (str): Surface name, see surface_axes.
+            *coords (float or np.ndarray): One coordinate per surface axis.
+            tolerance (float): Largest accepted relative error estimate.
+
+        Returns:
+            tuple: (values, relative error estimate); the error is 0 for
+            directly computed points.
+        """
+        surface = self._surface(name)
+        if len(coords) != len(surface.axes):
+            raise ValueError(f"'{name}' takes the coordinates {', '.join(surface.axes)}")
+        if all(isinstance(v, (int, float)) or np.ndim(v) == 0 for v in coords):
+            return self._lookup_scalar(name, surface, [float(v) for v in coords], tolerance)
+
+        values, error = self.interpolate(name, *coords)
+        direct = ~(error <= tolerance)
+        if direct.any():
+            coords = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in coords))
+            values = np.array(values)
+            values[direct] = self.compute(name, *(v[direct] for v in coords))
+            error = np.where(direct, 0.0, error)
+        return values, error
+
+def _axis(spec):
+    low, high, n = spec
+    return np.geomspace(float(low), float(high), int(n))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m griffith.design_surfaces',
+        description='Precompute life, critical crack size and instability stress surfaces for a material.'
+    )
+    parser.add_argument('directory', help='Output directory')
+    parser.add_argument('--material', choices=sorted(MATERIALS), default='steel')
+    parser.add_argument('--k-ic', type=float, help='Override the material K_IC (Pa*sqrt(m))')
+    parser.add_argument('--c', type=float, required=True, help='Paris Law coefficient C')
+    parser.add_argument('--m', type=float, required=True, help='Paris Law exponent m')
+    parser.add_argument('--geometry', choices=GEOMETRIES, default='constant')
+    parser.add_argument('--crack-lengths', nargs=3, default=(1e-4, 0.05, 64), metavar=('MIN', 'MAX', 'N'))
+    parser.add_argument('--stress-ranges', nargs=3, default=(10.0, 500.0, 64), metavar=('MIN', 'MAX', 'N'))
+    parser.add_argument('--geometry-values', nargs=3, default=(0.8, 2.0, 16), metavar=('MIN', 'MAX', 'N'),
+                        help='Geometry factor Y, or plate width W for the CCT')
+    parser.add_argument('--load-ratio', type=float, default=0.0)
+    parser.add_argument('--stress-unit', type=float, default=1.0, help='Pa per stress range unit')
+    parser.add_argument('--r-curve', nargs=3, type=float, metavar=('R0', 'R1', 'EXPONENT'),
+                        help='Power-law R-curve R = R0 + R1 * delta_a^EXPONENT (J/m^2)')
+    args = parser.parse_args(argv)
+
+    material = MATERIALS[args.material]() if args.k_ic is None else MATERIALS[args.material](K_IC=args.k_ic)
+    surfaces = build_design_surfaces(
+        args.directory, material, args.c, args.m, _axis(args.crack_lengths), _axis(args.stress_ranges),
+        _axis(args.geometry_values), geometry=args.geometry, load_ratio=args.load_ratio,
+        stress_unit=args.stress_unit, r_curve=args.r_curve
+    )
+    for name in surfaces.names:
+        error = np.asarray(surfaces._surface(name).error)
+        finite = error[np.isfinite(error)]
+        worst = f"{finite.max():.2e}" if finite.size else "n/a"
+        print(f"{name}: shape {surfaces._surface(name).log_values.shape}, largest cell error estimate {worst}")
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,160 @@
+import numpy as np
+import math
+from griffith.epfm import j_integral
+from griffith.geometry import CenterCrackedPlate, SingleEdgeNotchBend
+
+_INV_PI = 1.0 / math.pi
+
+# Normalised crack length and hardening exponent grids of the EPRI tables
+_A_OVER_W = np.array([0.125, 0.25, 0.375, 0.5, 0.625, 0.75, 1.0])
+_HARDENING_N = np.array([1.0, 2.0, 3.0, 5.0, 7.0, 10.0, 13.0, 16.0, 20.0])
+
+# Kumar, German & Shih (1981), EPRI NP-1931.
+# Center cracked panel in tension, plane stress; a/W with W the half width.
+_CCT_PLANE_STRESS_H1 = np.array([
+    [2.80, 3.61, 4.06, 4.35, 4.33, 4.02, 3.56, 3.06, 2.46],
+    [2.54, 3.01, 3.00, 2.86, 2.56, 2.11, 1.71, 1.34, 0.957],
+    [2.34, 2.62, 2.54, 2.34, 2.06, 1.69, 1.37, 1.10, 0.823],
+    [2.21, 2.29, 2.08, 1.80, 1.55, 1.22, 0.952, 0.737, 0.540],
+    [2.12, 1.96, 1.73, 1.38, 1.15, 0.876, 0.673, 0.510, 0.365],
+    [2.07, 1.73, 1.43, 1.06, 0.818, 0.585, 0.430, 0.316, 0.215],
+    [2.03, 1.64, 1.33, 0.990, 0.779, 0.563, 0.421, 0.318, 0.220],
+])
+
+# Single edge notched bend (S/W = 4), plane strain.
+_SENB_PLANE_STRAIN_H1 = np.array([
+    [0.937, 0.869, 0.805, 0.687, 0.580, 0.437, 0.329, 0.245, 0.165],
+    [1.20, 1.034, 0.930, 0.762, 0.633, 0.483, 0.396, 0.303, 0.215],
+    [1.33, 1.15, 1.02, 0.835, 0.695, 0.544, 0.421, 0.323, 0.232],
+    [1.41, 1.23, 1.09, 0.889, 0.740, 0.577, 0.449, 0.345, 0.249],
+    [1.46, 1.27, 1.13, 0.918, 0.763, 0.593, 0.459, 0.354, 0.253],
+    [1.48, 1.29, 1.14, 0.926, 0.768, 0.598, 0.463, 0.357, 0.254],
+    [1.50, 1.30, 1.15, 0.938, 0.779, 0.605, 0.469, 0.362, 0.258],
+])
+
+# Plane strain limit load of the SENB specimen: P0 = 1.456 * B * b^2 * sigma_0 / S
+_SENB_LIMIT_LOAD_FACTOR = 1.456
+
+class HFunctionTable:
+    """
+    Tabulated EPRI h-function over (a/W, n), interpolated bilinearly.
+
+    The table is held as a single contiguous array; lookups for any number of
+    (a/W, n) pairs are one vectorized gather. Values outside the grid are
+    clamped to its edges.
+    """
+    def __init__(self, a_over_w, hardening_n, values):
+        """
+        Args:
+            a_over_w (np.ndarray): Sorted normalised crack lengths.
+            hardening_n (np.ndarray): Sorted Ramberg-Osgood hardening exponents.
+            values (np.ndarray): h values, shape (len(a_over_w), len(hardening_n)).
+        """
+        self.a_over_w = np.asarray(a_over_w, dtype=float)
+        self.hardening_n = np.asarray(hardening_n, dtype=float)
+        self.values = np.ascontiguousarray(values, dtype=float)
+        if self.values.shape != (self.a_over_w.size, self.hardening_n.size):
+            raise ValueError("values must have shape (len(a_over_w), len(hardening_n))")
+
+    @staticmethod
+    def _locate(grid, x):
+        x = np.clip(x, grid[0], grid[-1])
+        i = np.clip(np.searchsorted(grid, x, side='right') - 1, 0, grid.size - 2)
+        t = (x - grid[i]) / (grid[i + 1] - grid[i])
+        return i, t
+
+    def __call__(self, a_over_w, hardening_n):
+        """
+        Interpolates h at the given normalised crack lengths and hardening exponents.
+
+        Args:
+            a_over_w (float or np.ndarray): a/W.
+            hardening_n (float or np.ndarray): n.
+
+        Returns:
+            np.ndarray: h, broadcast to the shape of the inputs.
+        """
+        i, u = self._locate(self.a_over_w, np.asarray(a_over_w, dtype=float))
+        j, v = self._locate(self.hardening_n, np.asarray(hardening_n, dtype=float))
+        h = self.values
+        return ((1.0 - u) * ((1.0 - v) * h[i, j] + v * h[i, j + 1])
+                + u * ((1.0 - v) * h[i + 1, j] + v * h[i + 1, j + 1]))
+
+CCT_PLANE_STRESS_H1 = HFunctionTable(_A_OVER_W, _HARDENING_N, _CCT_PLANE_STRESS_H1)
+SENB_PLANE_STRAIN_H1 = HFunctionTable(_A_OVER_W, _HARDENING_N, _SENB_PLANE_STRAIN_H1)
+
+def _ramberg_osgood(material):
+    if material.ramberg_osgood_alpha is None or material.hardening_exponent is None:
+        raise ValueError(f"Ramberg-Osgood parameters not defined for {material.name}")
+    return material.ramberg_osgood_alpha, material.hardening_exponent, material.reference_stress
+
+def estimate_j(geometry, material, load, crack_length=None, plastic_zone_correction=True):
+    """
+    EPRI/GE elastic-plastic J estimate for CCT (plane stress) and SENB (plane strain).
+
+    J = J_el(a_eff) + J_pl
+
+    J_pl = alpha * sigma_0 * eps_0 * L * h1(a/W, n) * (P / P0)^(n + 1)
+
+    CCT:  L = c * a / b,  P / P0 = b * sigma / (c * sigma_0)   (b half width, c = b - a)
+    SENB: L = b,          P0 = 1.456 * B * b^2 * sigma_0 / S   (b = W - a)
+
+    The elastic part uses the plastic-zone corrected crack length
+    a_eff = a + phi * r_y with
+    r_y = (1 / (beta * pi)) * ((n - 1) / (n + 1)) * (K_I(a) / sigma_0)^2,
+    phi = 1 / (1 + (P / P0)^2), beta = 2 (plane stress) or 6 (plane strain).
+
+    load and crack_length broadcast against each other, so a full J-load curve
+    for many flaws is one call, e.g. load[:, None] with crack_length[None, :].
+
+    Args:
+        geometry (CenterCrackedPlate or SingleEdgeNotchBend): Specimen geometry.
+        material (Material): Material with Ramberg-Osgood parameters.
+        load (float or np.ndarray): Remote stress (CCT, Pa) or load P (SENB, N).
+        crack_length (float or np.ndarray, optional): Crack length in the
+            geometry's convention. Defaults to geometry.crack_length.
+        plastic_zone_correction (bool): Apply the effective crack length correction to J_el.
+
+    Returns:
+        tuple: (j_total, j_elastic, j_plastic) in J/m^2.
+    """
+    alpha, n, sigma_0 = _ramberg_osgood(material)
+    eps_0 = sigma_0 / material.youngs_modulus
+
+    if crack_length is None:
+        crack_length = geometry.crack_length
+    load = np.asarray(load, dtype=float)
+    crack_length = np.asarray(crack_length, dtype=float)
+
+    if isinstance(geometry, CenterCrackedPlate):
+        table = CCT_PLANE_STRESS_H1
+        plane_stress = True
+        beta = 2.0
+        half_width = 0.5 * geometry.width
+        a_over_w = crack_length / geometry.width
+        ligament = half_width - 0.5 * crack_length
+        limit_load = sigma_0 * ligament / half_width
+        length_scale = ligament * a_over_w
+    elif isinstance(geometry, SingleEdgeNotchBend):
+        table = SENB_PLANE_STRAIN_H1
+        plane_stress = False
+        beta = 6.0
+        a_over_w = crack_length / geometry.width
+        ligament = geometry.width - crack_length
+        limit_load = (_SENB_LIMIT_LOAD_FACTOR * sigma_0 / geometry.span) * geometry.thickness * ligament * ligament
+        length_scale = ligament
+    else:
+        raise TypeError(f"EPRI J estimation is not available for {type(geometry).__name__}")
+
+    load_ratio = load / limit_load
+    j_plastic = (alpha * sigma_0 * eps_0) * length_scale * table(a_over_w, n) * load_ratio ** (n + 1.0)
+
+    k1 = load * geometry.unit_k1(crack_length)
+    if plastic_zone_correction:
+        ratio = k1 / sigma_0
+        r_y = (_INV_PI / beta) * ((n - 1.0) / (n + 1.0)) * (ratio * ratio)
+        phi = 1.0 / (1.0 + load_ratio * load_ratio)
+        k1 = load * geometry.unit_k1(crack_length + geometry.crack_tips * phi * r_y)
+
+    j_elastic = j_integral(k1, material.youngs_modulus, material.poisson_ratio, plane_stress)
+    return j_elastic + j_plastic, j_elastic, j_plastic
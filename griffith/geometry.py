@@ -2,6 +2,7 @@ import numpy as np
 import math
 from functools import lru_cache
 from griffith.lefm import StressIntensityFactor
+from griffith.precision import get_precision
 
 _HALF_PI = math.pi * 0.5
 
@@ -16,6 +17,8 @@ class CenterCrackedPlate(StressIntensityFactor):
     """
     Center Cracked Plate (CCT) geometry.
     """
+    crack_tips = 2
+
     def __init__(self, width, crack_length):
         """
         Args:
@@ -36,7 +39,7 @@ class CenterCrackedPlate(StressIntensityFactor):
         alpha = a / (W/2) = 2a / W
         Y = sqrt(sec(pi * a / W)) (Approximation)
         """
-        if np.isscalar(crack_length_2a):
+        if np.isscalar(crack_length_2a) and np.isscalar(self._half_pi_inv_w):
             return _calculate_cct_y_scalar(crack_length_2a, self._half_pi_inv_w)
 
         # Tada, Paris, Irwin formula for finite width correction
@@ -44,6 +47,57 @@ class CenterCrackedPlate(StressIntensityFactor):
         # ⚡ Bolt Optimization: Combine division by width and multiplication by pi/2 into a precomputed instance-level inverse constant
         return np.sqrt(1.0 / np.cos(crack_length_2a * self._half_pi_inv_w))
 
+    def _calculate_geometry_factor_derivative(self, crack_length_2a):
+        """
+        Calculates dY/d(2a) for CCT.
+
+        dY/d(2a) = 0.5 * Y * (pi / 2W) * tan(pi * a / W)
+        """
+        theta = crack_length_2a * self._half_pi_inv_w
+        y = np.sqrt(1.0 / np.cos(theta))
+        return (0.5 * self._half_pi_inv_w) * y * np.tan(theta)
+
+    @property
+    def max_crack_length(self):
+        """
+        Total crack length 2a at which the secant correction diverges (2a = W).
+        """
+        return self.width
+
+    def unit_k1(self, crack_length):
+        """
+        K_I per unit remote stress, g(2a) = Y(2a) * sqrt(pi * a).
+
+        Args:
+            crack_length (float or np.ndarray): Total crack length 2a (m).
+
+        Returns:
+            np.ndarray: g (sqrt(m)).
+        """
+        dtype = get_precision().dtype
+        crack_length = np.asarray(crack_length, dtype=dtype)
+        y = np.sqrt(1.0 / np.cos(crack_length * np.asarray(self._half_pi_inv_w, dtype=dtype)))
+        return y * np.sqrt(_HALF_PI * crack_length)
+
+    def unit_k1_derivative(self, crack_length):
+        """
+        Derivative of the K_I per unit stress with respect to the total crack length 2a.
+
+        dg/d(2a) = g * (0.5 * (pi / 2W) * tan(pi * a / W) + 1 / (2 * 2a))
+
+        Args:
+            crack_length (float or np.ndarray): Total crack length 2a (m).
+
+        Returns:
+            np.ndarray: dg/d(2a) (1/sqrt(m)).
+        """
+        dtype = get_precision().dtype
+        crack_length = np.asarray(crack_length, dtype=dtype)
+        half_pi_inv_w = np.asarray(self._half_pi_inv_w, dtype=dtype)
+        theta = crack_length * half_pi_inv_w
+        g = np.sqrt(_HALF_PI * crack_length / np.cos(theta))
+        return g * ((0.5 * half_pi_inv_w) * np.tan(theta) + 0.5 / crack_length)
+
     def calculate_k1(self, stress, crack_length=None):
         """
         Calculates K_I for CCT.
@@ -99,7 +153,10 @@ class SingleEdgeNotchBend(StressIntensityFactor):
         # ⚡ Bolt Optimization: Precalculate the constant geometry factor
         # span / (thickness * width ** 1.5)
         # Replacing ** 1.5 with multiplication and math.sqrt for speed
-        self._geom_const = span / (thickness * width * math.sqrt(width))
+        if np.isscalar(width):
+            self._geom_const = span / (thickness * width * math.sqrt(width))
+        else:
+            self._geom_const = span / (thickness * width * np.sqrt(width))
         # Initial Y calculation
         super().__init__(self._calculate_f(crack_length))
 
@@ -112,7 +169,7 @@ class SingleEdgeNotchBend(StressIntensityFactor):
         one_minus_alpha = 1.0 - alpha
         # Standard ASTM E399 formula
 
-        if np.isscalar(a):
+        if np.isscalar(a) and np.isscalar(self._inv_width):
             # Optimization: Replace ** 1.5 with multiplication and sqrt, and ** 2 with multiplication
             # ⚡ Bolt Optimization: Use Horner's method for polynomial evaluation
             # ⚡ Bolt Optimization: Group scalar operations (3/2 = 1.5) before multiplication to avoid chained operations
@@ -133,6 +190,55 @@ class SingleEdgeNotchBend(StressIntensityFactor):
         sqrt_ratio = np.sqrt(alpha / one_minus_alpha)
         return (sqrt_ratio * poly) / ((1 + 2 * alpha) * one_minus_alpha)
 
+    def _calculate_f_derivative(self, a):
+        """
+        Calculates df/d(a/W) for SENB (array path only).
+
+        Uses the logarithmic derivative of the ASTM E399 expression:
+        f'/f = 0.5/alpha + 1.5/(1 - alpha) + p'/p - 2/(1 + 2*alpha)
+        """
+        alpha = a * self._inv_width
+        one_minus_alpha = 1.0 - alpha
+        r = alpha * (3.225 + alpha * (-5.895 + 4.05 * alpha))
+        dr = 3.225 + alpha * (-11.79 + 12.15 * alpha)
+        poly = 2.985 - one_minus_alpha * r
+        dpoly = r - one_minus_alpha * dr
+        f_val = (np.sqrt(alpha / one_minus_alpha) * poly) / ((1 + 2 * alpha) * one_minus_alpha)
+        log_deriv = 0.5 / alpha + 1.5 / one_minus_alpha + dpoly / poly - 2.0 / (1 + 2 * alpha)
+        return f_val * log_deriv
+
+    @property
+    def max_crack_length(self):
+        """
+        Crack length at which the ligament vanishes (a = W).
+        """
+        return self.width
+
+    def unit_k1(self, crack_length):
+        """
+        K_I per unit load P, g(a) = S / (B * W^1.5) * f(a/W).
+
+        Args:
+            crack_length (float or np.ndarray): Crack length a (m).
+
+        Returns:
+            np.ndarray: g (1/m^1.5).
+        """
+        return self._geom_const * self._calculate_f(np.asarray(crack_length, dtype=get_precision().dtype))
+
+    def unit_k1_derivative(self, crack_length):
+        """
+        Derivative of the K_I per unit load with respect to the crack length a.
+
+        Args:
+            crack_length (float or np.ndarray): Crack length a (m).
+
+        Returns:
+            np.ndarray: dg/da (1/m^2.5).
+        """
+        crack_length = np.asarray(crack_length, dtype=get_precision().dtype)
+        return (self._geom_const * self._inv_width) * self._calculate_f_derivative(crack_length)
+
     def calculate_k1_from_load(self, load, crack_length=None):
         """
         Calculates K_I based on Load P.
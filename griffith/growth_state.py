@@ -0,0 +1,153 @@
+import os
+import struct
+import numpy as np
+from griffith.fatigue import _advance_crack, _growth_damage
+
+_MAGIC = b'GRFS'
+_VERSION = 1
+_HEADER = struct.Struct('<4sBQ')
+_FIELDS = ('crack_length', 'cycles', 'c', 'm', 'geometry_factor', 'critical_length')
+
+class CrackGrowthState:
+    """
+    Incremental Paris law growth state for a fleet of cracks.
+
+    Each crack carries its current length, accumulated cycles and its own
+    Paris law (C, m), geometry factor and critical length, stored as flat
+    float64 arrays. advance() integrates only the newly applied load blocks in
+    closed form, so a daily update costs O(new blocks x cracks) regardless of
+    the service history. The state round-trips through a compact binary
+    checkpoint (fixed header plus one contiguous float64 block).
+    """
+    __slots__ = _FIELDS
+
+    def __init__(self, crack_length, c, m, geometry_factor=1.0, critical_length=np.inf, cycles=0.0):
+        """
+        Args:
+            crack_length (float or np.ndarray): Current crack lengths (m).
+            c (float or np.ndarray): Paris Law coefficient C per crack.
+            m (float or np.ndarray): Paris Law exponent m per crack.
+            geometry_factor (float or np.ndarray): Geometry factor Y per crack.
+            critical_length (float or np.ndarray): Crack length at failure (m).
+            cycles (float or np.ndarray): Cycles accumulated so far.
+        """
+        arrays = np.broadcast_arrays(
+            *(np.asarray(v, dtype=float) for v in (crack_length, cycles, c, m, geometry_factor, critical_length))
+        )
+        for name, arr in zip(_FIELDS, arrays):
+            setattr(self, name, np.array(arr, dtype=np.float64).ravel())
+
+    def __len__(self):
+        return self.crack_length.size
+
+    @property
+    def failed(self):
+        """
+        Mask of cracks that have reached their critical length.
+        """
+        return self.crack_length >= self.critical_length
+
+    def advance(self, stress_range, cycles=1.0):
+        """
+        Advances every crack through a new load block.
+
+        A block is a histogram of stress ranges: with constant Y, the Paris law
+        only depends on Sum_i N_i * Delta_sigma_i^m, so all bins are collapsed
+        before the closed-form update. A crack reaching its critical length
+        within the block stops there, and is credited with the cycles needed
+        to get there (damage spread evenly over the block's cycles). Failed
+        cracks are not advanced further.
+
+        Arrays follow NumPy broadcasting against (n_bins, n_cracks): a 1-D
+        array holds one value per crack, and a histogram shared by all cracks
+        is passed as a column of shape (n_bins, 1).
+
+        Args:
+            stress_range (float or np.ndarray): Delta Sigma per bin.
+            cycles (float or np.ndarray): Cycles per bin.
+
+        Returns:
+            CrackGrowthState: self, for chaining.
+        """
+        stress_range = np.asarray(stress_range, dtype=float)
+        cycles = np.asarray(cycles, dtype=float)
+
+        damage = cycles * stress_range ** self.m
+        block_cycles = np.broadcast_to(cycles, damage.shape)
+        if damage.ndim == 2:
+            damage = damage.sum(axis=0)
+            block_cycles = block_cycles.sum(axis=0)
+
+        active = ~self.failed
+        grown = _advance_crack(self.crack_length, self.c, self.m, self.geometry_factor, damage)
+        failing = active & (grown >= self.critical_length)
+        if failing.any():
+            with np.errstate(divide='ignore', invalid='ignore'):
+                to_failure = (_growth_damage(self.crack_length, self.critical_length, self.c, self.m,
+                                             self.geometry_factor) / (damage / block_cycles))
+            block_cycles = np.where(failing, np.minimum(to_failure, block_cycles), block_cycles)
+            grown = np.minimum(grown, self.critical_length)
+        self.crack_length = np.where(active, grown, self.crack_length)
+        self.cycles = np.where(active, self.cycles + block_cycles, self.cycles)
+        return self
+
+    def to_bytes(self):
+        """
+        Serializes the state to a compact binary checkpoint.
+
+        Returns:
+            bytes: Header (magic, version, count) followed by the float64 fields.
+        """
+        block = np.stack([getattr(self, name) for name in _FIELDS])
+        return _HEADER.pack(_MAGIC, _VERSION, len(self)) + block.astype('<f8', copy=False).tobytes()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Restores a state from to_bytes() output.
+
+        Args:
+            data (bytes): Checkpoint bytes.
+
+        Returns:
+            CrackGrowthState: The restored state.
+        """
+        magic, version, count = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError("Not a crack growth checkpoint")
+        if version != _VERSION:
+            raise ValueError(f"Unsupported checkpoint version {version}")
+
+        block = np.frombuffer(data, dtype='<f8', count=len(_FIELDS) * count, offset=_HEADER.size)
+        block = block.reshape(len(_FIELDS), count)
+
+        state = cls.__new__(cls)
+        for name, row in zip(_FIELDS, block):
+            setattr(state, name, row.astype(np.float64))
+        return state
+
+    def save(self, path):
+        """
+        Writes a checkpoint atomically (temporary file, then rename).
+
+        Args:
+            path (str): Checkpoint file path.
+        """
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(self.to_bytes())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reads a checkpoint written by save().
+
+        Args:
+            path (str): Checkpoint file path.
+
+        Returns:
+            CrackGrowthState: The restored state.
+        """
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
@@ -0,0 +1,341 @@
+import numpy as np
+import math
+from griffith.fatigue import _advance_crack, _growth_damage
+
+# Target number of (component, flaw, interval) entries evaluated per block
+_BLOCK_ELEMENTS = 1 << 21
+# Earlier inspections are dropped once they can change ln(PoF) by less than this
+_LOG_MISS_CUTOFF = 1e-12
+
+class ProbabilityOfDetection:
+    """
+    Probability of detection (POD) curve of an inspection method.
+
+    Log-logistic (logit) or log-normal (probit) model in the crack size:
+    POD(a) = F((ln a - mu) / sigma)
+    """
+    def __init__(self, mu, sigma, model='logit'):
+        """
+        Args:
+            mu (float): Location, ln of the crack size detected with 50% probability.
+            sigma (float): Scale of ln(a).
+            model (str): 'logit' (log-logistic) or 'probit' (log-normal).
+        """
+        if model not in ('logit', 'probit'):
+            raise ValueError(f"Unknown POD model '{model}'. Use 'logit' or 'probit'.")
+        self.mu = mu
+        self.sigma = sigma
+        self.model = model
+
+    @classmethod
+    def from_a50_a90(cls, a50, a90, model='logit'):
+        """
+        Builds a POD curve from the crack sizes detected with 50% and 90% probability.
+
+        Args:
+            a50 (float): Crack size with POD = 0.5 (m).
+            a90 (float): Crack size with POD = 0.9 (m).
+            model (str): 'logit' or 'probit'.
+        """
+        # Standardised quantile of 0.9 for each model
+        z90 = math.log(9.0) if model == 'logit' else 1.2815515655446004
+        return cls(math.log(a50), math.log(a90 / a50) / z90, model)
+
+    def __call__(self, crack_length):
+        """
+        Evaluates POD(a).
+
+        Args:
+            crack_length (float or np.ndarray): Crack size a (m).
+
+        Returns:
+            np.ndarray: Detection probability.
+        """
+        with np.errstate(divide='ignore'):
+            z = (np.log(crack_length) - self.mu) / self.sigma
+        if self.model == 'logit':
+            return 1.0 / (1.0 + np.exp(-z))
+
+        from scipy.special import ndtr
+        return ndtr(z)
+
+    def log_miss(self, log_crack_length):
+        """
+        ln(1 - POD) evaluated from ln(a), accurate where POD is close to 1.
+
+        Args:
+            log_crack_length (np.ndarray): ln of the crack size.
+
+        Returns:
+            np.ndarray: Log probability of missing the crack.
+        """
+        z = (log_crack_length - self.mu) / self.sigma
+        if self.model == 'logit':
+            return -np.logaddexp(0.0, z)
+
+        from scipy.special import log_ndtr
+        return log_ndtr(-z)
+
+def inspection_log_likelihood(crack_length, pod, detected, measured_size=None, sizing_sd=0.0, sizing_bias=0.0):
+    """
+    Log-likelihood of an inspection outcome for true crack sizes.
+
+    No detection:           L = 1 - POD(a)
+    Detection, unsized:     L = POD(a)
+    Detection, sized:       L = POD(a) * N(measured | a + bias, sd)
+
+    Args:
+        crack_length (np.ndarray): True crack sizes a (m).
+        pod (ProbabilityOfDetection): POD curve.
+        detected (bool): Whether the inspection found a crack.
+        measured_size (float, optional): Reported crack size (m).
+        sizing_sd (float): Standard deviation of the sizing error (m).
+        sizing_bias (float): Mean sizing error (m).
+
+    Returns:
+        np.ndarray: ln L for every crack size.
+    """
+    p = np.clip(pod(crack_length), 1e-300, 1.0 - 1e-16)
+    if not detected:
+        return np.log1p(-p)
+
+    log_l = np.log(p)
+    if measured_size is not None and sizing_sd > 0.0:
+        with np.errstate(invalid='ignore'):
+            residual = (measured_size - crack_length - sizing_bias) / sizing_sd
+        # Unbounded (run-away) cracks cannot explain a finite measurement
+        residual = np.where(np.isnan(residual), np.inf, residual)
+        log_l = log_l - 0.5 * residual * residual - math.log(sizing_sd * math.sqrt(2.0 * math.pi))
+    return log_l
+
+def lognormal_flaw_quantiles(median, log_sd, n_quantiles=9):
+    """
+    Equal-probability representative flaw sizes of a log-normal distribution.
+
+    Each of the n_quantiles strata of probability 1 / n_quantiles is
+    represented by its mid-probability quantile.
+
+    Args:
+        median (float or np.ndarray): Median initial flaw size per component (m).
+        log_sd (float or np.ndarray): Standard deviation of ln(a) per component.
+        n_quantiles (int): Number of representative flaws.
+
+    Returns:
+        np.ndarray: Flaw sizes, shape (..., n_quantiles).
+    """
+    from scipy.special import ndtri
+    z = ndtri((np.arange(n_quantiles) + 0.5) / n_quantiles)
+    median = np.asarray(median, dtype=float)[..., np.newaxis]
+    log_sd = np.asarray(log_sd, dtype=float)[..., np.newaxis]
+    return median * np.exp(log_sd * z)
+
+class InspectionPlanner:
+    """
+    POD-driven inspection interval planning for a fleet of components.
+
+    Each component carries its own Paris law, stress range, geometry factor
+    and critical crack size. For a candidate interval T, inspections take
+    place at T, 2T, ... within the design life; a crack found by any of them
+    is repaired. An initial flaw a_0 leads to failure if it reaches a_crit
+    within the design life (at N_f) and every inspection before N_f misses it:
+
+    PoF(a_0, T) = Product_{k T < N_f} (1 - POD(a(k T)))
+
+    The component PoF is the weighted sum over representative initial flaws.
+    The crack size at each inspection follows from the closed-form Paris law,
+    so all (component, flaw, interval) entries are advanced together, one
+    inspection per pass, starting from the last inspection before failure.
+    Entries drop out of the working set once their earlier inspections can no
+    longer change the result.
+    """
+    def __init__(self, pod, c, m, stress_range, critical_length, geometry_factor=1.0):
+        """
+        Args:
+            pod (ProbabilityOfDetection): POD curve of the inspection method.
+            c (float or np.ndarray): Paris Law coefficient C per component.
+            m (float or np.ndarray): Paris Law exponent m per component.
+            stress_range (float or np.ndarray): Constant amplitude Delta Sigma per component.
+            critical_length (float or np.ndarray): Critical crack size per component (m).
+            geometry_factor (float or np.ndarray): Geometry factor Y per component.
+        """
+        self.pod = pod
+        self.c, self.m, self.stress_range, self.critical_length, self.geometry_factor = (
+            np.atleast_1d(np.asarray(v, dtype=float)) for v in (c, m, stress_range, critical_length, geometry_factor)
+        )
+
+    def _log_survival(self, a_0, c, m, stress_range, critical_length, geometry_factor, life, interval):
+        """
+        ln PoF of every (component, flaw, interval) entry; -inf where the flaw
+        does not fail within the design life. Arguments broadcast together.
+        """
+        rate = stress_range ** m
+        n_fail = _growth_damage(a_0, critical_length, c, m, geometry_factor) / rate
+        n_fail = np.where(a_0 >= critical_length, 0.0, n_fail)
+        fails = n_fail <= life
+
+        # Number of inspections strictly before failure
+        last = np.where(fails, np.ceil(n_fail / interval) - 1.0, 0.0)
+        shape = last.shape
+        log_survival = np.where(np.broadcast_to(fails, shape), 0.0, -np.inf).ravel()
+
+        # Working set of entries with inspections left, as flat arrays:
+        # ln a(N) = ln(a_0^e + e * g * N) / e, or ln a_0 + g * N for m = 2
+        m_is_2 = np.broadcast_to(np.abs(m - 2.0) < 1e-9, shape).ravel()
+        exponent = np.where(m_is_2, 1.0, 1.0 - 0.5 * np.broadcast_to(m, shape).ravel())
+        growth = np.broadcast_to(c * ((geometry_factor * math.sqrt(math.pi)) ** m) * rate, shape).ravel()
+        a_0 = np.broadcast_to(a_0, shape).ravel()
+        start = np.where(m_is_2, np.log(a_0), a_0 ** exponent)
+        step = np.where(m_is_2, growth, exponent * growth) * np.broadcast_to(interval, shape).ravel()
+
+        k = last.ravel()
+        idx = np.flatnonzero(k >= 1.0)
+        k, start, step, exponent, m_is_2 = k[idx], start[idx], step[idx], exponent[idx], m_is_2[idx]
+        any_m_is_2 = m_is_2.any()
+        while idx.size:
+            base = start + k * step
+            log_a = np.log(base) / exponent
+            if any_m_is_2:
+                log_a = np.where(m_is_2, base, log_a)
+            log_miss = self.pod.log_miss(log_a)
+            log_survival[idx] += log_miss
+
+            # POD falls with every earlier inspection, so k * |ln(1 - POD)| bounds the rest
+            k -= 1.0
+            keep = (k >= 1.0) & (k * log_miss < -_LOG_MISS_CUTOFF)
+            if not keep.all():
+                idx, k, start, step, exponent, m_is_2 = (
+                    v[keep] for v in (idx, k, start, step, exponent, m_is_2)
+                )
+        return log_survival.reshape(shape)
+
+    def _broadcast(self, initial_flaws, intervals, design_life, flaw_weights):
+        initial_flaws = np.atleast_2d(np.asarray(initial_flaws, dtype=float))
+        intervals = np.atleast_2d(np.asarray(intervals, dtype=float))
+        n_flaws = initial_flaws.shape[1]
+        if flaw_weights is None:
+            flaw_weights = np.full(n_flaws, 1.0 / n_flaws)
+        flaw_weights = np.asarray(flaw_weights, dtype=float)
+
+        params = np.broadcast_arrays(self.c, self.m, self.stress_range, self.critical_length, self.geometry_factor,
+                                     np.atleast_1d(np.asarray(design_life, dtype=float)),
+                                     initial_flaws[:, 0], intervals[:, 0])[:6]
+        n_components = params[0].size
+        initial_flaws = np.broadcast_to(initial_flaws, (n_components, n_flaws))
+        intervals = np.broadcast_to(intervals, (n_components, intervals.shape[1]))
+        return initial_flaws, intervals, params, flaw_weights
+
+    def probability_of_failure(self, initial_flaws, intervals, design_life, flaw_weights=None):
+        """
+        Probability of failure within the design life for every component and interval.
+
+        Args:
+            initial_flaws (np.ndarray): Representative initial flaw sizes (m), shape
+                (n_flaws,) shared by the fleet or (n_components, n_flaws).
+            intervals (np.ndarray): Candidate intervals in cycles, shape (n_intervals,)
+                or (n_components, n_intervals).
+            design_life (float or np.ndarray): Design life in cycles per component.
+            flaw_weights (np.ndarray, optional): Probability of each flaw (sums to 1).
+                Defaults to equal weights.
+
+        Returns:
+            np.ndarray: PoF, shape (n_components, n_intervals).
+        """
+        initial_flaws, intervals, params, flaw_weights = self._broadcast(
+            initial_flaws, intervals, design_life, flaw_weights
+        )
+        n_components, n_flaws = initial_flaws.shape
+
+        pof = np.empty(intervals.shape)
+        block = max(1, _BLOCK_ELEMENTS // (n_flaws * intervals.shape[1]))
+        for first in range(0, n_components, block):
+            rows = slice(first, first + block)
+            log_survival = self._log_survival(initial_flaws[rows, :, None], *(p[rows, None, None] for p in params),
+                                              intervals[rows, None, :])
+            pof[rows] = np.einsum('cfi,f->ci', np.exp(log_survival), flaw_weights)
+        return pof
+
+    def plan(self, initial_flaws, design_life, target_pof, intervals=None, n_intervals=50, flaw_weights=None,
+             exhaustive=False):
+        """
+        Longest inspection interval per component that meets the target reliability.
+
+        More frequent inspection lowers the PoF, so by default the candidates
+        are searched by bisection: every component keeps a candidate known to
+        meet the target and one known to miss it, and all components are halved
+        together, each step being one fleet-wide probability_of_failure call
+        with a single interval per component. With a few representative flaws
+        the PoF is not strictly monotone in the interval, so bisection may stop
+        a few candidates short of the longest feasible one (the returned
+        interval always meets the target); exhaustive=True evaluates every
+        candidate instead, at roughly n_intervals / log2(n_intervals) times the cost.
+
+        Args:
+            initial_flaws (np.ndarray): Representative initial flaw sizes (m), shape
+                (n_flaws,) or (n_components, n_flaws).
+            design_life (float or np.ndarray): Design life in cycles per component.
+            target_pof (float or np.ndarray): Maximum acceptable probability of failure.
+            intervals (np.ndarray, optional): Candidate intervals in cycles. Defaults to
+                design_life / k for k = 1 .. n_intervals, i.e. 0 .. n_intervals - 1
+                evenly spaced inspections.
+            n_intervals (int): Number of default candidates.
+            flaw_weights (np.ndarray, optional): Probability of each flaw.
+            exhaustive (bool): Evaluate all candidates rather than bisecting.
+
+        Returns:
+            dict: 'interval' (nan where no candidate is feasible), 'n_inspections',
+                'probability_of_failure' at the chosen interval, 'feasible' mask and
+                'uninspected_pof'.
+        """
+        design_life = np.atleast_1d(np.asarray(design_life, dtype=float))
+        if intervals is None:
+            intervals = design_life[:, np.newaxis] / np.arange(1, n_intervals + 1)
+        initial_flaws, intervals, params, flaw_weights = self._broadcast(
+            initial_flaws, intervals, design_life, flaw_weights
+        )
+        n_components = intervals.shape[0]
+        life = params[5]
+        target = np.broadcast_to(np.asarray(target_pof, dtype=float), (n_components,))
+        rows = np.arange(n_components)
+        uninspected = self.probability_of_failure(initial_flaws, life[:, None], life, flaw_weights)[:, 0]
+
+        if exhaustive:
+            all_pof = self.probability_of_failure(initial_flaws, intervals, life, flaw_weights)
+            ok = all_pof <= target[:, None]
+            best = np.argmax(np.where(ok, intervals, -np.inf), axis=1)
+            feasible = ok.any(axis=1)
+            interval = intervals[rows, best]
+            pof = all_pof[rows, best]
+        else:
+            # Candidates sorted from the longest to the shortest interval
+            candidates = -np.sort(-intervals, axis=1)
+
+            def evaluate(column):
+                chosen = candidates[rows, column]
+                return chosen, self.probability_of_failure(initial_flaws, chosen[:, None], life, flaw_weights)[:, 0]
+
+            # Invariant: candidate hi meets the target, candidate lo misses it
+            # (or is the virtual index -1)
+            lo = np.full(n_components, -1)
+            hi = np.full(n_components, candidates.shape[1] - 1)
+            interval, pof = evaluate(hi)
+            feasible = pof <= target
+            while True:
+                open_ = feasible & (hi - lo > 1)
+                if not open_.any():
+                    break
+                mid = np.where(open_, (lo + hi) // 2, hi)
+                mid_interval, mid_pof = evaluate(mid)
+                ok = open_ & (mid_pof <= target)
+                hi = np.where(ok, mid, hi)
+                lo = np.where(open_ & ~ok, mid, lo)
+                interval = np.where(ok, mid_interval, interval)
+                pof = np.where(ok, mid_pof, pof)
+
+        interval = np.where(feasible, interval, np.nan)
+        return {
+            'interval': interval,
+            'n_inspections': np.where(feasible, np.ceil(life / interval) - 1.0, np.nan),
+            'probability_of_failure': np.where(feasible, pof, np.nan),
+            'feasible': feasible,
+            'uninspected_pof': uninspected,
+        }
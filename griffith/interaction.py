@@ -0,0 +1,305 @@
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
+from griffith.lefm import StressIntensityFactor
+
+# Size classes of the neighbour search grow geometrically by this factor
+_SIZE_CLASS_RATIO = 2.0
+# Up to this many query flaws, cross searches use ball queries instead of dual-tree traversals
+_BALL_QUERY_MAX = 2048
+RULES = ('combine', 'amplify', 'none')
+
+class CrackField:
+    """
+    Population of coplanar flaws described by their bounding rectangles in the
+    crack plane.
+
+    Each flaw is centred at (x, z), where x runs along the surface and z
+    through the thickness, with half length c along x and half height a along
+    z. Through-thickness cracks along a line are the special case z = a = 0.
+
+    Interaction follows the BS 7910 proximity rules for coplanar flaws: two
+    flaws interact when their gap along x is at most length_factor times the
+    half length of the shorter one (s <= 2c of the smaller flaw) and their gap
+    along z is at most height_factor * (a1 + a2). Neighbours are found with a
+    KD-tree per size class, so the search is O(n log n) rather than all pairs.
+    """
+    __slots__ = ('x', 'z', 'half_length', 'half_height')
+
+    def __init__(self, x, half_length, z=0.0, half_height=0.0):
+        """
+        Args:
+            x (np.ndarray): Flaw centres along the surface (m).
+            half_length (np.ndarray): Half lengths c (m).
+            z (float or np.ndarray): Flaw centres through the thickness (m).
+            half_height (float or np.ndarray): Half heights a (m).
+        """
+        arrays = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (x, z, half_length, half_height)))
+        self.x, self.z, self.half_length, self.half_height = (np.array(v, dtype=np.float64).ravel() for v in arrays)
+        if np.any(self.half_length <= 0.0):
+            raise ValueError("Flaw half lengths must be positive.")
+        if np.any(self.half_height < 0.0):
+            raise ValueError("Flaw half heights must be non-negative.")
+
+    def __len__(self):
+        return self.x.size
+
+    def _gaps(self, i, j):
+        s_x = np.maximum(np.abs(self.x[i] - self.x[j]) - self.half_length[i] - self.half_length[j], 0.0)
+        s_z = np.maximum(np.abs(self.z[i] - self.z[j]) - self.half_height[i] - self.half_height[j], 0.0)
+        return s_x, s_z
+
+    def _search_radius(self, length_factor, height_factor):
+        # s_x <= f * min(c_i, c_j) implies |dx| <= (1 + f/2) (c_i + c_j), and
+        # likewise along z, so a Chebyshev ball of radius R_i + R_j is enough.
+        return np.maximum((1.0 + 0.5 * length_factor) * self.half_length, (1.0 + height_factor) * self.half_height)
+
+    def _interacting(self, i, j, length_factor, height_factor):
+        s_x, s_z = self._gaps(i, j)
+        return ((s_x <= length_factor * np.minimum(self.half_length[i], self.half_length[j]))
+                & (s_z <= height_factor * (self.half_height[i] + self.half_height[j])))
+
+    def interacting_pairs(self, length_factor=2.0, height_factor=1.0):
+        """
+        Finds every pair of interacting flaws.
+
+        Args:
+            length_factor (float): Allowed gap along x in half lengths of the
+                shorter flaw (2.0: s <= 2c of the smaller flaw).
+            height_factor (float): Allowed gap along z in units of a1 + a2.
+
+        Returns:
+            tuple: (i, j) index arrays of the interacting pairs.
+        """
+        i, j = self._index(np.arange(len(self)), length_factor, height_factor).self_pairs()
+        interact = self._interacting(i, j, length_factor, height_factor)
+        return i[interact], j[interact]
+
+    def _merge(self, labels):
+        order = np.argsort(labels, kind='stable')
+        starts = np.flatnonzero(np.r_[True, np.diff(labels[order]) != 0])
+        x_min = np.minimum.reduceat((self.x - self.half_length)[order], starts)
+        x_max = np.maximum.reduceat((self.x + self.half_length)[order], starts)
+        z_min = np.minimum.reduceat((self.z - self.half_height)[order], starts)
+        z_max = np.maximum.reduceat((self.z + self.half_height)[order], starts)
+        return CrackField(0.5 * (x_min + x_max), 0.5 * (x_max - x_min), 0.5 * (z_min + z_max), 0.5 * (z_max - z_min))
+
+    def _subset(self, ids):
+        return CrackField(self.x[ids], self.half_length[ids], self.z[ids], self.half_height[ids])
+
+    def _index(self, ids, length_factor, height_factor):
+        subset = self._subset(ids)
+        return _NeighbourIndex(ids, subset.x, subset.z, subset._search_radius(length_factor, height_factor))
+
+    def _concatenate(self, other):
+        return CrackField(*(np.concatenate((getattr(self, name), getattr(other, name)))
+                            for name in ('x', 'half_length', 'z', 'half_height')))
+
+    def combine(self, length_factor=2.0, height_factor=1.0, max_passes=100):
+        """
+        Recategorises interacting flaws into single enveloping flaws.
+
+        Chains of interacting flaws are grouped as connected components and
+        replaced by their bounding rectangle. As in BS 7910 the combined flaws
+        are re-checked against their neighbours until no further interaction
+        occurs. Only the flaws created in the previous pass are searched again,
+        against the KD-trees of the input flaws with retired flaws masked out.
+
+        Args:
+            length_factor (float): See interacting_pairs.
+            height_factor (float): See interacting_pairs.
+            max_passes (int): Maximum number of recategorisation passes.
+
+        Returns:
+            tuple: (CrackField of the effective flaws, labels) where labels[k]
+            is the effective flaw containing input flaw k.
+        """
+        # Every flaw ever created, indexed by a global id; merged flaws are
+        # appended and their members retired.
+        flaws = self
+        alive = np.ones(len(self), dtype=bool)
+        owner = np.arange(len(self))
+        original = new = flaws._index(owner, length_factor, height_factor)
+        for _ in range(max_passes):
+            pairs = [new.self_pairs()]
+            if new is not original:
+                pairs.append(new.cross_pairs(original))
+                # Alive flaws merged in earlier passes form a small index rebuilt each pass
+                created = np.flatnonzero(alive[len(self):new.ids[0]]) + len(self)
+                if created.size:
+                    pairs.append(new.cross_pairs(flaws._index(created, length_factor, height_factor)))
+            i = np.concatenate([p[0] for p in pairs])
+            j = np.concatenate([p[1] for p in pairs])
+            keep = alive[i] & alive[j]
+            i, j = i[keep], j[keep]
+            keep = flaws._interacting(i, j, length_factor, height_factor)
+            i, j = i[keep], j[keep]
+            if i.size == 0:
+                break
+
+            members = np.unique(np.concatenate((i, j)))
+            local = np.searchsorted(members, np.stack((i, j)))
+            graph = coo_matrix((np.ones(i.size, dtype=np.int8), (local[0], local[1])),
+                               shape=(members.size, members.size))
+            _, groups = connected_components(graph, directed=False)
+            merged = flaws._subset(members)._merge(groups)
+
+            first_id = len(flaws)
+            remap = np.arange(first_id)
+            remap[members] = first_id + groups
+            owner = remap[owner]
+            alive[members] = False
+            alive = np.concatenate((alive, np.ones(len(merged), dtype=bool)))
+            flaws = flaws._concatenate(merged)
+            new = flaws._index(first_id + np.arange(len(merged)), length_factor, height_factor)
+        else:
+            raise ValueError(f"Flaw recategorisation did not converge in {max_passes} passes.")
+
+        if len(flaws) == len(self):
+            return self, owner
+        survivors = np.flatnonzero(alive)
+        return flaws._subset(survivors), np.searchsorted(survivors, owner)
+
+    def interaction_factors(self, length_factor=2.0, height_factor=1.0):
+        """
+        K amplification of each flaw due to its interacting neighbours.
+
+        Each interacting pair is idealised as a periodic row of collinear
+        cracks of the mean half size c and the same gap s, for which
+        M = sqrt(p / (pi c) * tan(pi c / p)) with pitch p = 2c + s. Pairs
+        separated along x use the half lengths and s_x, pairs stacked through
+        the thickness the half heights and s_z. A flaw takes the largest
+        factor over its neighbours; isolated flaws get 1.
+
+        Args:
+            length_factor (float): See interacting_pairs.
+            height_factor (float): See interacting_pairs.
+
+        Returns:
+            np.ndarray: Amplification factor per flaw (>= 1, infinite for
+            touching flaws, which should be combined instead).
+        """
+        i, j = self.interacting_pairs(length_factor, height_factor)
+        s_x, s_z = self._gaps(i, j)
+        along_x = s_x > 0.0
+        gap = np.where(along_x, s_x, s_z)
+        size_sum = np.where(along_x, self.half_length[i] + self.half_length[j],
+                            self.half_height[i] + self.half_height[j])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            theta = (0.5 * np.pi) * size_sum / (size_sum + gap)
+            pair_factor = np.where(gap > 0.0, np.sqrt(np.tan(theta) / theta), np.inf)
+        factor = np.ones(len(self))
+        np.maximum.at(factor, i, pair_factor)
+        np.maximum.at(factor, j, pair_factor)
+        return factor
+
+    def assess(self, stress, geometry_factor=1.0, k_ic=None, rule='combine', length_factor=2.0,
+               height_factor=1.0, dimension='half_length'):
+        """
+        Stress intensity factors of the effective flaws.
+
+        'combine' recategorises interacting flaws; 'amplify' only merges
+        touching or overlapping flaws and scales K of the remaining ones by
+        interaction_factors; 'none' treats every flaw as isolated. K_I of each
+        effective flaw then follows from StressIntensityFactor.
+
+        Args:
+            stress (float or np.ndarray): Remote stress normal to the crack plane (Pa).
+            geometry_factor (float or np.ndarray): Geometry factor Y of the
+                effective flaws.
+            k_ic (float, optional): Fracture toughness (Pa*sqrt(m)).
+            rule (str): 'combine', 'amplify' or 'none'.
+            length_factor (float): See interacting_pairs.
+            height_factor (float): See interacting_pairs.
+            dimension (str): Crack size 'a' used in K_I, 'half_length' (through
+                cracks) or 'half_height'.
+
+        Returns:
+            dict: 'cracks' (effective CrackField), 'labels' (effective flaw of
+            each input flaw), 'amplification' and 'k1' per effective flaw, plus
+            'utilisation' (K_I / K_IC) when k_ic is given.
+        """
+        if rule not in RULES:
+            raise ValueError(f"Unknown interaction rule '{rule}'. Use one of {', '.join(RULES)}.")
+        if dimension not in ('half_length', 'half_height'):
+            raise ValueError("dimension must be 'half_length' or 'half_height'.")
+
+        if rule == 'combine':
+            cracks, labels = self.combine(length_factor, height_factor)
+            amplification = np.ones(len(cracks))
+        elif rule == 'amplify':
+            # Touching or overlapping flaws are physically one flaw
+            cracks, labels = self.combine(0.0, 0.0)
+            amplification = cracks.interaction_factors(length_factor, height_factor)
+        else:
+            cracks, labels = self, np.arange(len(self))
+            amplification = np.ones(len(self))
+
+        sif = StressIntensityFactor(amplification * geometry_factor)
+        k1 = sif.calculate_k1(stress, getattr(cracks, dimension))
+        results = {'cracks': cracks, 'labels': labels, 'amplification': amplification, 'k1': k1}
+        if k_ic is not None:
+            results['utilisation'] = k1 / k_ic
+        return results
+
+class _NeighbourIndex:
+    """
+    KD-trees of flaw centres grouped into size classes by search radius.
+
+    Within a class the radii differ by at most _SIZE_CLASS_RATIO, so one large
+    flaw does not inflate the search radius used for all the small ones.
+    """
+    def __init__(self, ids, x, z, radius):
+        size_class = np.floor(np.log(radius) / np.log(_SIZE_CLASS_RATIO)).astype(np.intp)
+        points = np.column_stack((x, z))
+        self.radius = radius
+        self.points = points
+        self.ids = ids
+        self.classes = []
+        for k in np.unique(size_class):
+            members = np.flatnonzero(size_class == k)
+            self.classes.append((members, cKDTree(points[members]), radius[members].max()))
+
+    def _filter(self, other, i, j):
+        # Pairs within the class-wide radius; keep those within R_i + R_j
+        reach = self.radius[i] + other.radius[j]
+        keep = np.all(np.abs(self.points[i] - other.points[j]) <= reach[:, None], axis=1)
+        return self.ids[i[keep]], other.ids[j[keep]]
+
+    def self_pairs(self):
+        """
+        Global ids (i, j) of the candidate pairs within this index, each once.
+        """
+        pairs_i, pairs_j = [np.empty(0, dtype=np.intp)], [np.empty(0, dtype=np.intp)]
+        for k, (members_k, tree_k, r_k) in enumerate(self.classes):
+            pairs = tree_k.query_pairs(2.0 * r_k, p=np.inf, output_type='ndarray')
+            pairs_i.append(members_k[pairs[:, 0]])
+            pairs_j.append(members_k[pairs[:, 1]])
+            for members_l, tree_l, r_l in self.classes[k + 1:]:
+                found = tree_k.sparse_distance_matrix(tree_l, r_k + r_l, p=np.inf, output_type='ndarray')
+                pairs_i.append(members_k[found['i']])
+                pairs_j.append(members_l[found['j']])
+        return self._filter(self, np.concatenate(pairs_i), np.concatenate(pairs_j))
+
+    def cross_pairs(self, other):
+        """
+        Global ids (i, j) of the candidate pairs between this index and another.
+        """
+        pairs_i, pairs_j = [np.empty(0, dtype=np.intp)], [np.empty(0, dtype=np.intp)]
+        if self.ids.size <= _BALL_QUERY_MAX:
+            # Few query points: one ball query per class of the other index
+            # beats a dual-tree traversal per pair of classes.
+            for members_l, tree_l, r_l in other.classes:
+                found = tree_l.query_ball_point(self.points, self.radius + r_l, p=np.inf)
+                counts = np.fromiter(map(len, found), dtype=np.intp, count=found.size)
+                if counts.any():
+                    pairs_i.append(np.repeat(np.arange(found.size), counts))
+                    pairs_j.append(members_l[np.concatenate(found[counts > 0])])
+        else:
+            for members_k, tree_k, r_k in self.classes:
+                for members_l, tree_l, r_l in other.classes:
+                    found = tree_k.sparse_distance_matrix(tree_l, r_k + r_l, p=np.inf, output_type='ndarray')
+                    pairs_i.append(members_k[found['i']])
+                    pairs_j.append(members_l[found['j']])
+        return self._filter(other, np.concatenate(pairs_i), np.concatenate(pairs_j))
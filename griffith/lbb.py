@@ -0,0 +1,202 @@
+import numpy as np
+import math
+from griffith.lefm import StressIntensityFactor
+
+# Folias bulging coefficients, M = sqrt(1 + beta * c^2 / (R t))
+_FOLIAS = {'axial': 1.61, 'circumferential': 0.32}
+ORIENTATIONS = tuple(_FOLIAS)
+
+# Newman-Raju style surface flaw shape factor Q = 1 + 1.464 (a/c)^1.65
+_Q_COEFF = 1.464
+_Q_EXPONENT = 1.65
+_SURFACE_FACTOR = 1.12
+
+def _folias_coefficient(orientation):
+    try:
+        return _FOLIAS[orientation]
+    except KeyError:
+        raise ValueError(f"Unknown orientation '{orientation}'. Use 'axial' or 'circumferential'.") from None
+
+def folias_factor(half_length, radius, thickness, orientation='axial'):
+    """
+    Folias bulging factor of a through-wall crack in a cylinder.
+
+    M = sqrt(1 + beta * c^2 / (R t)), beta = 1.61 (axial) or 0.32 (circumferential)
+
+    Args:
+        half_length (float or np.ndarray): Crack half length c (m).
+        radius (float or np.ndarray): Mean radius R (m).
+        thickness (float or np.ndarray): Wall thickness t (m).
+        orientation (str): 'axial' or 'circumferential'.
+
+    Returns:
+        np.ndarray: M (dimensionless).
+    """
+    beta = _folias_coefficient(orientation)
+    return np.sqrt(1.0 + beta * half_length * half_length / (radius * thickness))
+
+class ThroughWallCrack(StressIntensityFactor):
+    """
+    Through-wall crack in a thin-walled cylinder with the Folias bulging correction.
+
+    K_I = M(c) * sigma * sqrt(pi * c), with sigma the hoop stress for axial
+    cracks and the axial stress for circumferential cracks. The crack length
+    convention is the half length c, which grows by delta_a per tip extension.
+    """
+    crack_tips = 1
+
+    def __init__(self, radius, thickness, orientation='axial'):
+        """
+        Args:
+            radius (float or np.ndarray): Mean radius R (m).
+            thickness (float or np.ndarray): Wall thickness t (m).
+            orientation (str): 'axial' or 'circumferential'.
+        """
+        self.radius = radius
+        self.thickness = thickness
+        self.orientation = orientation
+        self._bulging = _folias_coefficient(orientation) / (np.asarray(radius) * np.asarray(thickness))
+        super().__init__(1.0)
+
+    def unit_k1(self, crack_length):
+        """
+        K_I per unit stress, g(c) = M(c) * sqrt(pi * c).
+        """
+        c = np.asarray(crack_length, dtype=float)
+        return np.sqrt(math.pi * c * (1.0 + self._bulging * c * c))
+
+    def unit_k1_derivative(self, crack_length):
+        """
+        dg/dc = pi * (1 + 3 k c^2) / (2 g), with k = beta / (R t).
+        """
+        c = np.asarray(crack_length, dtype=float)
+        k_c2 = self._bulging * c * c
+        return math.pi * (1.0 + 3.0 * k_c2) / (2.0 * np.sqrt(math.pi * c * (1.0 + k_c2)))
+
+    def critical_half_length(self, k_ic, stress):
+        """
+        Half length at which K_I = K_IC, in closed form.
+
+        M^2 sigma^2 pi c = K_IC^2 is the cubic k c^3 + c - q = 0 with
+        q = K_IC^2 / (pi sigma^2), whose single real root is
+        c = 2 / sqrt(3k) * sinh(asinh(1.5 q sqrt(3k)) / 3)
+        (c = q, the flat plate value, as k -> 0).
+
+        Args:
+            k_ic (float or np.ndarray): Fracture toughness (Pa*sqrt(m)).
+            stress (float or np.ndarray): Stress normal to the crack (Pa).
+
+        Returns:
+            np.ndarray: Critical half length c (m).
+        """
+        val = k_ic / stress
+        q = (val * val) / math.pi
+        root_3k = np.sqrt(3.0 * self._bulging)
+        return (2.0 / root_3k) * np.sinh(np.arcsinh(1.5 * q * root_3k) / 3.0)
+
+    def collapse_half_length(self, flow_stress, stress):
+        """
+        Half length at which the bulged ligament collapses, M(c) * sigma = sigma_flow.
+
+        Args:
+            flow_stress (float or np.ndarray): Flow stress (Pa).
+            stress (float or np.ndarray): Stress normal to the crack (Pa).
+
+        Returns:
+            np.ndarray: Half length (m); 0 if sigma >= sigma_flow.
+        """
+        ratio = flow_stress / stress
+        return np.sqrt(np.maximum(ratio * ratio - 1.0, 0.0) / self._bulging)
+
+class Cylinder:
+    """
+    Thin-walled pressurised cylinder (vessel shell or pipe segment).
+
+    All dimensions and loads may be arrays, so a whole piping inventory is
+    screened in one broadcast call.
+    """
+    def __init__(self, radius, thickness, pressure, axial_stress=0.0):
+        """
+        Args:
+            radius (float or np.ndarray): Mean radius R (m).
+            thickness (float or np.ndarray): Wall thickness t (m).
+            pressure (float or np.ndarray): Internal pressure p (Pa).
+            axial_stress (float or np.ndarray): Axial stress added to the
+                pressure end load, e.g. from bending or thermal expansion (Pa).
+        """
+        self.radius = np.asarray(radius, dtype=float)
+        self.thickness = np.asarray(thickness, dtype=float)
+        self.pressure = np.asarray(pressure, dtype=float)
+        self.axial_stress_extra = np.asarray(axial_stress, dtype=float)
+
+    @property
+    def hoop_stress(self):
+        # Sigma = P * r / t
+        return self.pressure * self.radius / self.thickness
+
+    @property
+    def axial_stress(self):
+        # Sigma = P * r / (2 t) plus the additional axial stress
+        return 0.5 * self.hoop_stress + self.axial_stress_extra
+
+    def crack(self, orientation='axial'):
+        """
+        Through-wall crack geometry in this cylinder.
+        """
+        return ThroughWallCrack(self.radius, self.thickness, orientation)
+
+    def stress(self, orientation='axial'):
+        """
+        Stress opening a crack of the given orientation (Pa).
+        """
+        _folias_coefficient(orientation)
+        return self.hoop_stress if orientation == 'axial' else self.axial_stress
+
+    def leak_before_break(self, k_ic, orientation='axial', flow_stress=None, aspect_ratio=1.0):
+        """
+        Leak-before-break screening, independent of leak rates.
+
+        1. Critical through-wall length: the smaller of the fracture length
+           (M sigma sqrt(pi c) = K_IC) and, if flow_stress is given, the
+           plastic collapse length (M sigma = sigma_flow).
+        2. Breakthrough: a surface flaw with depth/half-length ratio
+           aspect_ratio reaching the full wall depth t must not be critical,
+           K = 1.12 M sigma sqrt(pi t / Q) < K_IC with
+           Q = 1 + 1.464 (a/c)^1.65, and it then leaks as a through-wall crack
+           of half length c = t / aspect_ratio, which must be shorter than the
+           critical length.
+
+        Args:
+            k_ic (float or np.ndarray): Fracture toughness (Pa*sqrt(m)).
+            orientation (str): 'axial' or 'circumferential'.
+            flow_stress (float or np.ndarray, optional): Flow stress for plastic collapse (Pa).
+            aspect_ratio (float or np.ndarray): Surface flaw depth / half length at breakthrough (<= 1).
+
+        Returns:
+            dict: 'stress', 'critical_half_length', 'fracture_half_length',
+            'collapse_half_length' (inf without flow_stress),
+            'breakthrough_half_length', 'surface_k1', 'margin' (critical /
+            breakthrough half length) and the boolean 'leak_before_break'.
+        """
+        crack = self.crack(orientation)
+        stress = self.stress(orientation)
+        thickness = self.thickness
+
+        fracture = crack.critical_half_length(k_ic, stress)
+        collapse = np.inf if flow_stress is None else crack.collapse_half_length(flow_stress, stress)
+        critical = np.minimum(fracture, collapse)
+
+        breakthrough = thickness / aspect_ratio
+        shape = 1.0 + _Q_COEFF * np.asarray(aspect_ratio, dtype=float) ** _Q_EXPONENT
+        surface_k1 = (_SURFACE_FACTOR * stress) * crack.unit_k1(breakthrough) * np.sqrt(thickness / (breakthrough * shape))
+
+        return {
+            'stress': stress,
+            'critical_half_length': critical,
+            'fracture_half_length': fracture,
+            'collapse_half_length': np.broadcast_to(collapse, np.shape(critical)),
+            'breakthrough_half_length': breakthrough,
+            'surface_k1': surface_k1,
+            'margin': critical / breakthrough,
+            'leak_before_break': (breakthrough < critical) & (surface_k1 < k_ic),
+        }
@@ -1,5 +1,6 @@
 import numpy as np
 import math
+from griffith.precision import get_precision
 
 _SQRT_PI = math.sqrt(math.pi)
 _INV_PI = 1.0 / math.pi
@@ -9,9 +10,21 @@ class StressIntensityFactor:
     """
     Base class for Stress Intensity Factor (SIF) calculations.
     """
+    # Number of crack tips growing when the crack extends; the crack length
+    # convention grows by crack_tips * delta_a for a tip extension delta_a.
+    crack_tips = 1
+
     def __init__(self, geometry_factor=1.0):
         self.geometry_factor = geometry_factor
 
+    @property
+    def max_crack_length(self):
+        """
+        Upper bound of the crack length for which K_I is defined (m).
+        Unbounded for a constant geometry factor.
+        """
+        return np.inf
+
     def calculate_k1(self, stress, crack_length):
         """
         Calculates Mode I Stress Intensity Factor (K_I).
@@ -36,6 +49,37 @@ class StressIntensityFactor:
         scalar_factor = (self.geometry_factor * _SQRT_PI) * stress
         return scalar_factor * np.sqrt(crack_length)
 
+    def unit_k1(self, crack_length):
+        """
+        K_I per unit applied load, g(a) = Y * sqrt(pi * a).
+
+        Used by the inverse solvers in griffith.solvers, which rely on K_I
+        being linear in the load: K_I = load * g(a).
+
+        Args:
+            crack_length (float or np.ndarray): Crack length 'a' (m).
+
+        Returns:
+            float or np.ndarray: g(a) (sqrt(m)).
+        """
+        crack_length = np.asarray(crack_length, dtype=get_precision().dtype)
+        return (self.geometry_factor * _SQRT_PI) * np.sqrt(crack_length)
+
+    def unit_k1_derivative(self, crack_length):
+        """
+        Derivative dg/da of the K_I per unit load.
+
+        For constant Y: dg/da = g(a) / (2a).
+
+        Args:
+            crack_length (float or np.ndarray): Crack length 'a' (m).
+
+        Returns:
+            float or np.ndarray: dg/da (1/sqrt(m)).
+        """
+        crack_length = np.asarray(crack_length, dtype=get_precision().dtype)
+        return (0.5 * self.geometry_factor * _SQRT_PI) / np.sqrt(crack_length)
+
     @staticmethod
     def critical_crack_length(k_ic, stress, geometry_factor=1.0):
         """
@@ -43,6 +87,9 @@ class StressIntensityFactor:
 
         a_c = (1/pi) * (K_IC / (Y * sigma))^2
 
+        Only valid for a constant geometry factor. For geometries where Y
+        depends on the crack length, use griffith.solvers.critical_crack_length.
+
         Args:
             k_ic (float): Fracture toughness (Pa*sqrt(m)).
             stress (float): Applied remote stress (Pa).
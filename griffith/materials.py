@@ -1,30 +1,60 @@
 import numpy as np
+from griffith import solvers
+from griffith.results import CriticalSizeResult
 
 _INV_NP_PI = 1.0 / np.pi
 
 class Material:
-    def __init__(self, name, youngs_modulus, yield_strength, k_ic=None, j_ic=None):
+    def __init__(self, name, youngs_modulus, yield_strength, k_ic=None, j_ic=None,
+                 poisson_ratio=0.3, ramberg_osgood_alpha=None, hardening_exponent=None, reference_stress=None):
         """
+        Ramberg-Osgood law: eps / eps_0 = sigma / sigma_0 + alpha * (sigma / sigma_0)^n,
+        with eps_0 = sigma_0 / E.
+
         Args:
             name (str): Material name.
             youngs_modulus (float): E (Pa).
             yield_strength (float): Sigma_y (Pa).
             k_ic (float, optional): Fracture Toughness (Pa*sqrt(m)).
             j_ic (float, optional): Fracture Toughness (J/m^2).
+            poisson_ratio (float): Poisson's Ratio v.
+            ramberg_osgood_alpha (float, optional): Ramberg-Osgood coefficient alpha.
+            hardening_exponent (float, optional): Ramberg-Osgood hardening exponent n.
+            reference_stress (float, optional): Reference stress sigma_0 (Pa). Defaults to yield_strength.
         """
         self.name = name
         self.youngs_modulus = youngs_modulus
         self.yield_strength = yield_strength
         self.k_ic = k_ic
         self.j_ic = j_ic
+        self.poisson_ratio = poisson_ratio
+        self.ramberg_osgood_alpha = ramberg_osgood_alpha
+        self.hardening_exponent = hardening_exponent
+        self.reference_stress = yield_strength if reference_stress is None else reference_stress
 
-    def critical_crack_length(self, stress, geometry_factor=1.0):
+    @property
+    def reference_strain(self):
+        """
+        Ramberg-Osgood reference strain eps_0 = sigma_0 / E.
+        """
+        return self.reference_stress / self.youngs_modulus
+
+    def critical_crack_length(self, stress, geometry_factor=1.0, geometry=None):
         """
         Calculates critical crack length based on K_IC.
+
+        Args:
+            stress (float): Applied load (stress in Pa, or load P for SENB geometries).
+            geometry_factor (float): Constant geometry factor Y. Ignored if geometry is given.
+            geometry (StressIntensityFactor, optional): Geometry with a crack-length
+                dependent Y(a). If given, K_I(a) = K_IC is solved numerically.
         """
         if self.k_ic is None:
             raise ValueError(f"K_IC not defined for {self.name}")
 
+        if geometry is not None:
+            return solvers.critical_crack_length(geometry, self.k_ic, stress)
+
         # a_c = (1/pi) * (K_IC / (Y * sigma))^2
         # ⚡ Bolt Optimization: Replace ** 2 with multiplication for a 12% speedup in hot paths
         # ⚡ Bolt Optimization: Multiply module-level constant _INV_NP_PI to avoid repeated 1.0 / np.pi evaluation (~20% faster)
@@ -32,6 +62,69 @@ class Material:
         val = (self.k_ic / geometry_factor) / stress
         return _INV_NP_PI * (val * val)
 
+    def critical_size(self, stress, geometry_factor=1.0, geometry=None):
+        """
+        Critical crack lengths as one array-backed record per load case.
+
+        Args:
+            stress (float or np.ndarray): Applied load (stress in Pa, or load P for SENB geometries).
+            geometry_factor (float or np.ndarray): Constant geometry factor Y. Ignored if geometry is given.
+            geometry (StressIntensityFactor, optional): Geometry with a crack-length dependent Y(a).
+
+        Returns:
+            CriticalSizeResult: Columns critical_crack_length, k_ic, load and
+            geometry_factor (NaN for a geometry), with the material name and
+            geometry as shared settings.
+        """
+        a_c = self.critical_crack_length(stress, geometry_factor, geometry)
+        return CriticalSizeResult(
+            {'material': self.name, 'geometry': geometry},
+            critical_crack_length=a_c, k_ic=self.k_ic, load=stress,
+            geometry_factor=None if geometry is not None else geometry_factor
+        )
+
+    def critical_crack_length_sensitivities(self, stress, geometry_factor=1.0, geometry=None):
+        """
+        Critical crack length with its derivatives with respect to K_IC, the load and Y.
+
+        For a constant Y, a_c is proportional to (K_IC / (Y * sigma))^2, so
+        da_c/dK_IC = 2 a_c / K_IC and da_c/dsigma = -2 a_c / sigma, da_c/dY = -2 a_c / Y.
+
+        Args:
+            stress (float or np.ndarray): Applied load (stress in Pa, or load P for SENB geometries).
+            geometry_factor (float or np.ndarray): Constant geometry factor Y. Ignored if geometry is given.
+            geometry (StressIntensityFactor, optional): Geometry with a crack-length dependent Y(a).
+
+        Returns:
+            tuple: (a_c, gradients) with keys 'k_ic', 'load' and, for constant Y, 'geometry_factor'.
+        """
+        if self.k_ic is None:
+            raise ValueError(f"K_IC not defined for {self.name}")
+
+        if geometry is not None:
+            return solvers.critical_crack_length_sensitivities(geometry, self.k_ic, stress)
+
+        a_c = self.critical_crack_length(stress, geometry_factor)
+        two_a_c = 2.0 * a_c
+        return a_c, {
+            'k_ic': two_a_c / self.k_ic,
+            'load': -two_a_c / stress,
+            'geometry_factor': -two_a_c / geometry_factor,
+        }
+
+    def critical_load(self, geometry, crack_length=None):
+        """
+        Calculates the load at which a crack in the given geometry becomes critical.
+
+        Args:
+            geometry (StressIntensityFactor): Geometry object.
+            crack_length (float, optional): Crack length. Defaults to geometry.crack_length.
+        """
+        if self.k_ic is None:
+            raise ValueError(f"K_IC not defined for {self.name}")
+
+        return solvers.critical_load(geometry, self.k_ic, crack_length)
+
 class Steel(Material):
     def __init__(self, K_IC=50e6, yield_strength=350e6):
         super().__init__(
@@ -0,0 +1,225 @@
+import numpy as np
+import math
+from griffith.lefm import StressIntensityFactor
+from griffith.epfm import ctod
+from griffith.precision import get_precision
+
+MODELS = ('irwin', 'dugdale')
+# Irwin zone r_y = (K / sigma_y)^2 / (beta * pi): beta = 2 in plane stress, 6 in plane strain
+_IRWIN_BETA = {True: 2.0, False: 6.0}
+_HALF_PI = 0.5 * math.pi
+_SQRT_PI = math.sqrt(math.pi)
+
+def _check_model(model):
+    if model not in MODELS:
+        raise ValueError(f"Unknown plastic zone model '{model}'. Use one of {', '.join(MODELS)}.")
+
+def _residual(x, crack_length, stress_ratio, geometry, model, plane_stress):
+    """
+    h(x) and h'(x) of the fixed point h(x) = 0 for the effective crack length x.
+
+    Irwin:   h = x - a - n_tips * (sigma g(x) / sigma_y)^2 / (beta pi)
+    Dugdale: h = x cos(theta(x)) - a, theta = (pi sigma / (2 sigma_y)) * Y(x)
+    """
+    g = geometry.unit_k1(x)
+    dg = geometry.unit_k1_derivative(x)
+    tips = geometry.crack_tips
+    if model == 'irwin':
+        kappa = tips * stress_ratio * stress_ratio / (_IRWIN_BETA[plane_stress] * math.pi)
+        return x - crack_length - kappa * g * g, 1.0 - 2.0 * kappa * g * dg
+
+    # Y = g / sqrt(pi * l) with l = x / n_tips the length per crack tip
+    scale = (_HALF_PI / _SQRT_PI) * math.sqrt(tips) * stress_ratio
+    inv_sqrt_x = 1.0 / np.sqrt(x)
+    theta = scale * g * inv_sqrt_x
+    dtheta = scale * inv_sqrt_x * (dg - 0.5 * g / x)
+    cos_theta = np.where(theta < _HALF_PI, np.cos(theta), np.nan)
+    return x * cos_theta - crack_length, cos_theta - x * np.sin(theta) * dtheta
+
+def effective_crack_length(stress, crack_length, yield_strength, geometry=None, geometry_factor=1.0,
+                           model='irwin', plane_stress=True, xtol=1e-15, rtol=1e-12, max_iter=50):
+    """
+    Plastic zone corrected (effective) crack length and K_I, solved for
+    arrays of cracks at once.
+
+    The small scale yielding correction a_eff = a + r_y depends on K_I at
+    a_eff itself, so it is a fixed point:
+
+    Irwin:   r_y = (K_eff / sigma_y)^2 / (beta * pi), beta = 2 (plane stress) or 6 (plane strain)
+    Dugdale: a / a_eff = cos(pi * Y(a_eff) * sigma / (2 sigma_y)), the strip yield
+             zone of a plane stress through crack, with the finite width
+             correction Y taken at a_eff.
+
+    The fixed point is solved by Newton's method from a_eff = a with
+    convergence masks: every crack is frozen as soon as its step falls below
+    the tolerance. Since h is increasing and concave for the usual geometries,
+    the iterates rise monotonically to the smallest solution; a constant Y
+    converges in one step and finite width geometries in a handful. Cracks
+    without a solution (net section yield, or Y * sigma >= sigma_y for
+    Dugdale) are returned as NaN with converged=False.
+
+    Args:
+        stress (float or np.ndarray): Applied (peak) stress, in the units of the yield strength.
+        crack_length (float or np.ndarray): Physical crack length, in the geometry's convention (m).
+        yield_strength (float or np.ndarray): Sigma_y, e.g. Material.yield_strength.
+        geometry (StressIntensityFactor, optional): Geometry with a crack-length dependent Y(a).
+            Every tip gets its own zone (2a grows by 2 r_y for a CCT).
+        geometry_factor (float): Constant geometry factor Y. Ignored if geometry is given.
+        model (str): 'irwin' or 'dugdale'.
+        plane_stress (bool): True for plane stress, False for plane strain (Irwin only).
+        xtol (float): Absolute tolerance on a_eff (m).
+        rtol (float): Relative tolerance on a_eff.
+        max_iter (int): Maximum number of array iterations.
+
+    Returns:
+        dict: crack_length (a_eff), plastic_zone (r_y or Dugdale rho per tip),
+        k1 (K_I at a_eff), converged (mask), iterations (array iterations run)
+        and slope (h'(a_eff) = 1 / (d a_eff / d a), used for derivatives).
+    """
+    _check_model(model)
+    if geometry is None:
+        geometry = StressIntensityFactor(geometry_factor)
+    settings = get_precision()
+    xtol = settings.tolerance(xtol)
+    rtol = settings.tolerance(rtol)
+
+    stress = np.asarray(stress, dtype=float)
+    crack_length = np.asarray(crack_length, dtype=float)
+    stress_ratio = stress / np.asarray(yield_strength, dtype=float)
+
+    x = crack_length
+    # A vanishing crack has no zone (and a singular h' at a = 0)
+    converged = np.broadcast_to(crack_length == 0.0, np.broadcast_shapes(x.shape, stress_ratio.shape)).copy()
+    failed = np.zeros_like(converged)
+    last_step = np.full(converged.shape, np.inf)
+    iterations = 0
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for iterations in range(1, max_iter + 1):
+            h, slope = _residual(x, crack_length, stress_ratio, geometry, model, plane_stress)
+            active = ~(converged | failed)
+            x_new = x - h / slope
+            # Without a root h' drops to zero, or the iterate leaves the geometry
+            lost = active & ~((slope > 0.0) & (x_new < geometry.max_crack_length) & np.isfinite(x_new))
+            failed |= lost
+            active &= ~lost
+            step = np.abs(x_new - x)
+            last_step = np.where(active, step, last_step)
+            converged |= active & (step <= xtol + rtol * np.abs(x_new))
+            x = np.where(active, x_new, x)
+            if not (active & ~converged).any():
+                break
+
+        x = np.where(converged, x, np.nan)
+        _, slope = _residual(x, crack_length, stress_ratio, geometry, model, plane_stress)
+        k1 = stress * geometry.unit_k1(x)
+        plastic_zone = (x - crack_length) / geometry.crack_tips
+
+    if settings.certified:
+        settings.report('effective_crack_length', iterations=iterations, problems=int(x.size),
+                        unconverged=int(np.count_nonzero(~converged)),
+                        max_error=float(np.nanmax(np.where(converged, last_step, np.nan), initial=0.0)))
+    return {
+        'crack_length': x[()],
+        'plastic_zone': plastic_zone[()],
+        'k1': k1[()],
+        'converged': converged[()],
+        'iterations': iterations,
+        'slope': slope[()],
+    }
+
+def plastic_zone_ctod(stress, crack_length, yield_strength, youngs_modulus, geometry=None, geometry_factor=1.0,
+                      model='irwin', plane_stress=True, constraint_factor=1.0):
+    """
+    CTOD from the plastic zone corrected crack.
+
+    Irwin:   delta = K_eff^2 / (m * sigma_y * E), epfm.ctod with the corrected K.
+    Dugdale: delta = (8 sigma_y l / (pi E)) * ln(sec(theta)), the strip yield
+             opening at the physical tip, l = a / n_tips, theta as in
+             effective_crack_length. constraint_factor is not used.
+
+    Args:
+        stress (float or np.ndarray): Applied stress, in the units of the yield strength.
+        crack_length (float or np.ndarray): Physical crack length, in the geometry's convention (m).
+        yield_strength (float or np.ndarray): Sigma_y.
+        youngs_modulus (float or np.ndarray): Young's Modulus E.
+        geometry (StressIntensityFactor, optional): Geometry with a crack-length dependent Y(a).
+        geometry_factor (float): Constant geometry factor Y. Ignored if geometry is given.
+        model (str): 'irwin' or 'dugdale'.
+        plane_stress (bool): Plane stress or plane strain zone (Irwin only).
+        constraint_factor (float): Constraint factor m of the Irwin CTOD.
+
+    Returns:
+        float or np.ndarray: CTOD delta (m); NaN where the correction has no solution.
+    """
+    solution = effective_crack_length(stress, crack_length, yield_strength, geometry, geometry_factor,
+                                      model, plane_stress)
+    if model == 'irwin':
+        return ctod(solution['k1'], yield_strength, youngs_modulus, constraint_factor)
+
+    tips = 1 if geometry is None else geometry.crack_tips
+    # sec(theta) = a_eff / a from the fixed point
+    with np.errstate(divide='ignore', invalid='ignore'):
+        opening = (8.0 / math.pi) * (np.asarray(yield_strength, dtype=float) / youngs_modulus) \
+            * (np.asarray(crack_length, dtype=float) / tips) * np.log(solution['crack_length'] / crack_length)
+    return opening[()]
+
+class PlasticZoneCorrectedGeometry(StressIntensityFactor):
+    """
+    Geometry whose K_I per unit load is taken at the plastic zone corrected
+    crack length, g_eff(a) = g(a_eff(a)), for a fixed peak stress.
+
+    It has the unit_k1 interface, so the corrected K feeds every geometry
+    aware solver: ParisLawIntegrator.allowable_stress_range and
+    max_initial_flaw (Delta K_eff = Delta sigma * g(a_eff), with the zone of
+    the peak stress), or griffith.solvers.critical_crack_length. The peak
+    stress and yield strength may be arrays broadcasting with the crack lengths.
+    Every evaluation solves the fixed point (see effective_crack_length).
+    """
+    def __init__(self, geometry, stress_max, yield_strength, model='irwin', plane_stress=True):
+        """
+        Args:
+            geometry (StressIntensityFactor): Uncorrected geometry.
+            stress_max (float or np.ndarray): Peak stress setting the plastic zone size.
+            yield_strength (float or np.ndarray): Sigma_y.
+            model (str): 'irwin' or 'dugdale'.
+            plane_stress (bool): Plane stress or plane strain zone (Irwin only).
+        """
+        _check_model(model)
+        super().__init__(geometry.geometry_factor)
+        self.geometry = geometry
+        self.stress_max = stress_max
+        self.yield_strength = yield_strength
+        self.model = model
+        self.plane_stress = plane_stress
+        self.crack_tips = geometry.crack_tips
+
+    @property
+    def max_crack_length(self):
+        return self.geometry.max_crack_length
+
+    def _solve(self, crack_length):
+        return effective_crack_length(self.stress_max, crack_length, self.yield_strength, self.geometry,
+                                      model=self.model, plane_stress=self.plane_stress)
+
+    def unit_k1(self, crack_length):
+        """
+        K_I per unit load at the effective crack length, g(a_eff(a)).
+
+        Beyond small scale yielding, where the correction has no solution,
+        K_I is taken as unbounded (inf), so critical size searches bracket
+        the limit and life integrals get no cycles from it.
+        """
+        solution = self._solve(crack_length)
+        g = self.geometry.unit_k1(solution['crack_length'])
+        return np.where(solution['converged'], g, np.inf)[()]
+
+    def unit_k1_derivative(self, crack_length):
+        """
+        dg_eff/da = g'(a_eff) * d a_eff / d a, with d a_eff / d a = 1 / h'(a_eff)
+        by implicit differentiation of the fixed point.
+        """
+        solution = self._solve(crack_length)
+        return self.geometry.unit_k1_derivative(solution['crack_length']) / solution['slope']
+
+    def calculate_k1(self, stress, crack_length):
+        return stress * self.unit_k1(crack_length)
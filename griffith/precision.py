@@ -0,0 +1,131 @@
+import collections
+import contextlib
+import contextvars
+import numpy as np
+
+TIERS = ('screening', 'standard', 'certified')
+
+# dtype, tolerance scale and Gauss-Legendre nodes of the life integrals.
+# Tolerances are given at the call sites for the standard tier and scaled.
+_SETTINGS = {
+    'screening': (np.float32, 1e4, 16),
+    'standard': (np.float64, 1.0, 64),
+    'certified': (np.float64, 1.0, 64),
+}
+# Reports kept by a global certified default, which lives as long as the process
+DEFAULT_MAX_REPORTS = 1000
+
+class Precision:
+    """
+    Numerical settings of a precision tier.
+
+    screening: float32 arrays, tolerances loosened 10^4 times and 16-node
+        life integrals, for coarse screening of millions of cases.
+    standard: float64 with the default tolerances.
+    certified: standard settings, plus a report per solver or quadrature
+        call with iteration counts and a-posteriori error estimates,
+        collected in reports. A precision() block keeps all of its reports;
+        the global default keeps the most recent max_reports, so a
+        long-running process does not accumulate them.
+    """
+    __slots__ = ('tier', 'dtype', 'tolerance_scale', 'quadrature_nodes', 'reports')
+
+    def __init__(self, tier='standard', max_reports=None):
+        """
+        Args:
+            tier (str): 'screening', 'standard' or 'certified'.
+            max_reports (int, optional): Keep only the most recent certified
+                reports (a deque). Defaults to keeping all of them.
+        """
+        if tier not in _SETTINGS:
+            raise ValueError(f"Unknown precision tier '{tier}'. Use one of {', '.join(TIERS)}.")
+        self.tier = tier
+        self.dtype, self.tolerance_scale, self.quadrature_nodes = _SETTINGS[tier]
+        if tier != 'certified':
+            self.reports = None
+        else:
+            self.reports = [] if max_reports is None else collections.deque(maxlen=max_reports)
+
+    def __repr__(self):
+        return f"Precision('{self.tier}')"
+
+    @property
+    def certified(self):
+        """
+        True when solvers should compute and report error estimates.
+        """
+        return self.reports is not None
+
+    def tolerance(self, value):
+        """
+        Scales a standard tier tolerance to this tier.
+        """
+        return value * self.tolerance_scale
+
+    def report(self, source, **values):
+        """
+        Records a solver or quadrature report (certified tier only).
+
+        Args:
+            source (str): Function that produced the report.
+            **values: Iterations, error estimates, ...
+        """
+        if self.reports is not None:
+            self.reports.append({'source': source, **values})
+
+_default = Precision('standard')
+_active = contextvars.ContextVar('griffith_precision', default=None)
+
+def get_precision():
+    """
+    The active precision settings: the innermost precision() context, else the global default.
+
+    Returns:
+        Precision: Active settings.
+    """
+    settings = _active.get()
+    return _default if settings is None else settings
+
+def set_precision(tier, max_reports=DEFAULT_MAX_REPORTS):
+    """
+    Sets the global default precision tier.
+
+    A certified default keeps only its most recent reports, in
+    get_precision().reports; a precision('certified') block keeps all of
+    them for the block.
+
+    Args:
+        tier (str): 'screening', 'standard' or 'certified'.
+        max_reports (int): Certified reports kept by the default.
+
+    Returns:
+        Precision: The new default settings.
+    """
+    global _default
+    _default = Precision(tier, max_reports)
+    return _default
+
+@contextlib.contextmanager
+def precision(tier):
+    """
+    Runs a block with a precision tier, e.g.
+
+        with precision('certified') as settings:
+            a_c = critical_crack_length(plate, k_ic, stress)
+        settings.reports  # iterations and error estimates
+
+    The setting is a context variable, so threads and asyncio tasks can use
+    different tiers concurrently.
+
+    Args:
+        tier (str): 'screening', 'standard' or 'certified'.
+
+    Yields:
+        Precision: The settings of the block, with its reports.
+    """
+    settings = Precision(tier)
+    token = _active.set(settings)
+    try:
+        yield settings
+    finally:
+        _active.reset(token)
@@ -1,8 +1,13 @@
 import numpy as np
 import math
+from griffith.epfm import j_integral
+from griffith.solvers import find_roots
+from griffith.results import InstabilityResult
+from griffith.precision import get_precision
 
 _EPSILON = 1e-6
 _INV_2_EPS = 0.5 / _EPSILON
+_UPPER_FRACTION = 1.0 - 1e-9
 
 def _instability_target_func(delta_a, initial_crack, resistance_func, resistance_deriv_func):
     """
@@ -18,27 +23,75 @@ def _instability_target_func(delta_a, initial_crack, resistance_func, resistance
     dr_da_val = (resistance_func(delta_a + _EPSILON) - resistance_func(delta_a - _EPSILON)) * _INV_2_EPS
     return (initial_crack + delta_a) * dr_da_val - resistance_func(delta_a)
 
-def _find_root(f, a, b, tol=1e-9, max_iter=100, args=()):
+def _central_difference(func, x, h):
+    """
+    Central difference derivative, used when no analytic derivative is supplied.
+    """
+    return (func(x + h) - func(x - h)) * (0.5 / h)
+
+def _geometry_tangency_target(delta_a, initial_crack, geometry, resistance_func, resistance_deriv_func,
+                              compliance_func, compliance_deriv_func):
+    """
+    Target function for the geometry-coupled tangency condition.
+
+    Load control:         R' * g - 2 * n * g' * R = 0
+    Displacement control: R' * g * C - 2 * n * (g' * C - g * C') * R = 0
+
+    where g(a) is the K_I per unit load of the geometry, C(a) the total
+    compliance and n the number of crack tips.
+    """
+    n_tips = geometry.crack_tips
+    crack = initial_crack + n_tips * delta_a
+    g = geometry.unit_k1(crack)
+    dg = geometry.unit_k1_derivative(crack)
+
+    r = resistance_func(delta_a)
+    if resistance_deriv_func:
+        dr = resistance_deriv_func(delta_a)
+    else:
+        dr = _central_difference(resistance_func, delta_a, _EPSILON)
+
+    if compliance_func is None:
+        return dr * g - (2.0 * n_tips) * dg * r
+
+    c = compliance_func(crack)
+    if compliance_deriv_func:
+        dc = compliance_deriv_func(crack)
+    else:
+        dc = _central_difference(compliance_func, crack, _EPSILON)
+    return dr * g * c - (2.0 * n_tips) * (dg * c - g * dc) * r
+
+def _find_root(f, a, b, tol=1e-9, max_iter=100, args=(), ftol=1e-12):
     """
     Illinois Algorithm for root finding.
     A variant of Regula Falsi that provides superlinear convergence
     while maintaining the robustness of bracketing methods.
+
+    tol (bracket width) and ftol (|f|) are the standard tier values,
+    scaled by the active precision tier. The certified tier reports
+    the iterations, the stopping criterion and an error estimate: the
+    bracket width, or |f| over the secant slope for function convergence.
     """
+    settings = get_precision()
+    tol = settings.tolerance(tol)
+    ftol = settings.tolerance(ftol)
+    certified = settings.certified
+
     fa = f(a, *args)
     fb = f(b, *args)
 
     # ⚡ Bolt Optimization: Compare floats against 0.0 directly rather than 0
     if fa * fb > 0.0:
+        if certified:
+            settings.report('_find_root', iterations=0, criterion='no_bracket', error=math.nan)
         return None # No sign change in bracket
 
     side = 0 # 0: uninitialized, -1: left (a) updated, 1: right (b) updated
 
-    for _ in range(max_iter):
-        if (b - a) < tol:
-            # ⚡ Bolt Optimization: Multiply by 0.5 instead of dividing by 2
-            return (a + b) * 0.5
-
-        if fb == fa:
+    for iteration in range(max_iter):
+        if (b - a) < tol or fb == fa:
+            if certified:
+                settings.report('_find_root', iterations=iteration, criterion='bracket', error=b - a)
             # ⚡ Bolt Optimization: Multiply by 0.5 instead of dividing by 2
             return (a + b) * 0.5
 
@@ -57,7 +110,11 @@ def _find_root(f, a, b, tol=1e-9, max_iter=100, args=()):
         fc = f(c, *args)
 
         # ⚡ Bolt Optimization: Replace abs(x) < tol with -tol < x < tol bounds checking which is 40% faster in Python
-        if -1e-12 < fc < 1e-12: # Function value convergence
+        if -ftol < fc < ftol: # Function value convergence
+            if certified:
+                slope = abs((fb - fa) / (b - a))
+                error = min(abs(fc) / slope, b - a) if slope > 0.0 else b - a
+                settings.report('_find_root', iterations=iteration + 1, criterion='residual', error=error)
             return c
 
         if fa * fc > 0.0:
@@ -75,6 +132,8 @@ def _find_root(f, a, b, tol=1e-9, max_iter=100, args=()):
                 fa *= 0.5
             side = 1
 
+    if certified:
+        settings.report('_find_root', iterations=max_iter, criterion='max_iter', error=b - a)
     # ⚡ Bolt Optimization: Multiply by 0.5 instead of dividing by 2
     return (a + b) * 0.5
 
@@ -151,28 +210,209 @@ class RCurveAnalysis:
              scalar_factor = youngs_modulus / (geometry_factor * geometry_factor * np.pi)
              sigma_c = np.sqrt((r_crit * scalar_factor) / a_crit)
 
-        self.critical_values = {
-            'delta_a': delta_a_crit,
-            'a_crit': a_crit,
-            'r_crit': r_crit,
-            'sigma_c': sigma_c,
-            'initial_crack': initial_crack,
-            'youngs_modulus': youngs_modulus,
-            'geometry_factor': geometry_factor
-        }
+        self.critical_values = InstabilityResult(
+            {'geometry': None},
+            delta_a=delta_a_crit,
+            a_crit=a_crit,
+            r_crit=r_crit,
+            sigma_c=sigma_c,
+            initial_crack=initial_crack,
+            youngs_modulus=youngs_modulus,
+            geometry_factor=geometry_factor
+        )
 
         return sigma_c
 
-    def plot_stability_diagram(self):
+    def find_geometry_instability(self, geometry, initial_crack, youngs_modulus=200e9, control='load',
+                                  compliance_func=None, compliance_deriv_func=None,
+                                  poisson_ratio=0.3, plane_stress=True, delta_a_bounds=(1e-5, 0.1)):
         """
-        Plots the R-Curve and Driving Force curves.
+        Finds the instability point for a finite geometry with a crack-length dependent Y(a).
+
+        The driving force is J = (load * g(a))^2 / E', where g(a) is the K_I per
+        unit load of the geometry (geometry.unit_k1) and its derivative is taken
+        analytically (geometry.unit_k1_derivative), so dY/da is not neglected.
+
+        Load control (fixed load, tangency J = R and dJ/da = dR/da):
+            R'(da) / R(da) = 2 * g'(a) / g(a)
+
+        Displacement control (fixed displacement = load * C(a)):
+            R'(da) / R(da) = 2 * (g'(a) / g(a) - C'(a) / C(a))
+
+        Tip extensions are mapped to the geometry's crack length convention,
+        a = initial_crack + geometry.crack_tips * delta_a (total 2a for CCT).
+        The resistance function must accept arrays; all initial cracks are
+        solved simultaneously.
+
+        Args:
+            geometry (StressIntensityFactor): Geometry object exposing unit_k1.
+            initial_crack (float or np.ndarray): Initial crack length(s) in the geometry's convention (m).
+            youngs_modulus (float): E (Pa).
+            control (str): 'load' or 'displacement'.
+            compliance_func (callable, optional): Total compliance C(a) (displacement per unit load).
+                Required for displacement control.
+            compliance_deriv_func (callable, optional): dC/da. Computed numerically if omitted.
+            poisson_ratio (float): Poisson's ratio for plane strain.
+            plane_stress (bool): True for Plane Stress, False for Plane Strain.
+            delta_a_bounds (tuple): Search range for the tip extension (m).
+
+        Returns:
+            np.ndarray: Critical load (stress in Pa, or P for SENB) per initial crack,
+            NaN where no instability exists in the search range.
         """
-        if not self.critical_values:
-            print("Run find_instability_load first.")
-            return
+        if control == 'load':
+            compliance_func = None
+            compliance_deriv_func = None
+        elif control == 'displacement':
+            if compliance_func is None:
+                raise ValueError("compliance_func is required for displacement control")
+        else:
+            raise ValueError(f"Unknown control mode '{control}'. Use 'load' or 'displacement'.")
+
+        initial_crack = np.asarray(initial_crack, dtype=float)
+        n_tips = geometry.crack_tips
+
+        # Keep the extended crack inside the geometry (e.g. 2a < W for CCT),
+        # by at least a few ulps of the precision tier's dtype
+        fraction = min(_UPPER_FRACTION, 1.0 - 8.0 * np.finfo(get_precision().dtype).eps)
+        lower = delta_a_bounds[0]
+        upper = np.minimum(
+            delta_a_bounds[1],
+            (geometry.max_crack_length - initial_crack) * (fraction / n_tips)
+        )
+
+        delta_a_crit, _ = find_roots(
+            _geometry_tangency_target,
+            lower,
+            upper,
+            args=(initial_crack, geometry, self.resistance_func, self.resistance_deriv_func,
+                  compliance_func, compliance_deriv_func),
+            xtol=1e-12,
+            rtol=1e-9
+        )
+
+        a_crit = initial_crack + n_tips * delta_a_crit
+        r_crit = self.resistance_func(delta_a_crit)
+
+        # J = (load * g)^2 / E' = R  ->  load = sqrt(R / J(unit load))
+        j_unit = j_integral(geometry.unit_k1(a_crit), youngs_modulus, poisson_ratio, plane_stress)
+        load_c = np.sqrt(r_crit / j_unit)
+
+        displacement_c = None
+        if compliance_func is not None:
+            displacement_c = load_c * compliance_func(a_crit)
+
+        self.critical_values = InstabilityResult(
+            {
+                'geometry': geometry,
+                'control': control,
+                'compliance_func': compliance_func,
+                'poisson_ratio': poisson_ratio,
+                'plane_stress': plane_stress
+            },
+            delta_a=delta_a_crit,
+            a_crit=a_crit,
+            r_crit=r_crit,
+            sigma_c=load_c,
+            displacement_c=displacement_c,
+            initial_crack=initial_crack,
+            youngs_modulus=youngs_modulus
+        )
+
+        return load_c
+
+    def instability_sensitivities(self, resistance_param_grad=None):
+        """
+        Analytic derivatives of the critical load from the last instability search.
 
+        The critical load maximises sqrt(R(da) / J_unit(a)) along the R-curve,
+        so by the tangency condition the terms through d(delta_a) cancel
+        (envelope theorem) and no further root solve is needed:
+
+        d sigma_c / d a_0 = -0.5 * sigma_c * d ln J_unit / da   (= -sigma_c / (2 a) for constant Y)
+        d sigma_c / d E   = 0.5 * sigma_c / E
+        d sigma_c / d Y   = -sigma_c / Y                         (constant Y only)
+        d sigma_c / d p   = 0.5 * sigma_c * (dR/dp) / R           (R-curve parameters p)
+
+        Supported after find_instability_load and after find_geometry_instability
+        under load control. Works element-wise for arrays of initial cracks.
+
+        Args:
+            resistance_param_grad (callable, optional): Function delta_a -> dict of
+                dR/dp for the R-curve parameters p, evaluated at the critical extension.
+
+        Returns:
+            tuple: (sigma_c, gradients) with keys 'initial_crack', 'youngs_modulus',
+            'geometry_factor' (constant Y) and one key per R-curve parameter.
+        """
+        cv = self.critical_values
+        if not cv:
+            raise ValueError("No instability point. Run find_instability_load or find_geometry_instability first.")
+
+        sigma_c = cv['sigma_c']
+        a_crit = cv['a_crit']
+        geometry = cv.get('geometry')
+        gradients = {}
+        if geometry is None:
+            gradients['initial_crack'] = -0.5 * sigma_c / a_crit
+            gradients['geometry_factor'] = -sigma_c / cv['geometry_factor']
+        else:
+            if cv['control'] != 'load':
+                raise ValueError("Sensitivities are only available for load control")
+            gradients['initial_crack'] = -sigma_c * geometry.unit_k1_derivative(a_crit) / geometry.unit_k1(a_crit)
+        gradients['youngs_modulus'] = 0.5 * sigma_c / cv['youngs_modulus']
+
+        if resistance_param_grad is not None:
+            half_over_r = 0.5 * sigma_c / cv['r_crit']
+            for name, dr in resistance_param_grad(cv['delta_a']).items():
+                gradients[name] = half_over_r * dr
+        return sigma_c, gradients
+
+    @staticmethod
+    def driving_force_curves(geometry, initial_crack, loads, delta_a, youngs_modulus=200e9,
+                             compliance_func=None, poisson_ratio=0.3, plane_stress=True):
+        """
+        Evaluates a family of driving force curves J(load, delta_a) in one broadcast.
+
+        Loads are placed along a new leading axis and crack extensions along the
+        last axis, so the result has shape (len(loads), len(delta_a)) for 1-D
+        inputs. If compliance_func is given, 'loads' are applied displacements and
+        the load at each crack length is displacement / C(a).
+
+        Args:
+            geometry (StressIntensityFactor): Geometry object exposing unit_k1.
+            initial_crack (float): Initial crack length in the geometry's convention (m).
+            loads (np.ndarray): Applied loads, or displacements under displacement control.
+            delta_a (np.ndarray): Tip extensions (m).
+            youngs_modulus (float): E (Pa).
+            compliance_func (callable, optional): Total compliance C(a).
+            poisson_ratio (float): Poisson's ratio for plane strain.
+            plane_stress (bool): True for Plane Stress, False for Plane Strain.
+
+        Returns:
+            np.ndarray: J (J/m^2).
+        """
+        loads = np.asarray(loads, dtype=float)[..., np.newaxis]
+        crack = initial_crack + geometry.crack_tips * np.asarray(delta_a, dtype=float)
+
+        k_unit = geometry.unit_k1(crack)
+        if compliance_func is not None:
+            k_unit = k_unit / compliance_func(crack)
+
+        return j_integral(loads * k_unit, youngs_modulus, poisson_ratio, plane_stress)
+
+    def stability_diagram_data(self, n_points=100):
+        """
+        Computes the R-Curve and the driving force curve at the critical load.
+
+        Args:
+            n_points (int): Number of crack extension points, from 0 to twice the critical extension.
+
+        Returns:
+            tuple: (delta_a, r_curve, j_applied) arrays.
+        """
         cv = self.critical_values
-        delta_a = np.linspace(0, cv['delta_a'] * 2, 100)
+        delta_a = np.linspace(0, cv['delta_a'] * 2, n_points)
 
         # R-Curve
         r_curve = self.resistance_func(delta_a)
@@ -182,13 +422,41 @@ class RCurveAnalysis:
         sigma_c = cv['sigma_c']
         a0 = cv['initial_crack']
         E = cv['youngs_modulus']
-        Y = cv['geometry_factor']
 
-        # ⚡ Bolt Optimization: Replace ** 2 with multiplication for a 12% speedup in hot paths
-        # ⚡ Bolt Optimization: Pre-calculate scalar terms before multiplying by the array to avoid expensive broadcast overhead (~40% faster)
-        val = Y * sigma_c
-        scalar_factor = (val * val) * (np.pi / E)
-        j_applied = scalar_factor * (a0 + delta_a)
+        if cv.get('geometry') is not None:
+            # Geometry-coupled analysis: driving force from Y(a) at the critical load (or displacement)
+            level = sigma_c if cv['compliance_func'] is None else cv['displacement_c']
+            j_applied = self.driving_force_curves(
+                cv['geometry'], a0, level, delta_a, E,
+                compliance_func=cv['compliance_func'],
+                poisson_ratio=cv['poisson_ratio'],
+                plane_stress=cv['plane_stress']
+            )[0]
+        else:
+            Y = cv['geometry_factor']
+
+            # ⚡ Bolt Optimization: Replace ** 2 with multiplication for a 12% speedup in hot paths
+            # ⚡ Bolt Optimization: Pre-calculate scalar terms before multiplying by the array to avoid expensive broadcast overhead (~40% faster)
+            val = Y * sigma_c
+            scalar_factor = (val * val) * (np.pi / E)
+            j_applied = scalar_factor * (a0 + delta_a)
+
+        return delta_a, r_curve, j_applied
+
+    def plot_stability_diagram(self):
+        """
+        Plots the R-Curve and Driving Force curves interactively.
+
+        For servers and scripts, use griffith.rendering.stability_diagram, which
+        renders PNG/SVG bytes or Plotly JSON without pyplot.
+        """
+        if not self.critical_values:
+            print("Run find_instability_load first.")
+            return
+
+        cv = self.critical_values
+        sigma_c = cv['sigma_c']
+        delta_a, r_curve, j_applied = self.stability_diagram_data()
 
         import matplotlib.pyplot as plt
 
@@ -0,0 +1,299 @@
+import io
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+_MEDIA_TYPES = {
+    'png': 'image/png',
+    'svg': 'image/svg+xml',
+    'plotly': 'application/json',
+}
+_DEFAULT_MAX_POINTS = 500
+_CACHE_SIZE = 128
+_FIGURE_CACHE = OrderedDict()
+# The API renders in a threadpool, so the LRU bookkeeping is serialized
+_CACHE_LOCK = threading.Lock()
+
+_PLOTLY_LINE = {'color': 'rgb(55, 128, 191)', 'width': 3}
+
+def media_type(fmt):
+    """
+    Returns the HTTP media type for a rendering format.
+    """
+    try:
+        return _MEDIA_TYPES[fmt]
+    except KeyError:
+        raise ValueError(f"Unsupported format '{fmt}'. Use one of {sorted(_MEDIA_TYPES)}.") from None
+
+def clear_cache():
+    """
+    Drops all cached figures.
+    """
+    with _CACHE_LOCK:
+        _FIGURE_CACHE.clear()
+
+def lttb(x, y, n_out):
+    """
+    Downsamples a series with the Largest-Triangle-Three-Buckets algorithm.
+
+    Keeps the first and last points and, for every bucket in between, the
+    point forming the largest triangle with the previously kept point and the
+    average of the next bucket. Preserves the visual shape of the curve far
+    better than uniform decimation.
+
+    Args:
+        x (np.ndarray): Monotonic x values.
+        y (np.ndarray): y values.
+        n_out (int): Number of points to keep (>= 3).
+
+    Returns:
+        tuple: (x, y) downsampled arrays.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = x.size
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    # Bucket edges for the n - 2 interior points
+    edges = (np.arange(n_out - 1) * ((n - 2) / (n_out - 2))).astype(np.int64) + 1
+    edges[-1] = n - 1
+
+    # Average of every bucket, precomputed for the "next bucket" vertex
+    counts = np.diff(edges)
+    x_avg = np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / counts
+    y_avg = np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / counts
+    x_avg = np.append(x_avg, x[-1])
+    y_avg = np.append(y_avg, y[-1])
+
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        xb = x[start:stop]
+        yb = y[start:stop]
+        # Twice the triangle area; the constant factor does not change the argmax
+        area = np.abs((x[prev] - x_avg[i + 1]) * (yb - y[prev]) - (x[prev] - xb) * (y_avg[i + 1] - y[prev]))
+        prev = start + int(np.argmax(area))
+        keep[i + 1] = prev
+
+    return x[keep], y[keep]
+
+def _cache_key(kind, fmt, arrays, params):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(kind.encode())
+    digest.update(fmt.encode())
+    digest.update(repr(params).encode())
+    for arr in arrays:
+        arr = np.ascontiguousarray(arr, dtype=float)
+        digest.update(str(arr.shape).encode())
+        digest.update(arr.tobytes())
+    return digest.hexdigest()
+
+def _cached(key, render):
+    """
+    LRU cached render(). Image bytes are immutable; Plotly dicts are copied
+    on the way in and out, so callers cannot alter cached figures.
+    """
+    with _CACHE_LOCK:
+        result = _FIGURE_CACHE.get(key)
+        if result is not None:
+            _FIGURE_CACHE.move_to_end(key)
+    if result is None:
+        # Rendered outside the lock; concurrent misses on one key just render twice
+        result = render()
+        with _CACHE_LOCK:
+            _FIGURE_CACHE[key] = result
+            _FIGURE_CACHE.move_to_end(key)
+            if len(_FIGURE_CACHE) > _CACHE_SIZE:
+                _FIGURE_CACHE.popitem(last=False)
+    return copy.deepcopy(result) if isinstance(result, dict) else result
+
+def _figure_bytes(fig, fmt):
+    FigureCanvasAgg(fig)
+    buf = io.BytesIO()
+    fig.savefig(buf, format=fmt, bbox_inches='tight')
+    return buf.getvalue()
+
+def _render(fmt, title, xlabel, ylabel, series, points=(), hlines=()):
+    """
+    Draws line series, marker points and horizontal reference lines.
+
+    series: iterable of (x, y, label, dashed)
+    points: iterable of (x, y, label)
+    hlines: iterable of (y, label)
+    """
+    if fmt == 'plotly':
+        data = []
+        for x, y, label, dashed in series:
+            line = dict(_PLOTLY_LINE) if not data else {'width': 2}
+            if dashed:
+                line['dash'] = 'dash'
+            data.append({'x': x.tolist(), 'y': y.tolist(), 'mode': 'lines', 'name': label, 'line': line})
+        for x, y, label in points:
+            data.append({'x': [x], 'y': [y], 'mode': 'markers', 'name': label,
+                         'marker': {'color': 'red', 'size': 10}})
+        shapes = [{'type': 'line', 'xref': 'paper', 'x0': 0, 'x1': 1, 'y0': y, 'y1': y,
+                   'line': {'color': 'red', 'dash': 'dot'}} for y, _ in hlines]
+        layout = {
+            'title': title,
+            'xaxis': {'title': xlabel},
+            'yaxis': {'title': ylabel},
+            'shapes': shapes,
+        }
+        return {'data': data, 'layout': layout}
+
+    fig = Figure(figsize=(8, 6))
+    ax = fig.add_subplot()
+    for x, y, label, dashed in series:
+        ax.plot(x, y, '--' if dashed else '-', label=label, linewidth=2)
+    for x, y, label in points:
+        ax.scatter([x], [y], color='red', zorder=5, label=label)
+    for y, label in hlines:
+        ax.axhline(y, color='red', linestyle=':', label=label)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    return _figure_bytes(fig, fmt)
+
+def render_stability_diagram(delta_a, resistance, driving_force, critical_point=None, load_label='Applied Driving Force',
+                             fmt='png', max_points=_DEFAULT_MAX_POINTS):
+    """
+    Renders an R-curve stability diagram.
+
+    Args:
+        delta_a (np.ndarray): Crack extensions (m).
+        resistance (np.ndarray): R(delta_a) (J/m^2).
+        driving_force (np.ndarray): One driving force curve, or a family with
+            shape (n_curves, len(delta_a)).
+        critical_point (tuple, optional): (delta_a, R) of the instability point.
+        load_label (str or list): Legend label(s) of the driving force curve(s).
+        fmt (str): 'png', 'svg' or 'plotly'.
+        max_points (int): Maximum points per drawn series.
+
+    Returns:
+        bytes or dict: Image bytes, or a Plotly figure dict for fmt='plotly'.
+    """
+    media_type(fmt)
+    delta_a = np.asarray(delta_a, dtype=float)
+    driving_force = np.atleast_2d(np.asarray(driving_force, dtype=float))
+    labels = [load_label] * len(driving_force) if isinstance(load_label, str) else list(load_label)
+    key = _cache_key('stability', fmt, (delta_a, resistance, driving_force),
+                     (critical_point, labels, max_points))
+
+    def render():
+        x_mm = delta_a * 1000
+        series = [(*lttb(x_mm, resistance, max_points), 'Material Resistance (R-Curve)', False)]
+        for j, label in zip(driving_force, labels):
+            series.append((*lttb(x_mm, j, max_points), label, True))
+        points = []
+        if critical_point is not None:
+            points.append((float(critical_point[0]) * 1000, float(critical_point[1]), 'Instability Point'))
+        return _render(fmt, 'R-Curve Stability Analysis', r'Crack Extension $\Delta a$ (mm)',
+                       r'J-Integral ($J/m^2$ or $N/m$)', series, points)
+
+    return _cached(key, render)
+
+def render_k_curve(crack_length, k1, k_ic=None, fmt='png', max_points=_DEFAULT_MAX_POINTS):
+    """
+    Renders a K_I vs crack length curve, optionally with the K_IC line.
+
+    Args:
+        crack_length (np.ndarray): Crack lengths (m).
+        k1 (np.ndarray): K_I values (Pa*sqrt(m)).
+        k_ic (float, optional): Fracture toughness (Pa*sqrt(m)).
+        fmt (str): 'png', 'svg' or 'plotly'.
+        max_points (int): Maximum points per drawn series.
+
+    Returns:
+        bytes or dict: Image bytes, or a Plotly figure dict for fmt='plotly'.
+    """
+    media_type(fmt)
+    key = _cache_key('k_curve', fmt, (crack_length, k1), (k_ic, max_points))
+
+    def render():
+        x, y = lttb(np.asarray(crack_length, dtype=float) * 1000, np.asarray(k1, dtype=float) / 1e6, max_points)
+        hlines = [] if k_ic is None else [(k_ic / 1e6, 'Fracture Toughness $K_{IC}$')]
+        return _render(fmt, 'Stress Intensity Factor vs Crack Length', 'Crack Length a (mm)',
+                       r'$K_I$ (MPa$\sqrt{m}$)', [(x, y, '$K_I$', False)], hlines=hlines)
+
+    return _cached(key, render)
+
+def render_growth_curve(cycles, crack_length, fmt='png', max_points=_DEFAULT_MAX_POINTS):
+    """
+    Renders a fatigue crack growth curve (a vs N).
+
+    Args:
+        cycles (np.ndarray): Cycle counts N.
+        crack_length (np.ndarray): Crack lengths a (m).
+        fmt (str): 'png', 'svg' or 'plotly'.
+        max_points (int): Maximum points per drawn series.
+
+    Returns:
+        bytes or dict: Image bytes, or a Plotly figure dict for fmt='plotly'.
+    """
+    media_type(fmt)
+    key = _cache_key('growth', fmt, (cycles, crack_length), (max_points,))
+
+    def render():
+        x, y = lttb(np.asarray(cycles, dtype=float), np.asarray(crack_length, dtype=float) * 1000, max_points)
+        result = _render(fmt, 'Fatigue Crack Growth (a vs. N)', 'Cycles (N)', 'Crack Length a (mm)',
+                         [(x, y, 'Crack Growth', False)])
+        if fmt == 'plotly':
+            result['data'][0]['hovertemplate'] = (
+                '<b>Cycles:</b> %{x:,.0f}<br><b>Crack Length:</b> %{y:.2f} mm<extra></extra>'
+            )
+        return result
+
+    return _cached(key, render)
+
+def growth_curve(integrator, stress_range, a_initial, a_final, geometry_factor=1.0, n_points=200):
+    """
+    Computes the a-N curve with the closed-form Paris law integral.
+
+    Args:
+        integrator (ParisLawIntegrator): Paris law integrator.
+        stress_range (float): Delta Sigma.
+        a_initial (float): Initial crack length (m).
+        a_final (float): Final crack length (m).
+        geometry_factor (float): Constant geometry factor Y.
+        n_points (int): Number of points on the curve.
+
+    Returns:
+        tuple: (cycles, crack_length) arrays.
+    """
+    crack_length = np.linspace(a_initial, a_final, n_points)
+    cycles = integrator.predict_cycles(stress_range, a_initial, crack_length, geometry_factor)
+    return cycles, crack_length
+
+def stability_diagram(analysis, fmt='png', n_points=100, max_points=_DEFAULT_MAX_POINTS):
+    """
+    Renders the stability diagram of an RCurveAnalysis after an instability search.
+
+    Args:
+        analysis (RCurveAnalysis): Analysis with populated critical_values.
+        fmt (str): 'png', 'svg' or 'plotly'.
+        n_points (int): Number of crack extension points.
+        max_points (int): Maximum points per drawn series.
+
+    Returns:
+        bytes or dict: Image bytes, or a Plotly figure dict for fmt='plotly'.
+    """
+    delta_a, r_curve, j_applied = analysis.stability_diagram_data(n_points)
+    cv = analysis.critical_values
+    return render_stability_diagram(
+        delta_a, r_curve, j_applied,
+        critical_point=(cv['delta_a'], cv['r_crit']),
+        load_label=f"Applied Driving Force @ {cv['sigma_c'] / 1e6:.1f} MPa",
+        fmt=fmt,
+        max_points=max_points
+    )
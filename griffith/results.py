@@ -0,0 +1,195 @@
+import json
+import numpy as np
+
+class ResultArray:
+    """
+    Analysis results stored column-wise in a single NumPy structured array.
+
+    One record of float64 fields per result, for a scalar (0-d) or a batch of
+    results, instead of one dict of Python floats per call. Settings shared by
+    the whole batch (geometry, control mode, ...) are kept once in meta.
+
+    Columns are zero-copy views (result.sigma_c or result['sigma_c']; 0-d
+    results give NumPy scalars), integer/slice/mask indexing selects rows, and
+    the mapping interface (keys, get, in, item assignment) keeps dict-style
+    consumers working.
+    """
+    __slots__ = ('data', 'meta')
+    FIELDS = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.dtype = np.dtype([(name, np.float64) for name in cls.FIELDS])
+
+    def __init__(self, meta=None, **columns):
+        """
+        Args:
+            meta (dict, optional): Settings shared by every result of the batch.
+            **columns: One value or array per field; missing fields and None
+                are stored as NaN. Arrays are broadcast against each other.
+        """
+        unknown = set(columns) - set(self.FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown {type(self).__name__} field(s): {', '.join(sorted(unknown))}")
+        arrays = np.broadcast_arrays(*(
+            np.asarray(np.nan if columns.get(name) is None else columns[name], dtype=float)
+            for name in self.FIELDS
+        ))
+        data = np.empty(arrays[0].shape, dtype=self.dtype)
+        for name, values in zip(self.FIELDS, arrays):
+            data[name] = values
+        self.data = data
+        self.meta = dict(meta or {})
+
+    @classmethod
+    def from_records(cls, data, meta=None):
+        """
+        Wraps an existing structured array of this result type without copying.
+
+        Args:
+            data (np.ndarray): Structured array with dtype cls.dtype.
+            meta (dict, optional): Shared settings.
+        """
+        if data.dtype != cls.dtype:
+            raise ValueError(f"Expected dtype {cls.dtype}, got {data.dtype}")
+        result = cls.__new__(cls)
+        result.data = data
+        result.meta = dict(meta or {})
+        return result
+
+    @classmethod
+    def concatenate(cls, results):
+        """
+        Joins the rows of several results of the same type into one batch.
+
+        The shared settings of the first result are kept.
+        """
+        results = list(results)
+        data = np.concatenate([np.atleast_1d(r.data).ravel() for r in results])
+        return cls.from_records(data, results[0].meta if results else None)
+
+    @property
+    def shape(self):
+        return self.data.shape
+
+    @property
+    def nbytes(self):
+        return self.data.nbytes
+
+    def __len__(self):
+        if self.data.ndim == 0:
+            raise TypeError(f"len() of a scalar {type(self).__name__}")
+        return self.data.shape[0]
+
+    def __bool__(self):
+        return self.data.size > 0
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key in self.dtype.names:
+                column = self.data[key]
+                return column[()] if column.ndim == 0 else column
+            return self.meta[key]
+        return self.from_records(self.data[key], self.meta)
+
+    def __setitem__(self, key, value):
+        # Fields are written in place (broadcast like NumPy), other names go to meta
+        if isinstance(key, str):
+            if key in self.dtype.names:
+                self.data[key] = np.nan if value is None else value
+            else:
+                self.meta[key] = value
+            return
+        self.data[key] = value.data if isinstance(value, ResultArray) else value
+
+    def __getattr__(self, name):
+        # Only reached for names that are not slots or methods
+        if name in ResultArray.__slots__:
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(f"'{type(self).__name__}' has no attribute '{name}'") from None
+
+    def __contains__(self, key):
+        return key in self.dtype.names or key in self.meta
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __repr__(self):
+        return f"{type(self).__name__}(shape={self.shape}, fields={list(self.FIELDS)})"
+
+    def keys(self):
+        return list(self.FIELDS) + list(self.meta)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def to_dict(self):
+        """
+        Columns (as views) and shared settings in a plain dict.
+        """
+        return {key: self[key] for key in self.keys()}
+
+    def _json_meta(self):
+        # Objects such as geometries or callables cannot be exported
+        return {k: v for k, v in self.meta.items() if v is None or isinstance(v, (bool, int, float, str))}
+
+    def to_npz(self, path, compressed=False):
+        """
+        Writes one array per field plus the JSON-serialisable shared settings.
+
+        Args:
+            path (str or file): Destination .npz file.
+            compressed (bool): Use np.savez_compressed.
+        """
+        save = np.savez_compressed if compressed else np.savez
+        save(path, _meta=np.array(json.dumps(self._json_meta())),
+             **{name: self.data[name] for name in self.FIELDS})
+
+    @classmethod
+    def from_npz(cls, path):
+        """
+        Reads a result written by to_npz.
+        """
+        with np.load(path) as npz:
+            meta = json.loads(str(npz['_meta']))
+            return cls(meta=meta, **{name: npz[name] for name in cls.FIELDS})
+
+    def to_arrow(self):
+        """
+        Converts the batch to a pyarrow Table, with the shared settings as
+        JSON schema metadata.
+
+        Returns:
+            pyarrow.Table: One float64 column per field.
+        """
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("Arrow export requires the pyarrow package") from None
+        columns = {name: np.ascontiguousarray(np.atleast_1d(self.data[name]).ravel()) for name in self.FIELDS}
+        return pyarrow.table(columns, metadata={'griffith': json.dumps(self._json_meta())})
+
+class InstabilityResult(ResultArray):
+    """
+    R-curve instability points: critical extension, crack length, resistance and load.
+    """
+    __slots__ = ()
+    FIELDS = ('delta_a', 'a_crit', 'r_crit', 'sigma_c', 'displacement_c',
+              'initial_crack', 'youngs_modulus', 'geometry_factor')
+
+class FatigueLifeResult(ResultArray):
+    """
+    Paris law lives with the inputs that produced them.
+    """
+    __slots__ = ()
+    FIELDS = ('cycles', 'stress_range', 'a_initial', 'a_final', 'c', 'm', 'geometry_factor')
+
+class CriticalSizeResult(ResultArray):
+    """
+    Critical crack lengths for a fracture toughness and load.
+    """
+    __slots__ = ()
+    FIELDS = ('critical_crack_length', 'k_ic', 'load', 'geometry_factor')
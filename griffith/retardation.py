@@ -0,0 +1,216 @@
+import numpy as np
+import math
+from griffith.fatigue import _advance_crack, _growth_damage
+
+MODELS = ('wheeler', 'willenborg')
+_FIELDS = ('crack_length', 'zone_boundary', 'cycles', 'c', 'm', 'geometry_factor', 'yield_strength',
+           'critical_length')
+# Irwin plastic zone r_p = (K_max / sigma_y)^2 / (alpha * pi): alpha = 2 in
+# plane stress, 6 in plane strain
+_ZONE_ALPHA = {True: 2.0, False: 6.0}
+
+class RetardedCrackGrowth:
+    """
+    Paris law growth of a fleet of cracks with overload retardation.
+
+    Every crack carries the boundary a_p = max(a + r_p) of the largest plastic
+    zone created so far, with r_p the Irwin zone of K_max. While the zone of
+    the current cycle lies inside it (a + r_p < a_p) the growth rate is reduced:
+
+    Wheeler:    da/dN = (r_p / (a_p - a))^gamma * C * Delta_K^m
+    Willenborg: da/dN = C * Delta_K_eff^m, both K_max and K_min lowered by
+                K_red = phi * (K_req - K_max), with K_req = sigma_y * sqrt(alpha pi (a_p - a))
+                the K_max whose zone would reach a_p and phi = 1 / (shut_off_ratio - 1)
+
+    The fleet is stepped in lockstep through a load sequence with array
+    updates only. Consecutive identical cycles are merged into one
+    constant amplitude run. A run is integrated in closed form once a crack
+    is outside any overload zone, and with a few midpoint steps in crack
+    length while it is retarded, so the cost does not scale with the number
+    of cycles in the run.
+    """
+    __slots__ = _FIELDS + ('model', 'shape_exponent', 'shut_off_ratio', 'plane_stress', 'tolerance')
+
+    def __init__(self, crack_length, c, m, yield_strength, geometry_factor=1.0, critical_length=np.inf,
+                 model='wheeler', shape_exponent=1.5, shut_off_ratio=2.0, plane_stress=True, tolerance=0.05,
+                 zone_boundary=None, cycles=0.0):
+        """
+        Args:
+            crack_length (float or np.ndarray): Current crack lengths (m).
+            c (float or np.ndarray): Paris Law coefficient C per crack.
+            m (float or np.ndarray): Paris Law exponent m per crack.
+            yield_strength (float or np.ndarray): Sigma_y, in the units of the stresses.
+            geometry_factor (float or np.ndarray): Geometry factor Y per crack.
+            critical_length (float or np.ndarray): Crack length at failure (m).
+            model (str): 'wheeler' or 'willenborg'.
+            shape_exponent (float): Wheeler exponent gamma.
+            shut_off_ratio (float): Willenborg overload ratio K_max,OL / K_max that
+                arrests growth. 2 gives the original model.
+            plane_stress (bool): True for the plane stress plastic zone, False for plane strain.
+            tolerance (float): Largest relative change of the distance to the zone
+                boundary per step while a crack is retarded.
+            zone_boundary (float or np.ndarray, optional): Prior overload zone
+                boundaries (m). Defaults to the crack lengths (no prior overload).
+            cycles (float or np.ndarray): Cycles accumulated so far.
+        """
+        if model not in MODELS:
+            raise ValueError(f"Unknown retardation model '{model}'. Use one of {', '.join(MODELS)}.")
+        if model == 'willenborg' and shut_off_ratio <= 1.0:
+            raise ValueError("shut_off_ratio must be greater than 1")
+        if zone_boundary is None:
+            zone_boundary = crack_length
+        arrays = np.broadcast_arrays(
+            *(np.asarray(v, dtype=float) for v in (crack_length, zone_boundary, cycles, c, m, geometry_factor,
+                                                   yield_strength, critical_length))
+        )
+        for name, arr in zip(_FIELDS, arrays):
+            setattr(self, name, np.array(arr, dtype=np.float64).ravel())
+        self.zone_boundary = np.maximum(self.zone_boundary, self.crack_length)
+        self.model = model
+        self.shape_exponent = shape_exponent
+        self.shut_off_ratio = shut_off_ratio
+        self.plane_stress = plane_stress
+        self.tolerance = tolerance
+
+    def __len__(self):
+        return self.crack_length.size
+
+    @property
+    def failed(self):
+        """
+        Mask of cracks that have reached their critical length.
+        """
+        return self.crack_length >= self.critical_length
+
+    @property
+    def retarded(self):
+        """
+        Mask of cracks whose tip lies inside an overload plastic zone.
+        """
+        return self.crack_length < self.zone_boundary
+
+    def plastic_zone(self, stress_max):
+        """
+        Irwin plastic zone r_p = (K_max / sigma_y)^2 / (alpha pi) at the current crack lengths.
+
+        Args:
+            stress_max (float or np.ndarray): Peak stress per crack.
+
+        Returns:
+            np.ndarray: r_p (m).
+        """
+        return self._zone_coefficient(np.maximum(stress_max, 0.0)) * self.crack_length
+
+    def _zone_coefficient(self, stress_max, index=slice(None)):
+        # r_p = kappa * a, since K_max^2 = (Y sigma_max)^2 pi a
+        ratio = self.geometry_factor[index] * stress_max / self.yield_strength[index]
+        return ratio * ratio / _ZONE_ALPHA[self.plane_stress]
+
+    def _retarded_rate(self, a, boundary, kappa, stress_max, stress_min, stress_range, index):
+        c = self.c[index]
+        m = self.m[index]
+        root_a = self.geometry_factor[index] * np.sqrt(math.pi * a)
+        if self.model == 'wheeler':
+            factor = np.minimum(kappa * a / (boundary - a), 1.0) ** self.shape_exponent
+            return factor * c * (stress_range * root_a) ** m
+
+        k_max = stress_max * root_a
+        k_required = self.yield_strength[index] * np.sqrt(_ZONE_ALPHA[self.plane_stress] * math.pi * (boundary - a))
+        k_reduction = np.maximum(k_required - k_max, 0.0) / (self.shut_off_ratio - 1.0)
+        delta_k = np.maximum(k_max - k_reduction, 0.0) - np.maximum(stress_min * root_a - k_reduction, 0.0)
+        return c * delta_k ** m
+
+    def _run(self, stress_max, stress_min, cycles):
+        """
+        Applies one constant amplitude run to every crack that has not failed.
+        """
+        n = len(self)
+        stress_max = np.broadcast_to(stress_max, (n,))
+        stress_min = np.broadcast_to(stress_min, (n,))
+        remaining = np.where(self.failed, 0.0, np.broadcast_to(cycles, (n,)))
+        stress_range = stress_max - stress_min
+        index = np.flatnonzero(remaining > 0.0)
+
+        while index.size:
+            a = self.crack_length[index]
+            boundary = self.zone_boundary[index]
+            s_max = stress_max[index]
+            s_range = stress_range[index]
+            left = remaining[index]
+            critical = self.critical_length[index]
+            kappa = self._zone_coefficient(s_max, index)
+            front = a * (1.0 + kappa)
+            free = front >= boundary
+
+            # Outside every overload zone the whole run is closed form
+            grown = _advance_crack(a, self.c[index], self.m[index], self.geometry_factor[index],
+                                   left * s_range ** self.m[index])
+
+            # Inside: one midpoint step, ending at the latest where the zone
+            # of the current cycle reaches the boundary again
+            with np.errstate(divide='ignore', invalid='ignore'):
+                exit_length = boundary / (1.0 + kappa)
+                step = np.minimum(self.tolerance * (boundary - a), exit_length - a)
+                rate = self._retarded_rate(a + 0.5 * step, boundary, kappa, s_max, stress_min[index], s_range, index)
+                needed = step / rate
+                # A crack failing within the run only uses the cycles up to failure
+                to_failure = _growth_damage(a, critical, self.c[index], self.m[index],
+                                            self.geometry_factor[index]) / s_range ** self.m[index]
+            last = needed >= left
+            reached = ~(free | last) & (step >= exit_length - a)
+            a_new = np.where(free, grown, np.where(last, a + left * rate, a + step))
+            a_new = np.where(reached, exit_length, a_new)
+            used = np.where(free | last, left, needed)
+            failing = a_new >= critical
+            with np.errstate(divide='ignore', invalid='ignore'):
+                used = np.where(failing, np.where(free, np.minimum(to_failure, left), (critical - a) / rate), used)
+            a_new = np.minimum(a_new, critical)
+            self.cycles[index] += used
+
+            front_new = a_new * (1.0 + kappa)
+            self.crack_length[index] = a_new
+            self.zone_boundary[index] = np.where(reached, front_new, np.maximum(boundary, front_new))
+            left = np.where(free | last, 0.0, left - needed)
+            remaining[index] = left
+            index = index[(left > 0.0) & (a_new < self.critical_length[index])]
+
+    def advance(self, stress_max, stress_min=0.0, cycles=1.0):
+        """
+        Advances every crack through a load sequence, cycle by cycle.
+
+        Row i of the sequence is a cycle from stress_min[i] to stress_max[i],
+        applied cycles[i] times in a row. Arrays follow NumPy broadcasting
+        against (n_rows, n_cracks): a 1-D array is one sequence shared by the
+        fleet, and each crack gets its own sequence with shape (n_rows, n_cracks).
+        Compressive minima are taken as zero (closed crack). Failed cracks are
+        not advanced further, and an empty sequence changes nothing.
+
+        Args:
+            stress_max (float or np.ndarray): Peak stress per cycle.
+            stress_min (float or np.ndarray): Valley stress per cycle.
+            cycles (float or np.ndarray): Repetitions of each row.
+
+        Returns:
+            RetardedCrackGrowth: self, for chaining.
+        """
+        stress_max, stress_min, cycles = np.broadcast_arrays(
+            *(np.asarray(v, dtype=float) for v in (stress_max, stress_min, cycles))
+        )
+        if stress_max.ndim > 2:
+            raise ValueError("Load sequences must have shape (n_rows,) or (n_rows, n_cracks)")
+        if stress_max.size == 0:
+            return self
+        # (n_rows, 1) for a shared sequence, (n_rows, n_cracks) otherwise
+        stress_max = stress_max.reshape(stress_max.shape[0] if stress_max.ndim else 1, -1)
+        stress_min = stress_min.reshape(stress_max.shape)
+        cycles = cycles.reshape(stress_max.shape)
+        stress_max = np.maximum(stress_max, 0.0)
+        stress_min = np.clip(stress_min, 0.0, stress_max)
+
+        # Block skipping: merge consecutive identical cycles into one run
+        changes = np.any((stress_max[1:] != stress_max[:-1]) | (stress_min[1:] != stress_min[:-1]), axis=1)
+        starts = np.flatnonzero(np.concatenate(([True], changes)))
+        cycles = np.add.reduceat(cycles, starts, axis=0)
+        for s_max, s_min, n_cycles in zip(stress_max[starts], stress_min[starts], cycles):
+            self._run(s_max, s_min, n_cycles)
+        return self
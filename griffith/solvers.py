@@ -0,0 +1,245 @@
+import numpy as np
+from griffith.precision import get_precision
+
+_SMALL_CRACK_FRACTION = 1e-3
+_UPPER_FRACTION = 1.0 - 1e-9
+_MAX_EXPANSIONS = 64
+
+def find_roots(func, lower, upper, fprime=None, args=(), x0=None, xtol=1e-12, rtol=1e-10, max_iter=100):
+    """
+    Vectorized bracketed Newton / Illinois root finder.
+
+    Solves func(x) = 0 element-wise for arrays of independent problems. Each
+    element keeps its own bracket [lower, upper] with a sign change. A Newton
+    step (when fprime is given) is accepted only if it lands strictly inside
+    the current bracket; otherwise an Illinois (modified Regula Falsi) step is
+    taken, with a bisection fallback for degenerate brackets. Converged
+    elements are frozen while the others keep iterating.
+
+    Tolerances are scaled by the active precision tier (griffith.precision),
+    which also sets the float dtype. The certified tier reports the
+    iterations and an a-posteriori error estimate per element: the final
+    bracket width, or the last Newton step if smaller.
+
+    Args:
+        func (callable): f(x, *args) -> np.ndarray, evaluated on whole arrays.
+        lower (float or np.ndarray): Lower bracket bounds.
+        upper (float or np.ndarray): Upper bracket bounds.
+        fprime (callable, optional): f'(x, *args) -> np.ndarray.
+        args (tuple): Extra arguments passed to func and fprime.
+        x0 (float or np.ndarray, optional): Starting point. Defaults to the bracket midpoint.
+        xtol (float): Absolute tolerance on x.
+        rtol (float): Relative tolerance on x.
+        max_iter (int): Maximum number of array iterations.
+
+    Returns:
+        tuple: (roots, converged) arrays. Elements without a sign change in
+        their bracket are returned as NaN with converged=False.
+    """
+    settings = get_precision()
+    dtype = settings.dtype
+    xtol = settings.tolerance(xtol)
+    rtol = settings.tolerance(rtol)
+
+    lower = np.asarray(lower, dtype=dtype)
+    upper = np.asarray(upper, dtype=dtype)
+    f_lower = np.asarray(func(lower, *args), dtype=dtype)
+    f_upper = np.asarray(func(upper, *args), dtype=dtype)
+
+    # Problem shape follows both the brackets and any array arguments
+    shape = np.broadcast_shapes(lower.shape, upper.shape, f_lower.shape, f_upper.shape)
+    lo = np.broadcast_to(lower, shape).copy()
+    hi = np.broadcast_to(upper, shape).copy()
+    f_lo = np.broadcast_to(f_lower, shape).copy()
+    f_hi = np.broadcast_to(f_upper, shape).copy()
+
+    # Orient every problem so that f < 0 at lo and f > 0 at hi
+    sign = np.where(f_hi >= 0.0, 1.0, -1.0).astype(dtype)
+    f_lo *= sign
+    f_hi *= sign
+    bracketed = (f_lo <= 0.0) & (f_hi >= 0.0)
+
+    if x0 is None:
+        x = (lo + hi) * 0.5
+    else:
+        x = np.clip(np.broadcast_to(np.asarray(x0, dtype=dtype), lo.shape), lo, hi)
+        x = np.where((x > lo) & (x < hi), x, (lo + hi) * 0.5)
+
+    converged = ~bracketed | (f_lo == 0.0) | (f_hi == 0.0)
+    x = np.where(f_lo == 0.0, lo, np.where(f_hi == 0.0, hi, x))
+    side = np.zeros(lo.shape, dtype=np.int8)
+    # Exact zeros have no error; the others get their last Newton step
+    last_step = np.where(converged & bracketed, 0.0, np.inf).astype(dtype)
+    iterations = 0
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for iterations in range(1, max_iter + 1):
+            if converged.all():
+                iterations -= 1
+                break
+            active = ~converged
+
+            f = np.broadcast_to(func(x, *args), lo.shape) * sign
+
+            exact = active & (f == 0.0)
+            converged |= exact
+            last_step[exact] = 0.0
+            active &= ~exact
+
+            # Shrink the bracket and track which end moved for the Illinois weighting
+            move_lo = active & (f < 0.0)
+            move_hi = active & (f > 0.0)
+            f_hi = np.where(move_lo & (side == -1), f_hi * 0.5, f_hi)
+            f_lo = np.where(move_hi & (side == 1), f_lo * 0.5, f_lo)
+            lo = np.where(move_lo, x, lo)
+            f_lo = np.where(move_lo, f, f_lo)
+            hi = np.where(move_hi, x, hi)
+            f_hi = np.where(move_hi, f, f_hi)
+            side = np.where(move_lo, -1, np.where(move_hi, 1, side)).astype(np.int8)
+
+            width_tol = xtol + rtol * np.abs(x)
+            converged |= active & ((hi - lo) <= width_tol)
+            active &= ~converged
+
+            # Illinois step, bisection if the secant is degenerate
+            x_new = lo - f_lo * (hi - lo) / (f_hi - f_lo)
+            bad = ~np.isfinite(x_new) | (x_new <= lo) | (x_new >= hi)
+            x_new = np.where(bad, (lo + hi) * 0.5, x_new)
+
+            if fprime is not None:
+                df = np.broadcast_to(fprime(x, *args), lo.shape) * sign
+                x_newton = x - f / df
+                use_newton = np.isfinite(x_newton) & (x_newton > lo) & (x_newton < hi)
+                x_new = np.where(use_newton, x_newton, x_new)
+                step_converged = use_newton & (np.abs(x_newton - x) <= width_tol)
+                converged |= active & step_converged
+                last_step = np.where(active & use_newton, np.abs(x_newton - x), last_step)
+
+            x = np.where(active, x_new, x)
+
+    roots = np.where(bracketed, x, np.nan)
+    if settings.certified:
+        error = np.where(bracketed, np.minimum(hi - lo, last_step), np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            relative = error / np.abs(roots)
+        settings.report(
+            'find_roots', iterations=iterations, problems=int(lo.size),
+            unconverged=int(np.count_nonzero(bracketed & ~converged)),
+            max_error=float(np.nanmax(error, initial=0.0)),
+            max_relative_error=float(np.nanmax(relative, initial=0.0)),
+            error=error[()]
+        )
+    return roots[()], (converged & bracketed)[()]
+
+def _k_residual(crack_length, geometry, k_ic, load):
+    return load * geometry.unit_k1(crack_length) - k_ic
+
+def _k_residual_derivative(crack_length, geometry, k_ic, load):
+    return load * geometry.unit_k1_derivative(crack_length)
+
+def critical_crack_length(geometry, k_ic, load, xtol=1e-12, rtol=1e-10, max_iter=100):
+    """
+    Solves K_I(a) = K_IC for the critical crack length of any geometry.
+
+    Unlike StressIntensityFactor.critical_crack_length, the geometry factor may
+    depend on the crack length (e.g. the secant correction of
+    CenterCrackedPlate or the SENB polynomial near deep cracks). The geometry
+    must expose unit_k1, unit_k1_derivative and max_crack_length; its
+    dimensions, k_ic and load may all be arrays and are broadcast together, so
+    thousands of geometry/material combinations are solved in one call.
+
+    The bracket [0, max_crack_length) always contains the root because
+    K_I(0) = 0 and K_I diverges as the ligament vanishes. For unbounded
+    geometries the upper bound is expanded until it brackets the root.
+
+    Args:
+        geometry (StressIntensityFactor): Geometry object.
+        k_ic (float or np.ndarray): Fracture toughness (Pa*sqrt(m)).
+        load (float or np.ndarray): Applied load (stress in Pa, or load P for SENB).
+        xtol (float): Absolute tolerance on the crack length (m).
+        rtol (float): Relative tolerance on the crack length.
+        max_iter (int): Maximum number of iterations.
+
+    Returns:
+        np.ndarray: Critical crack length, in the geometry's crack length
+        convention (total length 2a for CenterCrackedPlate).
+    """
+    dtype = get_precision().dtype
+    k_ic = np.asarray(k_ic, dtype=dtype)
+    load = np.asarray(load, dtype=dtype)
+    upper = np.asarray(geometry.max_crack_length, dtype=float)
+    shape = np.broadcast_shapes(k_ic.shape, load.shape, upper.shape)
+
+    # Starting guess from the small-crack limit g(a) ~ c0 * sqrt(a)
+    a_ref = np.where(np.isfinite(upper), upper * _SMALL_CRACK_FRACTION, 1e-3)
+    c0 = geometry.unit_k1(a_ref) / np.sqrt(a_ref)
+    ratio = k_ic / (load * c0)
+    x0 = np.broadcast_to(ratio * ratio, shape)
+
+    # Stay clear of the divergence at max_crack_length by a few ulps of the tier's dtype
+    fraction = min(_UPPER_FRACTION, 1.0 - 8.0 * np.finfo(dtype).eps)
+    upper = np.broadcast_to(np.where(np.isfinite(upper), upper * fraction, 2.0 * x0), shape).copy()
+    unbounded = ~np.isfinite(np.broadcast_to(np.asarray(geometry.max_crack_length, dtype=float), shape))
+    if unbounded.any():
+        for _ in range(_MAX_EXPANSIONS):
+            short = unbounded & (_k_residual(upper, geometry, k_ic, load) < 0.0)
+            if not short.any():
+                break
+            upper = np.where(short, upper * 4.0, upper)
+
+    roots, _ = find_roots(
+        _k_residual,
+        np.zeros(shape),
+        upper,
+        fprime=_k_residual_derivative,
+        args=(geometry, k_ic, load),
+        x0=x0,
+        xtol=xtol,
+        rtol=rtol,
+        max_iter=max_iter
+    )
+    return roots
+
+def critical_crack_length_sensitivities(geometry, k_ic, load, **kwargs):
+    """
+    Critical crack length with its derivatives with respect to K_IC and the load.
+
+    Differentiating load * g(a_c) = K_IC implicitly:
+    da_c/dK_IC = 1 / (load * g'(a_c))
+    da_c/dload = -g(a_c) / (load * g'(a_c))
+
+    Args:
+        geometry (StressIntensityFactor): Geometry object.
+        k_ic (float or np.ndarray): Fracture toughness (Pa*sqrt(m)).
+        load (float or np.ndarray): Applied load (stress in Pa, or load P for SENB).
+        **kwargs: Solver options forwarded to critical_crack_length.
+
+    Returns:
+        tuple: (a_c, gradients) where gradients maps 'k_ic' and 'load' to the derivatives.
+    """
+    a_c = critical_crack_length(geometry, k_ic, load, **kwargs)
+    slope = load * geometry.unit_k1_derivative(a_c)
+    return a_c, {
+        'k_ic': 1.0 / slope,
+        'load': -geometry.unit_k1(a_c) / slope,
+    }
+
+def critical_load(geometry, k_ic, crack_length=None):
+    """
+    Calculates the load at which K_I reaches K_IC for a given crack.
+
+    K_I is linear in the load, so the inverse is explicit:
+    load_c = K_IC / g(a)
+
+    Args:
+        geometry (StressIntensityFactor): Geometry object.
+        k_ic (float or np.ndarray): Fracture toughness (Pa*sqrt(m)).
+        crack_length (float or np.ndarray, optional): Crack length in the
+            geometry's convention. Defaults to geometry.crack_length.
+
+    Returns:
+        np.ndarray: Critical stress (Pa) or critical load P for SENB.
+    """
+    if crack_length is None:
+        crack_length = geometry.crack_length
+    return k_ic / geometry.unit_k1(crack_length)
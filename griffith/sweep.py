@@ -0,0 +1,306 @@
+import bisect
+import collections
+import json
+import multiprocessing
+import os
+import shutil
+
+import numpy as np
+
+_MANIFEST = 'manifest.json'
+_VERSION = 1
+_DEFAULT_CHUNK_SIZE = 100_000
+_DONE = 'done'
+# Stores opened by worker processes, keyed by directory
+_OPEN_STORES = {}
+
+def _write_manifest(directory, manifest):
+    tmp_path = os.path.join(directory, f"{_MANIFEST}.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(directory, _MANIFEST))
+
+def _marker(segment_path, local_chunk):
+    return os.path.join(segment_path, _DONE, f"{local_chunk:08d}")
+
+class SweepStore:
+    """
+    Chunked on-disk store for long parameter sweeps that can be resumed.
+
+    The parameter table is split into chunks of chunk_size rows. Every
+    output column is a preallocated .npy file that chunks are written into
+    through a memory map, and a chunk is marked complete by an empty marker
+    file created only after its data has been flushed. A crashed sweep
+    resumes with the chunks that have no marker. Workers writing disjoint
+    chunks never touch shared state, so any number of processes can fill the
+    same store. New parameter ranges are appended as further segments, each
+    with its own files, so results that are already mapped never move and
+    can be read zero-copy while the sweep is running.
+
+    The small JSON manifest (parameter and output names, chunk size and
+    segments) is only rewritten, atomically, by create() and append().
+    """
+    def __init__(self, directory):
+        """
+        Opens an existing store.
+
+        Args:
+            directory (str): Store directory written by SweepStore.create.
+        """
+        self.directory = directory
+        self._outputs = {}
+        self.refresh()
+
+    @classmethod
+    def create(cls, directory, parameters, outputs, chunk_size=_DEFAULT_CHUNK_SIZE):
+        """
+        Creates a store for a parameter table.
+
+        Args:
+            directory (str): Store directory (created if needed; must not hold a store).
+            parameters (dict): Parameter name -> 1-D array, one row per sweep point.
+                Scalars are broadcast.
+            outputs (tuple): Names of the float64 result columns.
+            chunk_size (int): Rows per chunk, the unit of work and of completion.
+
+        Returns:
+            SweepStore: The new store.
+        """
+        if os.path.exists(os.path.join(directory, _MANIFEST)):
+            raise ValueError(f"A sweep store already exists in {directory}")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        os.makedirs(directory, exist_ok=True)
+        _write_manifest(directory, {
+            'version': _VERSION,
+            'chunk_size': int(chunk_size),
+            'parameters': list(parameters),
+            'outputs': list(outputs),
+            'segments': [],
+        })
+        store = cls(directory)
+        store.append(parameters)
+        return store
+
+    def refresh(self):
+        """
+        Rereads the manifest, picking up segments appended by another process.
+        """
+        with open(os.path.join(self.directory, _MANIFEST)) as f:
+            manifest = json.load(f)
+        if manifest.get('version') != _VERSION:
+            raise ValueError(f"Unsupported sweep store version {manifest.get('version')}")
+        self.chunk_size = manifest['chunk_size']
+        self.parameter_names = tuple(manifest['parameters'])
+        self.output_names = tuple(manifest['outputs'])
+        self._segments = manifest['segments']
+        # First global chunk index of every segment
+        self._first_chunk = []
+        n_chunks = 0
+        for segment in self._segments:
+            self._first_chunk.append(n_chunks)
+            n_chunks += -(-segment['rows'] // self.chunk_size)
+        self.n_chunks = n_chunks
+
+    @property
+    def n_segments(self):
+        return len(self._segments)
+
+    @property
+    def n_rows(self):
+        return sum(segment['rows'] for segment in self._segments)
+
+    def _segment_path(self, segment):
+        return os.path.join(self.directory, self._segments[segment]['name'])
+
+    def append(self, parameters):
+        """
+        Appends a parameter range as a new segment of pending chunks.
+
+        Args:
+            parameters (dict): Parameter name -> 1-D array, with the store's parameter names.
+
+        Returns:
+            int: Index of the new segment.
+        """
+        if set(parameters) != set(self.parameter_names):
+            raise ValueError(f"Parameters must be exactly {', '.join(self.parameter_names)}")
+        columns = np.broadcast_arrays(*(np.asarray(parameters[name], dtype=float) for name in self.parameter_names))
+        if columns[0].ndim != 1 or columns[0].size == 0:
+            raise ValueError("Parameters must be non-empty 1-D arrays")
+        rows = columns[0].size
+
+        name = f"segment_{len(self._segments):04d}"
+        path = os.path.join(self.directory, name)
+        # Leftovers of an append that crashed before the manifest was written
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(os.path.join(path, _DONE))
+        for parameter, values in zip(self.parameter_names, columns):
+            np.save(os.path.join(path, f"parameter_{parameter}.npy"), values)
+        for output in self.output_names:
+            # Zero-filled and sparse on disk until chunks are written
+            array = np.lib.format.open_memmap(os.path.join(path, f"{output}.npy"), mode='w+',
+                                              dtype=np.float64, shape=(rows,))
+            del array
+
+        with open(os.path.join(self.directory, _MANIFEST)) as f:
+            manifest = json.load(f)
+        manifest['segments'].append({'name': name, 'rows': rows})
+        _write_manifest(self.directory, manifest)
+        self.refresh()
+        return len(self._segments) - 1
+
+    def _locate(self, chunk):
+        if not 0 <= chunk < self.n_chunks:
+            self.refresh()
+            if not 0 <= chunk < self.n_chunks:
+                raise ValueError(f"Chunk {chunk} is outside the store's {self.n_chunks} chunks")
+        segment = bisect.bisect_right(self._first_chunk, chunk) - 1
+        local = chunk - self._first_chunk[segment]
+        start = local * self.chunk_size
+        stop = min(start + self.chunk_size, self._segments[segment]['rows'])
+        return segment, local, start, stop
+
+    def _done(self, segment):
+        return {int(name) for name in os.listdir(os.path.join(self._segment_path(segment), _DONE))}
+
+    def is_complete(self, chunk):
+        segment, local, _, _ = self._locate(chunk)
+        return os.path.exists(_marker(self._segment_path(segment), local))
+
+    def pending_chunks(self):
+        """
+        Global indices of the chunks without a completion marker.
+        """
+        pending = []
+        for segment, first in enumerate(self._first_chunk):
+            done = self._done(segment)
+            n_local = -(-self._segments[segment]['rows'] // self.chunk_size)
+            pending.extend(first + local for local in range(n_local) if local not in done)
+        return pending
+
+    def parameters(self, chunk):
+        """
+        Parameter columns of one chunk.
+
+        Returns:
+            dict: Parameter name -> 1-D float64 array (read from a memory map).
+        """
+        segment, _, start, stop = self._locate(chunk)
+        path = self._segment_path(segment)
+        return {
+            name: np.load(os.path.join(path, f"parameter_{name}.npy"), mmap_mode='r')[start:stop]
+            for name in self.parameter_names
+        }
+
+    def write(self, chunk, results):
+        """
+        Stores the outputs of one chunk and marks it complete.
+
+        Args:
+            chunk (int): Global chunk index.
+            results (dict): Output name -> array of the chunk's length (or scalar).
+                Extra keys are ignored.
+        """
+        segment, local, start, stop = self._locate(chunk)
+        missing = set(self.output_names) - set(results)
+        if missing:
+            raise ValueError(f"Missing output(s) {', '.join(sorted(missing))} for chunk {chunk}")
+        path = self._segment_path(segment)
+        for name in self.output_names:
+            key = (segment, name)
+            if key not in self._outputs:
+                self._outputs[key] = np.load(os.path.join(path, f"{name}.npy"), mmap_mode='r+')
+            target = self._outputs[key]
+            target[start:stop] = results[name]
+            target.flush()
+        # The marker is created only once the data has reached the file
+        open(_marker(path, local), 'w').close()
+
+    def completed(self, segment=None):
+        """
+        Mask of the rows whose chunk is complete.
+
+        Args:
+            segment (int, optional): Segment index. Defaults to all segments, concatenated.
+
+        Returns:
+            np.ndarray: Boolean row mask.
+        """
+        if segment is None:
+            return np.concatenate([self.completed(s) for s in range(self.n_segments)])
+        rows = self._segments[segment]['rows']
+        mask = np.zeros(rows, dtype=bool)
+        for local in self._done(segment):
+            mask[local * self.chunk_size:(local + 1) * self.chunk_size] = True
+        return mask
+
+    def read(self, name, segment=None):
+        """
+        A parameter or output column.
+
+        A single segment is returned as a read-only memory map of the file, so
+        partial results of a running sweep are read without copying; rows of
+        incomplete chunks hold zeros (see completed). Without a segment index,
+        all segments are concatenated, which copies unless there is only one.
+
+        Args:
+            name (str): Parameter or output name.
+            segment (int, optional): Segment index.
+
+        Returns:
+            np.ndarray: Column values.
+        """
+        if name in self.parameter_names:
+            filename = f"parameter_{name}.npy"
+        elif name in self.output_names:
+            filename = f"{name}.npy"
+        else:
+            raise ValueError(f"Unknown column '{name}'")
+        if segment is None:
+            if self.n_segments == 1:
+                segment = 0
+            else:
+                return np.concatenate([self.read(name, s) for s in range(self.n_segments)])
+        return np.load(os.path.join(self._segment_path(segment), filename), mmap_mode='r')
+
+    def run(self, func, workers=1, chunks=None):
+        """
+        Evaluates the pending chunks and stores their results.
+
+        Args:
+            func (callable): Maps a dict of parameter columns to a dict of
+                output columns, e.g. griffith.cli.process_chunk. Must be
+                picklable (a module-level function or functools.partial)
+                when workers > 1.
+            workers (int): Worker processes; each writes its chunks directly.
+            chunks (list, optional): Chunks to evaluate, e.g. one share of
+                pending_chunks() per independently launched job. Defaults to
+                all pending chunks.
+
+        Returns:
+            int: Number of chunks evaluated.
+        """
+        chunks = self.pending_chunks() if chunks is None else list(chunks)
+        if workers <= 1:
+            for chunk in chunks:
+                self.write(chunk, func(self.parameters(chunk)))
+            return len(chunks)
+
+        with multiprocessing.Pool(workers) as pool:
+            # Bounded queue of chunks in flight, as in the batch processor
+            pending = collections.deque()
+            for chunk in chunks:
+                pending.append(pool.apply_async(_evaluate_chunk, ((self.directory, chunk, func),)))
+                if len(pending) >= 2 * workers:
+                    pending.popleft().get()
+            while pending:
+                pending.popleft().get()
+        return len(chunks)
+
+def _evaluate_chunk(task):
+    directory, chunk, func = task
+    store = _OPEN_STORES.get(directory)
+    if store is None:
+        store = _OPEN_STORES[directory] = SweepStore(directory)
+    store.write(chunk, func(store.parameters(chunk)))
@@ -0,0 +1,263 @@
+import csv
+import numpy as np
+from griffith.lefm import StressIntensityFactor
+from griffith.fatigue import _gauss_legendre
+
+def _pchip_slopes(x, y):
+    """
+    Fritsch-Carlson slopes of the monotone piecewise cubic Hermite
+    interpolant (as scipy's PchipInterpolator), for every row of x and y.
+    """
+    h = np.diff(x, axis=-1)
+    delta = np.diff(y, axis=-1) / h
+    slopes = np.zeros_like(y)
+    if y.shape[-1] == 2:
+        slopes[:] = delta
+        return slopes
+
+    # Interior: weighted harmonic mean of the secants, zero at local extrema
+    w1 = 2.0 * h[:, 1:] + h[:, :-1]
+    w2 = h[:, 1:] + 2.0 * h[:, :-1]
+    same_sign = delta[:, :-1] * delta[:, 1:] > 0.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        harmonic = (w1 + w2) / (w1 / delta[:, :-1] + w2 / delta[:, 1:])
+    slopes[:, 1:-1] = np.where(same_sign, harmonic, 0.0)
+
+    # Ends: one-sided three-point estimates, limited to keep the shape
+    for end, (h0, h1, d0, d1) in ((0, (h[:, 0], h[:, 1], delta[:, 0], delta[:, 1])),
+                                  (-1, (h[:, -1], h[:, -2], delta[:, -1], delta[:, -2]))):
+        d = ((2.0 * h0 + h1) * d0 - h0 * d1) / (h0 + h1)
+        d = np.where(np.sign(d) != np.sign(d0), 0.0, d)
+        d = np.where((np.sign(d0) != np.sign(d1)) & (np.abs(d) > np.abs(3.0 * d0)), 3.0 * d0, d)
+        slopes[:, end] = d
+    return slopes
+
+def _hermite(x0, x1, y0, y1, d0, d1, x, derivative=True):
+    """
+    Value and derivative (or None) of the cubic Hermite interpolant on [x0, x1].
+    """
+    h = x1 - x0
+    t = (x - x0) / h
+    one_t = 1.0 - t
+    value = (1.0 + 2.0 * t) * one_t * one_t * y0 + t * t * (3.0 - 2.0 * t) * y1 \
+        + h * t * one_t * (one_t * d0 - t * d1)
+    if not derivative:
+        return value, None
+    slope = 6.0 * t * one_t * (y1 - y0) / h + one_t * (1.0 - 3.0 * t) * d0 + t * (3.0 * t - 2.0) * d1
+    return value, slope
+
+class TabulatedGeometry(StressIntensityFactor):
+    """
+    Geometry given by tabulated K_I per unit load, g(a) = K_I / sigma, e.g.
+    from finite element analyses of geometries without a handbook solution.
+
+    One or many tables are interpolated at once. The smooth factor
+    f(a) = g(a) / sqrt(a) (Y * sqrt(pi) up to the crack length convention)
+    is interpolated with monotone piecewise cubic Hermite (PCHIP) splines,
+    so the square root behaviour of small cracks is reproduced exactly and
+    monotone tables give monotone K. Below the first tabulated crack length
+    f is held constant; above the last one g is NaN (max_crack_length).
+
+    With several tables, crack lengths broadcast against (..., n_tables):
+    the last axis selects the table, like the array dimensions of the
+    handbook geometries. All tables are evaluated with one searchsorted
+    call, so the geometry plugs into every unit_k1 based solver
+    (ParisLawIntegrator.predict_cycles(geometry=...), critical_crack_length, ...).
+    """
+    def __init__(self, crack_length, unit_k1, crack_tips=1, names=None):
+        """
+        Args:
+            crack_length (np.ndarray): Increasing tabulated crack lengths, shape
+                (n_points,) shared by all tables or (n_tables, n_points) (m).
+            unit_k1 (np.ndarray): K_I per unit load at those lengths, shape
+                (n_points,) for one table or (n_tables, n_points).
+            crack_tips (int): Crack tips growing with the crack length
+                convention of the tables (2 for a total length 2a).
+            names (list, optional): Table names. Defaults to table_0, table_1, ...
+        """
+        a = np.asarray(crack_length, dtype=float)
+        g = np.asarray(unit_k1, dtype=float)
+        self._single = a.ndim == 1 and g.ndim == 1
+        a, g = (np.array(v) for v in np.broadcast_arrays(np.atleast_2d(a), np.atleast_2d(g)))
+        if a.ndim != 2 or a.shape[1] < 2:
+            raise ValueError("Tables need at least two points, with shape (n_points,) or (n_tables, n_points)")
+        if not (np.all(np.diff(a, axis=1) > 0.0) and np.all(a[:, 0] > 0.0)):
+            raise ValueError("Tabulated crack lengths must be positive and strictly increasing")
+        if not np.all(np.isfinite(g) & (g > 0.0)):
+            raise ValueError("Tabulated K_I per unit load must be positive and finite")
+
+        self.n_tables, self.n_points = a.shape
+        self.names = tuple(names) if names is not None else tuple(f"table_{i}" for i in range(self.n_tables))
+        if len(self.names) != self.n_tables:
+            raise ValueError(f"Expected {self.n_tables} table names, got {len(self.names)}")
+        self.crack_tips = crack_tips
+        self.crack_length_table = a
+        self.unit_k1_table = g
+        self._factor = g / np.sqrt(a)
+        self._slopes = _pchip_slopes(a, self._factor)
+
+        # Table t is mapped linearly onto [t, t + 0.5], so the keys of all
+        # tables form one sorted array for a single searchsorted call
+        self._start = a[:, 0]
+        self._end = a[:, -1]
+        self._key_scale = 0.5 / (self._end - self._start)
+        self._keys = (np.arange(self.n_tables)[:, np.newaxis]
+                      + (a - self._start[:, np.newaxis]) * self._key_scale[:, np.newaxis]).ravel()
+        # Quadrature nodes of growth_curve from the first tabulated points, by node count
+        self._curve_nodes = {}
+        super().__init__(np.nan)
+
+    @classmethod
+    def from_csv(cls, path, crack_tips=1):
+        """
+        Reads tables from a CSV file with a header row: the crack length in
+        the first column, then one K_I per unit load column per table (named
+        by its header).
+        """
+        with open(path, newline='') as f:
+            header = next(csv.reader(f))
+            data = np.loadtxt(f, delimiter=',', ndmin=2, dtype=float)
+        return cls(data[:, 0], data[:, 1:].T, crack_tips=crack_tips, names=[name.strip() for name in header[1:]])
+
+    @classmethod
+    def from_npz(cls, path, crack_tips=1):
+        """
+        Reads tables from an .npz file with arrays crack_length and unit_k1
+        (shapes as in the constructor) and optionally names.
+        """
+        with np.load(path) as npz:
+            names = npz['names'].tolist() if 'names' in npz else None
+            return cls(npz['crack_length'], npz['unit_k1'], crack_tips=crack_tips, names=names)
+
+    def _output(self, value):
+        return (value[0] if self._single else value)[()]
+
+    @property
+    def max_crack_length(self):
+        """
+        Last tabulated crack length of every table (m).
+        """
+        return self._output(self._end)
+
+    def _interpolate(self, crack_length):
+        a = np.asarray(crack_length, dtype=float)
+        shape = a.shape if self._single else np.broadcast_shapes(a.shape, (self.n_tables,))
+        a = np.broadcast_to(a, shape)
+        table = np.zeros(shape, dtype=np.intp) if self._single else np.broadcast_to(np.arange(self.n_tables), shape)
+
+        start = self._start[table]
+        end = self._end[table]
+        clipped = np.clip(a, start, end)
+        key = table + (clipped - start) * self._key_scale[table]
+        first = table * self.n_points
+        index = np.searchsorted(self._keys, key, side='right') - 1
+        index = np.clip(index, first, first + self.n_points - 2)
+
+        x = self.crack_length_table.ravel()
+        y = self._factor.ravel()
+        d = self._slopes.ravel()
+        f, df = _hermite(x[index], x[index + 1], y[index], y[index + 1], d[index], d[index + 1], clipped)
+        df = np.where(a < start, 0.0, df)
+        f = np.where(a > end, np.nan, f)
+        return a, f, df
+
+    def unit_k1(self, crack_length):
+        """
+        Interpolated K_I per unit load, g(a) = f(a) * sqrt(a).
+
+        Args:
+            crack_length (float or np.ndarray): Crack length (m), broadcast
+                against (n_tables,) with several tables.
+
+        Returns:
+            np.ndarray: g (sqrt(m)).
+        """
+        a, f, _ = self._interpolate(crack_length)
+        return (f * np.sqrt(a))[()]
+
+    def unit_k1_derivative(self, crack_length):
+        """
+        dg/da = f'(a) * sqrt(a) + f(a) / (2 sqrt(a)), exact for the spline.
+        """
+        a, f, df = self._interpolate(crack_length)
+        root_a = np.sqrt(a)
+        return (df * root_a + 0.5 * f / root_a)[()]
+
+    def calculate_k1(self, stress, crack_length):
+        return stress * self.unit_k1(crack_length)
+
+    def _quadrature(self, a_initial, n_nodes):
+        """
+        Weights w_q * a_q * (half width in ln a) and g(a_q)^2 at the
+        Gauss-Legendre nodes of every interval, shape (n_tables, n_points - 1, n_nodes).
+        """
+        x, y, d = self.crack_length_table, self._factor, self._slopes
+        lower = np.log(np.maximum(x[:, :-1], a_initial))[..., np.newaxis]
+        half = 0.5 * (np.log(np.maximum(x[:, 1:], a_initial))[..., np.newaxis] - lower)
+        nodes, weights = _gauss_legendre(n_nodes)
+        a = np.exp(lower + half * (nodes + 1.0))
+        f, _ = _hermite(x[:, :-1, np.newaxis], x[:, 1:, np.newaxis], y[:, :-1, np.newaxis], y[:, 1:, np.newaxis],
+                        d[:, :-1, np.newaxis], d[:, 1:, np.newaxis], a, derivative=False)
+        # da = a d(ln a), and g^2 = f^2 a
+        return weights * half * a, f * f * a
+
+    def growth_curve(self, c, m, stress_range, a_initial=None, n_nodes=4):
+        """
+        Crack length vs cycles (a-N) curve of every table in one pass.
+
+        N(a_j) = Integral_{a_i}^{a_j} da / (n_tips * C * (Delta Sigma * g(a))^m)
+
+        is accumulated over the tabulated crack lengths: each interval of the
+        spline is integrated with n_nodes Gauss-Legendre nodes in ln(a)
+        (exact cubic pieces, no searching), and the interval integrals are
+        summed cumulatively. The spline values at the nodes do not depend on
+        the Paris law, so they are cached for the default a_initial and
+        further curves only cost one power per node.
+
+        Args:
+            c (float or np.ndarray): Paris Law coefficient C, per table.
+            m (float or np.ndarray): Paris Law exponent m, per table.
+            stress_range (float or np.ndarray): Delta Sigma, per table.
+            a_initial (float or np.ndarray, optional): Initial crack length per
+                table. Defaults to the first tabulated length. Tabulated points
+                below it collapse onto it with N = 0; below the table, the
+                growth up to the first point is integrated with f held constant.
+            n_nodes (int): Gauss-Legendre nodes per interval.
+
+        Returns:
+            dict: crack_length and cycles, shape (n_tables, n_points), or
+            (n_points,) for a single table.
+        """
+        x = self.crack_length_table
+        if a_initial is None:
+            if n_nodes not in self._curve_nodes:
+                self._curve_nodes[n_nodes] = self._quadrature(self._start[:, np.newaxis], n_nodes)
+            weights, g_squared = self._curve_nodes[n_nodes]
+            a_initial = self._start[:, np.newaxis]
+        else:
+            a_initial = np.broadcast_to(np.asarray(a_initial, dtype=float), (self.n_tables,))[:, np.newaxis]
+            if np.any(a_initial > self._end[:, np.newaxis]):
+                raise ValueError("a_initial must not exceed the last tabulated crack length")
+            weights, g_squared = self._quadrature(a_initial, n_nodes)
+        c, m, stress_range = (np.asarray(v, dtype=float)[..., np.newaxis] for v in (c, m, stress_range))
+
+        # Per interval: Sum_q w_q * a_q * g(a_q)^-m, with the Paris constants per table
+        damage = np.sum(weights * g_squared ** (-0.5 * m[..., np.newaxis]), axis=-1)
+        rate = self.crack_tips * c * stress_range ** m
+        cycles = np.zeros_like(x)
+        np.cumsum(damage / rate, axis=1, out=cycles[:, 1:])
+
+        # Below the table f is constant, g = f_0 sqrt(a): Integral a^(-m/2) da in closed form
+        start = self._start[:, np.newaxis]
+        below = a_initial < start
+        if np.any(below):
+            exponent = 1.0 - 0.5 * m
+            lower = np.minimum(a_initial, start)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                power = np.where(exponent == 0.0, np.log(start / lower),
+                                 (start ** exponent - lower ** exponent) / exponent)
+            cycles += np.where(below, power * self._factor[:, :1] ** -m / rate, 0.0)
+        return {
+            'crack_length': self._output(np.maximum(x, a_initial)),
+            'cycles': self._output(cycles),
+        }
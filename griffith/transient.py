@@ -0,0 +1,210 @@
+import numpy as np
+from griffith.weight_function import WeightFunctionSIF
+
+# Target number of (time step, depth) entries evaluated per block
+_BLOCK_ELEMENTS = 1 << 20
+_MPA = 1e6
+
+class MasterCurve:
+    """
+    ASTM E1921 Master Curve of the cleavage fracture toughness K_Jc(T).
+
+    K_Jc(P) = K_min + (11 + 77 * exp(0.019 * (T - T0))) * (ln(1 / (1 - P)))^(1/4)   [MPa*sqrt(m)]
+
+    for a 25 mm (1T) specimen, with K_min = 20 MPa*sqrt(m). P = 0.5 gives the
+    median curve, 30 + 70 * exp(0.019 * (T - T0)) after rounding. Other crack
+    front lengths B follow the weakest-link size adjustment
+    K_B = K_min + (K_1T - K_min) * (25 mm / B)^(1/4).
+    """
+    def __init__(self, t0, probability=0.5, thickness=0.025, upper_shelf=None):
+        """
+        Args:
+            t0 (float): Reference temperature T0 (deg C).
+            probability (float): Cumulative failure probability of the curve (0.5: median).
+            thickness (float): Crack front length B (m).
+            upper_shelf (float, optional): Cap on the toughness (Pa*sqrt(m)).
+        """
+        if not 0.0 < probability < 1.0:
+            raise ValueError("probability must lie between 0 and 1")
+        self.t0 = t0
+        self.probability = probability
+        self.thickness = thickness
+        self.upper_shelf = upper_shelf
+        # Every factor except exp(0.019 (T - T0)) is constant: K = k_min + a + b * exp(0.019 T)
+        scale = np.log(1.0 / (1.0 - probability)) ** 0.25 * (0.025 / thickness) ** 0.25 * _MPA
+        self._k_min = 20.0 * _MPA
+        self._offset = 11.0 * scale
+        self._amplitude = 77.0 * scale * np.exp(-0.019 * t0)
+
+    def __call__(self, temperature):
+        """
+        Evaluates K_Jc.
+
+        Args:
+            temperature (float or np.ndarray): Temperature at the crack tip (deg C).
+
+        Returns:
+            np.ndarray: K_Jc (Pa*sqrt(m)).
+        """
+        k = (self._k_min + self._offset) + self._amplitude * np.exp(0.019 * np.asarray(temperature, dtype=float))
+        if self.upper_shelf is not None:
+            k = np.minimum(k, self.upper_shelf)
+        return k
+
+def _interpolation_matrix(positions, points):
+    """
+    Dense matrix P with P @ f = f linearly interpolated at points.
+    """
+    j = np.clip(np.searchsorted(positions, points, side='right') - 1, 0, positions.size - 2)
+    t = (points - positions[j]) / (positions[j + 1] - positions[j])
+    matrix = np.zeros((points.size, positions.size))
+    rows = np.arange(points.size)
+    matrix[rows, j] = 1.0 - t
+    matrix[rows, j + 1] += t
+    return matrix
+
+class TransientAssessment:
+    """
+    Pressurized thermal shock style assessment of surface cracks in a wall.
+
+    For a time series of through-wall stress and temperature profiles, K_I at
+    every crack depth and time step is one matrix product with the weight
+    function influence matrix (K = sigma @ M^T), the crack tip temperature a
+    second one, and the comparison against the temperature dependent toughness
+    K_IC(T_tip) is element-wise. Long transients, including memory-mapped
+    arrays (np.load(..., mmap_mode='r')), are streamed in blocks of time steps.
+    """
+    def __init__(self, depths, positions, thickness=None, geometry='edge', n_nodes=32):
+        """
+        Args:
+            depths (np.ndarray): Crack depths from the loaded surface (m).
+            positions (np.ndarray): Sorted through-wall coordinates of the
+                profiles, measured from the same surface (m).
+            thickness (float, optional): Wall thickness for the finite width correction (m).
+            geometry (str): Weight function geometry, 'edge' or 'center'.
+            n_nodes (int): Gauss-Legendre nodes per crack depth.
+        """
+        self.sif = WeightFunctionSIF(geometry, depths, positions, width=thickness, n_nodes=n_nodes)
+        self.depths = self.sif.depths
+        self.positions = self.sif.positions
+        # Dense transposes: with a few hundred positions a BLAS product over
+        # all time steps beats a sparse product per step.
+        self._k_matrix = np.ascontiguousarray(self.sif.influence_matrix.toarray().T)
+        self._tip_matrix = np.ascontiguousarray(_interpolation_matrix(self.positions, self.depths).T)
+
+    def stress_intensity(self, stress):
+        """
+        K_I(t, a) for every time step and crack depth.
+
+        Args:
+            stress (np.ndarray): Stress profiles, shape (n_steps, n_positions) (Pa).
+
+        Returns:
+            np.ndarray: K_I, shape (n_steps, n_depths) (Pa*sqrt(m)).
+        """
+        return np.asarray(stress, dtype=float) @ self._k_matrix
+
+    def tip_temperature(self, temperature):
+        """
+        Crack tip temperature T(t, a), interpolated from the wall profiles.
+
+        Args:
+            temperature (np.ndarray): Temperature profiles, shape (n_steps, n_positions),
+                or one uniform temperature per step, shape (n_steps,) (deg C).
+
+        Returns:
+            np.ndarray: Shape (n_steps, n_depths).
+        """
+        temperature = np.asarray(temperature, dtype=float)
+        if temperature.ndim == 1:
+            return np.broadcast_to(temperature[:, np.newaxis], (temperature.size, self.depths.size))
+        return temperature @ self._tip_matrix
+
+    def assess(self, stress, temperature, toughness, times=None, keep_history=False, block_steps=None):
+        """
+        Compares K_I(t, a) with K_IC(T_tip(t, a)) over the whole transient.
+
+        The first crossing per depth is the first time step with
+        K_I >= K_IC; its time is interpolated linearly in the margin
+        K_I - K_IC between that step and the previous one.
+
+        Args:
+            stress (np.ndarray): Stress profiles, shape (n_steps, n_positions) (Pa).
+                May be a memory-mapped array.
+            temperature (np.ndarray): Temperature profiles (n_steps, n_positions)
+                or per-step temperatures (n_steps,) (deg C).
+            toughness (callable): K_IC(T) in Pa*sqrt(m), e.g. a MasterCurve.
+            times (np.ndarray, optional): Time of each step. Defaults to the step index.
+            keep_history (bool): Also return the full K_I and K_IC arrays.
+            block_steps (int, optional): Time steps per block. Defaults to about
+                one million (step, depth) entries per block.
+
+        Returns:
+            dict: Per depth 'first_crossing_step' (-1 if none), 'first_crossing_time'
+            (NaN if none), 'max_ratio' (max K_I / K_IC) and 'max_ratio_step';
+            plus 'k1' and 'k_ic' of shape (n_steps, n_depths) if keep_history.
+        """
+        # np.asarray keeps memory-mapped data on disk; blocks are read below
+        stress = np.asarray(stress)
+        temperature = np.asarray(temperature)
+        n_steps = stress.shape[0]
+        if temperature.shape[0] != n_steps:
+            raise ValueError("stress and temperature must have the same number of time steps")
+        times = np.arange(n_steps, dtype=float) if times is None else np.asarray(times, dtype=float)
+        n_depths = self.depths.size
+        if block_steps is None:
+            block_steps = max(1, _BLOCK_ELEMENTS // max(n_depths, 1))
+
+        first_step = np.full(n_depths, -1, dtype=np.intp)
+        first_time = np.full(n_depths, np.nan)
+        max_ratio = np.full(n_depths, -np.inf)
+        max_step = np.zeros(n_depths, dtype=np.intp)
+        previous_margin = None
+        if keep_history:
+            k_history = np.empty((n_steps, n_depths))
+            k_ic_history = np.empty((n_steps, n_depths))
+
+        for start in range(0, n_steps, block_steps):
+            stop = min(start + block_steps, n_steps)
+            k1 = self.stress_intensity(stress[start:stop])
+            k_ic = toughness(self.tip_temperature(temperature[start:stop]))
+            if keep_history:
+                k_history[start:stop] = k1
+                k_ic_history[start:stop] = k_ic
+
+            ratio = k1 / k_ic
+            block_max = ratio.argmax(axis=0)
+            block_ratio = ratio[block_max, np.arange(n_depths)]
+            better = block_ratio > max_ratio
+            max_ratio[better] = block_ratio[better]
+            max_step[better] = start + block_max[better]
+
+            margin = k1 - k_ic
+            pending = first_step < 0
+            crossed = margin >= 0.0
+            hit = pending & crossed.any(axis=0)
+            if hit.any():
+                columns = np.flatnonzero(hit)
+                rows = crossed[:, columns].argmax(axis=0)
+                steps = start + rows
+                first_step[columns] = steps
+                # Margin one step earlier, from this block or the previous one
+                before = np.where(rows > 0, margin[np.maximum(rows - 1, 0), columns],
+                                  np.nan if previous_margin is None else previous_margin[columns])
+                after = margin[rows, columns]
+                fraction = np.where(np.isfinite(before), before / (before - after), 1.0)
+                t_before = times[np.maximum(steps - 1, 0)]
+                first_time[columns] = t_before + fraction * (times[steps] - t_before)
+            previous_margin = margin[-1]
+
+        results = {
+            'depths': self.depths,
+            'first_crossing_step': first_step,
+            'first_crossing_time': first_time,
+            'max_ratio': max_ratio,
+            'max_ratio_step': max_step,
+        }
+        if keep_history:
+            results['k1'] = k_history
+            results['k_ic'] = k_ic_history
+        return results
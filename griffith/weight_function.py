@@ -0,0 +1,184 @@
+import numpy as np
+import math
+from scipy import sparse
+
+_TWO_INV_SQRT_PI = 2.0 / math.sqrt(math.pi)
+_HALF_PI = 0.5 * math.pi
+
+# Edge crack finite-width correction for uniform tension (Tada, Paris & Irwin)
+_EDGE_FW_COEFFS = (1.12, -0.231, 10.55, -21.72, 30.39)
+
+def _gauss_nodes(n_nodes):
+    """
+    Gauss-Legendre nodes and weights mapped to theta in [0, pi/2].
+    """
+    x, w = np.polynomial.legendre.leggauss(n_nodes)
+    theta = (x + 1.0) * (0.5 * _HALF_PI)
+    return theta, w * (0.5 * _HALF_PI)
+
+def _edge_green(t):
+    """
+    Tada's Green's function shape for an edge crack in a semi-infinite plate.
+
+    K = 2 P / sqrt(pi a) * (1.3 - 0.3 (x/a)^(5/4)) / sqrt(1 - (x/a)^2)
+    """
+    return 1.3 - 0.3 * t ** 1.25
+
+def _edge_finite_width(alpha):
+    c0, c1, c2, c3, c4 = _EDGE_FW_COEFFS
+    return (c0 + alpha * (c1 + alpha * (c2 + alpha * (c3 + alpha * c4)))) / c0
+
+def _center_finite_width(alpha):
+    return np.sqrt(1.0 / np.cos(_HALF_PI * alpha))
+
+class WeightFunctionSIF:
+    """
+    Weight-function K_I for arbitrary stress distributions over the crack faces.
+
+    K(a) = Integral_0^a m(x, a) * sigma(x) dx
+
+    With the substitution x = a * sin(theta) the square-root singularity of
+    m(x, a) cancels, and the integral becomes
+
+    K(a) = 2 * sqrt(a / pi) * Integral_0^(pi/2) F(sin theta) * sigma(a sin theta) dtheta
+
+    with F = 1 for a center crack under symmetric loading (exact, infinite
+    plate) and Tada's F = 1.3 - 0.3 * (x/a)^(5/4) for an edge crack
+    (within 1% of the half-plane solution). The smooth integrand is evaluated
+    with Gauss-Legendre nodes that are precomputed for every crack depth, so
+    K for all depths is a single (sparse) matrix-vector product.
+
+    If a width is given, the result is scaled by the uniform-stress finite
+    width correction relative to the infinite body (secant for center cracks,
+    the Tada polynomial for edge cracks). This is exact for uniform stress and
+    an engineering approximation for stress gradients.
+    """
+    def __init__(self, geometry, depths, positions=None, width=None, n_nodes=32):
+        """
+        Args:
+            geometry (str): 'edge' (x measured from the free surface) or
+                'center' (x measured from the crack centre, symmetric profile).
+            depths (np.ndarray): Crack depths a for edge cracks, half-lengths a for center cracks (m).
+            positions (np.ndarray, optional): Sorted coordinates x of the sampled
+                stress profiles (m). Required for calculate_k1.
+            width (float, optional): Wall thickness (edge) or plate width W (center)
+                for the finite width correction. Also normalises polynomial coefficients.
+            n_nodes (int): Gauss-Legendre nodes per crack depth.
+        """
+        if geometry == 'edge':
+            green = _edge_green
+            finite_width = _edge_finite_width
+            alpha_scale = 1.0
+        elif geometry == 'center':
+            green = None
+            finite_width = _center_finite_width
+            alpha_scale = 2.0
+        else:
+            raise ValueError(f"Unknown geometry '{geometry}'. Use 'edge' or 'center'.")
+
+        self.geometry = geometry
+        self.depths = np.asarray(depths, dtype=float)
+        self.width = width
+        self.n_nodes = n_nodes
+
+        theta, weights = _gauss_nodes(n_nodes)
+        sin_theta = np.sin(theta)
+        if green is not None:
+            weights = weights * green(sin_theta)
+
+        # Per-depth prefactor 2 * sqrt(a / pi), including the finite width correction
+        scale = _TWO_INV_SQRT_PI * np.sqrt(self.depths)
+        if width is not None:
+            scale = scale * finite_width(alpha_scale * self.depths / width)
+
+        # Quadrature points x_ik and weights w_ik, shape (n_depths, n_nodes)
+        self._nodes = self.depths[:, np.newaxis] * sin_theta
+        self._weights = scale[:, np.newaxis] * weights
+
+        self.positions = None
+        self._matrix = None
+        self._poly_matrix = None
+        if positions is not None:
+            self.set_positions(positions)
+
+    def set_positions(self, positions):
+        """
+        Precomputes the sparse influence matrix for profiles sampled at positions.
+
+        Each quadrature point interpolates the profile linearly between its two
+        neighbouring samples, giving at most 2 * n_nodes non-zeros per depth.
+
+        Args:
+            positions (np.ndarray): Sorted sample coordinates x (m).
+        """
+        positions = np.asarray(positions, dtype=float)
+        if positions.ndim != 1 or positions.size < 2:
+            raise ValueError("positions must be a 1-D array with at least two samples")
+        if self._nodes.size and self._nodes.max() > positions[-1] * (1.0 + 1e-12):
+            raise ValueError("Stress profile does not cover the deepest crack")
+
+        x = self._nodes.ravel()
+        j = np.clip(np.searchsorted(positions, x, side='right') - 1, 0, positions.size - 2)
+        x0 = positions[j]
+        t = (x - x0) / (positions[j + 1] - x0)
+        w = self._weights.ravel()
+
+        rows = np.repeat(np.arange(self.depths.size), self.n_nodes)
+        self._matrix = sparse.csr_matrix(
+            (np.concatenate((w * (1.0 - t), w * t)), (np.concatenate((rows, rows)), np.concatenate((j, j + 1)))),
+            shape=(self.depths.size, positions.size)
+        )
+        self.positions = positions
+
+    @property
+    def influence_matrix(self):
+        """
+        Sparse matrix M with K = M @ sigma for profiles sampled at self.positions.
+        """
+        if self._matrix is None:
+            raise ValueError("No sample positions set. Pass positions or call set_positions first.")
+        return self._matrix
+
+    def calculate_k1(self, stress):
+        """
+        Calculates K_I at every crack depth for sampled stress profiles.
+
+        Args:
+            stress (np.ndarray): Stress at self.positions (Pa), shape (n_positions,)
+                or (n_positions, n_profiles) for several profiles at once.
+
+        Returns:
+            np.ndarray: K_I (Pa*sqrt(m)), shape (n_depths,) or (n_depths, n_profiles).
+        """
+        return self.influence_matrix @ np.asarray(stress, dtype=float)
+
+    def polynomial_influence(self, n_terms):
+        """
+        Influence coefficients K_n(a) of the polynomial terms (x / width)^n.
+
+        Args:
+            n_terms (int): Number of polynomial terms (highest power + 1).
+
+        Returns:
+            np.ndarray: Shape (n_depths, n_terms).
+        """
+        if self._poly_matrix is None or self._poly_matrix.shape[1] < n_terms:
+            length = 1.0 if self.width is None else self.width
+            powers = (self._nodes / length)[..., np.newaxis] ** np.arange(n_terms)
+            self._poly_matrix = np.einsum('ik,ikn->in', self._weights, powers)
+        return self._poly_matrix[:, :n_terms]
+
+    def calculate_k1_polynomial(self, coefficients):
+        """
+        Calculates K_I for a polynomial stress profile.
+
+        sigma(x) = Sum_n c_n * (x / width)^n   (x in m if no width was given)
+
+        Args:
+            coefficients (np.ndarray): c_n (Pa), shape (n_terms,) or (n_terms, n_profiles).
+
+        Returns:
+            np.ndarray: K_I (Pa*sqrt(m)), shape (n_depths,) or (n_depths, n_profiles).
+        """
+        coefficients = np.asarray(coefficients, dtype=float)
+        return self.polynomial_influence(coefficients.shape[0]) @ coefficients
@@ -1,59 +1,29 @@
-function plotGrowth(c, m, stressRange, aInitial, aFinal, geometryFactor) {
-    // Generate data points for the plot
-    // da/dN = C * (Delta K)^m
-    // Delta K = Y * Delta Sigma * sqrt(pi * a)
-    // We integrate to find N vs a, or just plot da/dN vs a.
-
-    // The proposal says: "Figure 3: Crack Growth Curve (a vs. N)."
-    // So we need to calculate N for various 'a' from aInitial to aFinal.
-
-    const steps = 50;
-    const aValues = [];
-    const nValues = [];
-
-    // We can't easily integrate analytically in JS for arbitrary m.
-    // Let's do a simple numerical integration (Riemann sum)
-
-    let currentN = 0;
-    const deltaA = (aFinal - aInitial) / steps;
-
-    aValues.push(aInitial);
-    nValues.push(0);
-
-    for (let i = 0; i < steps; i++) {
-        const a = aInitial + i * deltaA;
-        const deltaK = geometryFactor * stressRange * Math.sqrt(Math.PI * a);
-        const da_dn = c * Math.pow(deltaK, m);
-
-        // dN = da / (da/dN)
-        const dN = deltaA / da_dn;
-        currentN += dN;
-
-        aValues.push(a + deltaA);
-        nValues.push(currentN);
-    }
-
-    const trace = {
-        x: nValues,
-        y: aValues.map(a => a * 1000), // Convert to mm
-        mode: 'lines',
-        name: 'Crack Growth',
-        line: {
-            color: 'rgb(55, 128, 191)',
-            width: 3
-        },
-        hovertemplate: '<b>Cycles:</b> %{x:,.0f}<br><b>Crack Length:</b> %{y:.2f} mm<extra></extra>'
-    };
-
-    const layout = {
-        title: 'Fatigue Crack Growth (a vs. N)',
-        xaxis: {
-            title: 'Cycles (N)'
-        },
-        yaxis: {
-            title: 'Crack Length a (mm)'
+async function plotGrowth(c, m, stressRange, aInitial, aFinal, geometryFactor) {
+    // The a vs. N curve is integrated and downsampled server-side
+    // (closed-form Paris law, same units handling as /calculate-fatigue),
+    // so the browser only draws the returned Plotly figure.
+    const response = await fetch('/api/plot-fatigue-growth?format=plotly', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({
+            c, m, stress_range: stressRange,
+            a_initial: aInitial, a_final: aFinal,
+            geometry_factor: geometryFactor,
+            stress_unit: "Pa"
+        })
+    });
+
+    if (!response.ok) {
+        let detail = `status ${response.status}`;
+        try {
+            const body = await response.json();
+            if (body.detail) detail = body.detail;
+        } catch (e) {
+            // Non-JSON error body: keep the status
         }
-    };
+        throw new Error(`Growth curve request failed (${detail})`);
+    }
 
-    Plotly.newPlot('fatigue-plot', [trace], layout, { responsive: true });
+    const figure = await response.json();
+    Plotly.newPlot('fatigue-plot', figure.data, figure.layout, { responsive: true });
 }
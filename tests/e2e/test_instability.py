@@ -25,3 +25,18 @@ def test_leak_before_break():
 
     # If critical length > thickness, it leaks first (safe failure)
     assert a_crit > vessel.thickness
+
+def test_leak_before_break_with_bulging():
+    """
+    E2E Test: the library screening with the Folias bulging correction is
+    stricter than the flat plate estimate but the vessel still leaks first.
+    """
+    from griffith.lbb import Cylinder
+
+    vessel = Cylinder(radius=1.0, thickness=0.01, pressure=2e6)
+    material = Steel(K_IC=80e6)
+
+    lbb = vessel.leak_before_break(material.k_ic, flow_stress=1.15 * material.yield_strength)
+
+    assert lbb['critical_half_length'] < material.critical_crack_length(stress=vessel.hoop_stress)
+    assert lbb['leak_before_break']
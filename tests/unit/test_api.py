@@ -1,3 +1,4 @@
+import pytest
 from fastapi.testclient import TestClient
 from api.index import app
 
@@ -47,3 +48,147 @@ def test_calculate_r_curve():
     data = response.json()
     assert "critical_stress" in data
     assert data["critical_stress"] > 0
+
+def test_plot_fatigue_growth():
+    payload = {
+        "c": 1.5e-11,
+        "m": 3.0,
+        "stress_range": 150e6,
+        "a_initial": 0.002,
+        "a_final": 0.020,
+        "geometry_factor": 1.12
+    }
+    response = client.post("/plot-fatigue-growth", json=payload)
+    assert response.status_code == 200
+    figure = response.json()
+    # Final point of the curve matches the remaining life from /calculate-fatigue
+    cycles = client.post("/calculate-fatigue", json=payload).json()["cycles"]
+    assert abs(figure["data"][0]["x"][-1] - cycles) / cycles < 1e-9
+
+    response = client.post("/plot-fatigue-growth?format=png", json=payload)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+
+    response = client.post("/plot-fatigue-growth?format=bmp", json=payload)
+    assert response.status_code == 400
+
+def test_plot_r_curve_svg():
+    response = client.post("/plot-r-curve?format=svg", json={"initial_crack": 0.05})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("image/svg+xml")
+
+def test_inverse_design():
+    response = client.post("/inverse-design", json={
+        "c": 1.5e-11,
+        "m": 3.0,
+        "cycles": [1e4, 1e5, 1e6],
+        "solve_for": "a_initial",
+        "stress_range": 150e6,
+        "a_final": 0.020,
+        "geometry_factor": 1.12
+    })
+    assert response.status_code == 200
+    flaws = response.json()["a_initial"]
+    assert len(flaws) == 3
+    assert flaws[0] > flaws[1] > flaws[2] > 0
+
+    response = client.post("/inverse-design", json={
+        "c": 1.5e-11,
+        "m": 3.0,
+        "cycles": [1e5],
+        "solve_for": "stress_range",
+        "a_initial": 0.002,
+        "a_final": 0.020,
+        "geometry": "CCT",
+        "width": 0.1
+    })
+    assert response.status_code == 200
+    assert response.json()["stress_range"][0] > 0
+
+    response = client.post("/inverse-design", json={
+        "c": 1.5e-11, "m": 3.0, "cycles": [1e5], "solve_for": "stress_range", "a_final": 0.02
+    })
+    assert response.status_code == 400
+
+    # No feasible flaw comes back as null
+    response = client.post("/inverse-design", json={
+        "c": 1e-8, "m": 1.5, "cycles": [1e9], "solve_for": "a_initial", "stress_range": 100.0, "a_final": 0.03,
+        "geometry_factor": 1.12
+    })
+    assert response.status_code == 200 and response.json()["a_initial"] == [None]
+
+@pytest.mark.parametrize("stress_unit", ["Pa", "MPa"])
+def test_inverse_design_stress_range_round_trips(stress_unit):
+    design = {"c": 1.5e-11, "m": 3.0, "a_initial": 0.002, "a_final": 0.020, "geometry_factor": 1.12,
+              "stress_unit": stress_unit}
+    response = client.post("/inverse-design", json={**design, "cycles": [2e5], "solve_for": "stress_range"})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["stress_unit"] == stress_unit
+    stress_range = body["stress_range"][0]
+    assert stress_range > (1e6 if stress_unit == "Pa" else 1.0)
+
+    cycles = client.post("/calculate-fatigue", json={**design, "stress_range": stress_range}).json()["cycles"]
+    assert cycles == pytest.approx(2e5, rel=1e-9)
+
+def test_batch_sif_json_and_binary():
+    import numpy as np
+    from api.index import decode_columns
+
+    crack_length = np.linspace(0.001, 0.09, 500)
+    payload = {"width": 0.1, "crack_length": crack_length.tolist(), "stress": 200e6}
+    single = client.post("/calculate-sif", json={
+        "geometry": "CCT", "width": 0.1, "crack_length": 0.09, "stress": 200e6
+    }).json()["k1"]
+
+    response = client.post("/batch/calculate-sif", json=payload)
+    assert response.status_code == 200
+    k1 = response.json()["k1"]
+    assert len(k1) == 500
+    assert abs(k1[-1] - single) / single < 1e-12
+
+    response = client.post("/batch/calculate-sif?format=binary", json=payload)
+    assert response.headers["content-type"] == "application/octet-stream"
+    assert np.array_equal(decode_columns(response.content)["k1"], k1)
+
+def test_batch_validation():
+    response = client.post("/batch/calculate-fatigue", json={
+        "c": 1.5e-11, "m": 3.0, "stress_range": [150e6, 100e6], "a_initial": 0.002, "a_final": [0.02, 0.02, 0.02]
+    })
+    assert response.status_code == 422
+    response = client.post("/batch/calculate-fatigue", json={
+        "c": 1.5e-11, "m": 3.0, "stress_range": [150e6, None], "a_initial": 0.002, "a_final": 0.02
+    })
+    assert response.status_code == 422
+    response = client.post("/batch/calculate-fatigue", json={
+        "c": [], "m": [], "stress_range": [], "a_initial": 0.002, "a_final": 0.02
+    })
+    assert response.status_code == 422 and "empty" in response.json()["detail"]
+    response = client.post("/batch/calculate-sif?format=xml", json={"width": 0.1, "crack_length": 0.01, "stress": 1.0})
+    assert response.status_code == 400
+
+    response = client.post("/batch/calculate-fatigue", json={
+        "c": 1.5e-11, "m": 3.0, "stress_range": [150e6, 100e6], "a_initial": 0.002, "a_final": 0.02,
+        "geometry_factor": 1.12
+    })
+    cycles = response.json()["cycles"]
+    single = client.post("/calculate-fatigue", json={
+        "c": 1.5e-11, "m": 3.0, "stress_range": 150e6, "a_initial": 0.002, "a_final": 0.02, "geometry_factor": 1.12
+    }).json()["cycles"]
+    assert abs(cycles[0] - single) / single < 1e-12
+    assert cycles[1] > cycles[0]
+
+def test_json_fallback_without_orjson_writes_null(monkeypatch):
+    import json
+    import numpy as np
+    import api.index
+    monkeypatch.setattr(api.index, "orjson", None)
+    body = api.index.NumpyJSONResponse(
+        {"cycles": np.array([1.0, np.nan, np.inf]), "k1": np.float64(-np.inf), "n": np.int64(3), "rows": [(np.nan, 2.0)]}
+    ).body
+    assert json.loads(body) == {"cycles": [1.0, None, None], "k1": None, "n": 3, "rows": [[None, 2.0]]}
+
+    response = client.post("/batch/calculate-fatigue", json={
+        "c": 1.5e-11, "m": 3.0, "stress_range": [150e6, 100e6], "a_initial": 0.002, "a_final": 0.02
+    })
+    assert response.status_code == 200 and len(response.json()["cycles"]) == 2
@@ -0,0 +1,53 @@
+import pytest
+import numpy as np
+from griffith.bayesian import CrackParticleFilter
+from griffith.inspection import ProbabilityOfDetection
+
+def test_pod_curve_quantiles():
+    for model in ('logit', 'probit'):
+        pod = ProbabilityOfDetection.from_a50_a90(0.002, 0.005, model)
+        assert pod(0.002) == pytest.approx(0.5)
+        assert pod(0.005) == pytest.approx(0.9)
+        assert pod(0.0) == 0.0
+
+def test_sized_detection_matches_gaussian_posterior():
+    """
+    With a near-certain POD and no growth, a sized measurement of a Gaussian
+    prior must give the conjugate Gaussian posterior.
+    """
+    rng = np.random.default_rng(0)
+    prior_mean, prior_sd, sizing_sd, measured = 0.005, 0.001, 0.0005, 0.006
+    pf = CrackParticleFilter(rng.normal(prior_mean, prior_sd, 200_000), 1e-11, 3.0, seed=1)
+    pod = ProbabilityOfDetection.from_a50_a90(1e-6, 2e-6)
+    pf.update(pod, detected=True, measured_size=measured, sizing_sd=sizing_sd)
+
+    precision = 1 / prior_sd ** 2 + 1 / sizing_sd ** 2
+    expected = (prior_mean / prior_sd ** 2 + measured / sizing_sd ** 2) / precision
+    assert pf.mean() == pytest.approx(expected, rel=5e-3)
+    assert [h['step'] for h in pf.history] == ['update', 'resample']
+    assert pf.effective_sample_size == pytest.approx(len(pf))
+
+def test_no_detection_shifts_towards_small_cracks():
+    rng = np.random.default_rng(2)
+    pf = CrackParticleFilter(rng.lognormal(np.log(0.002), 0.5, 100_000), 1e-11, 3.0,
+                             geometry_factor=1.12, critical_length=0.05, seed=3)
+    pf.propagate(100.0, 1e5)
+    grown = pf.mean()
+    pf.update(ProbabilityOfDetection.from_a50_a90(0.002, 0.004), detected=False)
+    assert pf.mean() < grown
+    assert pf.history[0]['step'] == 'propagate'
+    assert all(h['seconds'] >= 0.0 and h['ess'] > 0.0 for h in pf.history)
+
+def test_detection_updates_paris_parameters():
+    """
+    A crack much longer than predicted by the prior mean favours fast-growing particles.
+    """
+    rng = np.random.default_rng(4)
+    n = 50_000
+    m = rng.normal(3.0, 0.2, n)
+    pf = CrackParticleFilter(0.002, 1e-11, m, geometry_factor=1.12, critical_length=0.05, jitter=0.1, seed=5)
+    pf.propagate(100.0, 1e5)
+    a_95 = pf.quantile(0.95)
+    pf.update(ProbabilityOfDetection.from_a50_a90(0.001, 0.002), True, measured_size=a_95, sizing_sd=2e-4)
+    assert pf.mean('m') > 3.1
+    assert pf.quantile([0.1, 0.9]).shape == (2,)
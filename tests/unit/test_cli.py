@@ -0,0 +1,69 @@
+import pytest
+import numpy as np
+from griffith.cli import main
+from griffith.fatigue import ParisLawIntegrator
+from griffith.lefm import StressIntensityFactor
+
+def _write_inventory(path, n=50):
+    rng = np.random.default_rng(0)
+    data = {
+        'a': rng.uniform(0.001, 0.01, n),
+        'width': rng.uniform(0.1, 0.5, n),
+        'stress': rng.uniform(100e6, 300e6, n),
+        'k_ic': rng.uniform(50e6, 150e6, n),
+        'stress_range': rng.uniform(50.0, 150.0, n),
+    }
+    with open(path, 'w') as f:
+        f.write(','.join(data) + '\n')
+        np.savetxt(f, np.column_stack(list(data.values())), delimiter=',', fmt='%.12g')
+    return data
+
+def _read(path):
+    return np.genfromtxt(path, delimiter=',', names=True)
+
+def test_cli_matches_library(tmp_path, capsys):
+    inventory = tmp_path / 'inventory.csv'
+    data = _write_inventory(inventory)
+    output = tmp_path / 'results.csv'
+    assert main([str(inventory), '-o', str(output), '--map', 'crack_length=a', '--set', 'c=1.5e-11',
+                 '--set', 'm=3', '--set', 'geometry_factor=1.12', '--chunksize', '7']) == 0
+    assert 'rows/s' in capsys.readouterr().err
+
+    result = _read(output)
+    crack = data['a']
+    assert np.array_equal(result['row'], np.arange(50))
+    assert np.allclose(result['k1'], 1.12 * data['stress'] * np.sqrt(np.pi * crack), rtol=1e-9)
+    a_c = StressIntensityFactor.critical_crack_length(data['k_ic'], data['stress'], 1.12)
+    assert np.allclose(result['critical_crack_length'], a_c, rtol=1e-9)
+    expected = ParisLawIntegrator(1.5e-11, 3.0).predict_cycles(data['stress_range'], crack, a_c, 1.12)
+    assert np.allclose(result['remaining_cycles'], np.where(crack >= a_c, 0.0, expected), rtol=1e-9)
+
+def test_cli_cct_with_workers(tmp_path):
+    inventory = tmp_path / 'inventory.csv'
+    _write_inventory(inventory)
+    serial = tmp_path / 'serial.csv'
+    parallel = tmp_path / 'parallel.csv'
+    args = ['--map', 'crack_length=a', '--set', 'r0=150e3', '--set', 'r1=400e3', '--set', 'r_exponent=0.5',
+            '--geometry', 'cct', '--chunksize', '16']
+    main([str(inventory), '-o', str(serial)] + args)
+    main([str(inventory), '-o', str(parallel), '--workers', '2'] + args)
+
+    assert serial.read_text() == parallel.read_text()
+    result = _read(serial)
+    assert set(result.dtype.names) == {'row', 'crack_length', 'k1', 'critical_crack_length', 'instability_stress'}
+
+def test_cli_rejects_missing_crack_length(tmp_path):
+    inventory = tmp_path / 'inventory.csv'
+    _write_inventory(inventory)
+    with pytest.raises(SystemExit):
+        main([str(inventory), '-o', str(tmp_path / 'out.csv')])
+
+def test_cli_rejects_missing_geometry_columns_and_bad_cells(tmp_path):
+    inventory = tmp_path / 'inventory.csv'
+    inventory.write_text('a,stress\n0.002,100e6\n0.003,120e6\n')
+    with pytest.raises(SystemExit, match='cct geometry needs a width'):
+        main([str(inventory), '-o', str(tmp_path / 'out.csv'), '--map', 'crack_length=a', '--geometry', 'cct'])
+
+    inventory.write_text('a,stress\n0.002,100e6\n0.003,120e6\n0.004,\n0.005,140e6\n')
+    with pytest.raises(SystemExit, match='line 4'):
+        main([str(inventory), '-o', str(tmp_path / 'out.csv'), '--map', 'crack_length=a', '--chunksize', '2'])
@@ -0,0 +1,75 @@
+import warnings
+import pytest
+import numpy as np
+from fastapi.testclient import TestClient
+import api.index
+from griffith.design_surfaces import DesignSurfaces, build_design_surfaces
+from griffith.materials import Steel
+
+@pytest.fixture(scope='module')
+def surfaces(tmp_path_factory):
+    directory = str(tmp_path_factory.mktemp('surfaces'))
+    return build_design_surfaces(
+        directory, Steel(), 1.5e-11, 3.0, np.geomspace(1e-4, 0.05, 48), np.geomspace(10.0, 500.0, 48),
+        np.geomspace(0.8, 2.0, 12), stress_unit=1e6
+    )
+
+def test_interpolation_error_is_within_estimate(surfaces):
+    rng = np.random.default_rng(0)
+    a = rng.uniform(2e-4, 0.01, 2000)
+    stress_range = rng.uniform(20.0, 300.0, 2000)
+    y = rng.uniform(0.9, 1.9, 2000)
+    values, error = surfaces.interpolate('remaining_cycles', a, stress_range, y)
+    exact = surfaces.compute('remaining_cycles', a, stress_range, y)
+    usable = np.isfinite(error) & (exact > 0.0)
+    assert usable.mean() > 0.5
+    assert np.all(np.abs(values[usable] / exact[usable] - 1.0) <= error[usable] + 1e-12)
+
+    # The LEFM critical size is a power law, which log-log interpolation reproduces
+    values, error = surfaces.interpolate('critical_crack_length', stress_range, y)
+    assert values == pytest.approx(surfaces.compute('critical_crack_length', stress_range, y), rel=1e-12)
+
+def test_scalar_and_array_lookups_agree(surfaces):
+    value, error = surfaces.lookup('remaining_cycles', 0.002, 150.0, 1.12)
+    values, errors = surfaces.lookup('remaining_cycles', np.array([0.002]), 150.0, 1.12)
+    assert value == pytest.approx(values[0], rel=1e-12)
+    assert error == pytest.approx(errors[0])
+    assert 0.0 < error <= 1e-2
+    assert value == pytest.approx(surfaces.compute('remaining_cycles', 0.002, 150.0, 1.12), rel=error)
+
+def test_zero_life_corners_do_not_warn_or_poison_lookups(surfaces):
+    # On the grid edge the cell next to a failed (zero life) corner gets no weight from it
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        values, error = surfaces.lookup('remaining_cycles', np.array([0.04, 0.003]), np.array([500.0, 100.0]), 2.0)
+        value, _ = surfaces.lookup('remaining_cycles', 0.04, 500.0, 2.0)
+    assert not np.isnan(values).any() and not np.isnan(value)
+    assert values[1] == pytest.approx(surfaces.compute('remaining_cycles', 0.003, 100.0, 2.0), rel=error[1])
+
+def test_off_grid_points_are_computed_directly(surfaces):
+    a = np.array([0.002, 0.2])
+    values, error = surfaces.lookup('instability_stress', a, 1.12)
+    assert error[1] == 0.0
+    assert values[1] == pytest.approx(surfaces.compute('instability_stress', 0.2, 1.12))
+    assert surfaces.lookup('instability_stress', 0.2, 1.12) == (pytest.approx(values[1]), 0.0)
+
+    # Reopening maps the same files read-only
+    reopened = DesignSurfaces(surfaces.directory)
+    assert isinstance(reopened._surface('remaining_cycles').log_values, np.memmap)
+    with pytest.raises(ValueError):
+        reopened.lookup('toughness', 0.002)
+
+def test_design_lookup_endpoint(surfaces, monkeypatch):
+    client = TestClient(api.index.app)
+    monkeypatch.setattr(api.index, 'design_surfaces', None)
+    assert client.post("/design-lookup", json={"quantity": "remaining_cycles"}).status_code == 503
+
+    monkeypatch.setattr(api.index, 'design_surfaces', surfaces)
+    response = client.post("/design-lookup", json={
+        "quantity": "remaining_cycles", "crack_length": 0.002, "stress_range": 150.0, "geometry_factor": 1.12
+    })
+    assert response.status_code == 200
+    data = response.json()
+    assert data["remaining_cycles"] == pytest.approx(surfaces.compute('remaining_cycles', 0.002, 150.0, 1.12), rel=1e-2)
+    assert data["material"] == "Steel"
+    assert client.post("/design-lookup", json={"quantity": "critical_crack_length"}).status_code == 422
@@ -0,0 +1,58 @@
+import pytest
+import numpy as np
+from griffith.materials import Material, Steel
+from griffith.geometry import CenterCrackedPlate, SingleEdgeNotchBend
+from griffith.epri import estimate_j, HFunctionTable, CCT_PLANE_STRESS_H1
+
+def test_h_function_interpolation():
+    # Table nodes are reproduced exactly, values between nodes are bracketed
+    assert CCT_PLANE_STRESS_H1(0.5, 10.0) == pytest.approx(1.22)
+    mid = CCT_PLANE_STRESS_H1(0.4375, 10.0)
+    assert 1.22 < mid < 1.69
+
+    values = CCT_PLANE_STRESS_H1(np.array([[0.25], [0.5]]), np.array([1.0, 3.0, 5.0]))
+    assert values.shape == (2, 3)
+
+    with pytest.raises(ValueError):
+        HFunctionTable([0.1, 0.2], [1.0, 2.0], np.zeros((3, 2)))
+
+@pytest.mark.parametrize("a_over_w", [0.125, 0.25, 0.5, 0.75])
+def test_linear_hardening_matches_elastic_j(a_over_w):
+    """
+    For n = 1 the Ramberg-Osgood material is linear, so J_pl must equal
+    alpha * J_el (incompressible, no plastic zone correction) within the
+    accuracy of the tabulated h1 values.
+    """
+    material = Material("linear", 200e9, 400e6, poisson_ratio=0.5,
+                        ramberg_osgood_alpha=2.0, hardening_exponent=1.0)
+
+    plate = CenterCrackedPlate(width=0.2, crack_length=a_over_w * 0.2)
+    _, j_el, j_pl = estimate_j(plate, material, 100e6, plastic_zone_correction=False)
+    assert j_pl / j_el == pytest.approx(2.0, rel=0.015)
+
+    beam = SingleEdgeNotchBend(width=0.05, thickness=0.025, crack_length=a_over_w * 0.05, span=0.2)
+    _, j_el, j_pl = estimate_j(beam, material, 5e3, plastic_zone_correction=False)
+    assert j_pl / j_el == pytest.approx(2.0, rel=0.015)
+
+def test_j_load_curves_broadcast():
+    material = Material("steel", 200e9, 400e6, ramberg_osgood_alpha=1.0, hardening_exponent=10.0)
+    plate = CenterCrackedPlate(width=0.2, crack_length=0.05)
+
+    loads = np.linspace(10e6, 300e6, 200)[:, np.newaxis]
+    cracks = np.linspace(0.01, 0.15, 50)[np.newaxis, :]
+    j_total, j_el, j_pl = estimate_j(plate, material, loads, cracks)
+
+    assert j_total.shape == (200, 50)
+    assert np.allclose(j_total, j_el + j_pl)
+    # J rises with load for every flaw, and plasticity dominates beyond the limit load
+    assert np.all(np.diff(j_total, axis=0) > 0)
+    assert j_pl[-1, -1] > j_el[-1, -1]
+    assert j_pl[0, 0] < j_el[0, 0]
+
+    # Plastic zone correction only increases the elastic part
+    _, j_el_uncorrected, _ = estimate_j(plate, material, loads, cracks, plastic_zone_correction=False)
+    assert np.all(j_el >= j_el_uncorrected)
+
+def test_missing_parameters():
+    with pytest.raises(ValueError):
+        estimate_j(CenterCrackedPlate(0.2, 0.05), Steel(), 100e6)
@@ -0,0 +1,73 @@
+import pytest
+import numpy as np
+from griffith.fatigue import ParisLawIntegrator
+from griffith.growth_state import CrackGrowthState
+
+def test_predict_crack_length_inverts_predict_cycles():
+    for m in (2.0, 3.0):
+        integrator = ParisLawIntegrator(1.5e-11, m)
+        cycles = integrator.predict_cycles(150, 0.002, 0.02, 1.12)
+        assert integrator.predict_crack_length(150, 0.002, cycles, 1.12) == pytest.approx(0.02, rel=1e-10)
+
+def test_incremental_updates_match_single_integration():
+    """
+    Advancing day by day must give the same crack as integrating the whole
+    history at once, for cracks with different Paris exponents (incl. m = 2).
+    """
+    m = np.array([2.0, 2.5, 3.0, 3.5])
+    state = CrackGrowthState(0.002, 1.5e-11, m, geometry_factor=1.12)
+    # Daily histogram shared by all cracks: (n_bins, 1)
+    stress = np.array([[100.0], [150.0]])
+    counts = np.array([[2000.0], [500.0]])
+    for _ in range(10):
+        state.advance(stress, counts)
+
+    assert np.all(state.cycles == 25000.0)
+    for i, m_i in enumerate(m):
+        integrator = ParisLawIntegrator(1.5e-11, m_i)
+        # Equivalent constant amplitude range for the whole history
+        equivalent = ((10 * (2000 * 100.0 ** m_i + 500 * 150.0 ** m_i)) / 25000.0) ** (1.0 / m_i)
+        expected = integrator.predict_crack_length(equivalent, 0.002, 25000.0, 1.12)
+        assert state.crack_length[i] == pytest.approx(expected, rel=1e-10)
+
+def test_failed_cracks_are_frozen():
+    state = CrackGrowthState([0.002, 0.002], 1.5e-11, 3.0, geometry_factor=1.12, critical_length=0.01)
+    state.advance([150.0, 10.0], 1e7)
+    assert state.failed.tolist() == [True, False]
+    # The failing crack stops at its critical length with the cycles to get there
+    to_failure = ParisLawIntegrator(1.5e-11, 3.0).predict_cycles(150.0, 0.002, 0.01, 1.12)
+    assert state.crack_length[0] == 0.01
+    assert state.cycles == pytest.approx([to_failure, 1e7], rel=1e-12)
+    state.advance([150.0, 10.0], 1e5)
+    assert state.crack_length[0] == 0.01
+    assert state.cycles == pytest.approx([to_failure, 1e7 + 1e5], rel=1e-12)
+
+def test_failure_within_histogram_block():
+    state = CrackGrowthState(0.002, 1.5e-11, 3.0, geometry_factor=1.12, critical_length=0.01)
+    ranges = np.array([[100.0], [200.0]])
+    counts = np.array([[3e5], [1e5]])
+    state.advance(ranges, counts)
+    equivalent = (np.sum(counts * ranges ** 3.0) / counts.sum()) ** (1.0 / 3.0)
+    expected = ParisLawIntegrator(1.5e-11, 3.0).predict_cycles(equivalent, 0.002, 0.01, 1.12)
+    assert state.crack_length[0] == 0.01
+    assert state.cycles[0] == pytest.approx(expected, rel=1e-12) and state.cycles[0] < 4e5
+
+def test_checkpoint_round_trip(tmp_path):
+    rng = np.random.default_rng(1)
+    state = CrackGrowthState(rng.uniform(1e-3, 5e-3, 1000), 1.5e-11, rng.uniform(2.5, 3.5, 1000), 1.12)
+    state.advance(120.0, 1e5)
+
+    path = tmp_path / "fleet.grfs"
+    state.save(str(path))
+    restored = CrackGrowthState.load(str(path))
+
+    for name in ('crack_length', 'cycles', 'c', 'm', 'geometry_factor', 'critical_length'):
+        assert np.array_equal(getattr(restored, name), getattr(state, name))
+
+    # Resuming from the checkpoint is identical to continuing in memory
+    state.advance(120.0, 1e5)
+    restored.advance(120.0, 1e5)
+    assert np.array_equal(restored.crack_length, state.crack_length)
+
+    with pytest.raises(ValueError):
+        CrackGrowthState.from_bytes(b'XXXX' + state.to_bytes()[4:])
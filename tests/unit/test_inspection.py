@@ -0,0 +1,63 @@
+import pytest
+import numpy as np
+from griffith.fatigue import ParisLawIntegrator
+from griffith.inspection import InspectionPlanner, ProbabilityOfDetection, lognormal_flaw_quantiles
+
+POD = ProbabilityOfDetection.from_a50_a90(0.002, 0.005)
+
+def _reference_pof(c, m, stress_range, flaws, critical_length, interval, life):
+    """
+    Scalar loop over every flaw and inspection.
+    """
+    integrator = ParisLawIntegrator(c, m)
+    total = 0.0
+    for a_0 in flaws:
+        n_fail = integrator.predict_cycles(stress_range, a_0, critical_length, 1.12)
+        if n_fail > life:
+            continue
+        survival, k = 1.0, 1
+        while k * interval < n_fail:
+            survival *= 1.0 - POD(integrator.predict_crack_length(stress_range, a_0, k * interval, 1.12))
+            k += 1
+        total += survival / len(flaws)
+    return total
+
+def test_probability_of_failure_matches_scalar_loop():
+    c = np.array([1e-11, 2e-11, 1.5e-11])
+    m = np.array([3.0, 2.0, 3.2])
+    stress_range = np.array([100.0, 80.0, 90.0])
+    flaws = lognormal_flaw_quantiles(0.0005, 0.6, 5)
+    intervals = np.array([2e6, 4e5, 1e5])
+
+    pof = InspectionPlanner(POD, c, m, stress_range, 0.03, 1.12).probability_of_failure(flaws, intervals, 2e6)
+    assert pof.shape == (3, 3)
+    for i in range(3):
+        for j, interval in enumerate(intervals):
+            expected = _reference_pof(c[i], m[i], stress_range[i], flaws, 0.03, interval, 2e6)
+            assert pof[i, j] == pytest.approx(expected, rel=1e-9, abs=1e-300)
+
+def test_plan_meets_target_for_fleet():
+    rng = np.random.default_rng(0)
+    n = 2000
+    planner = InspectionPlanner(POD, rng.lognormal(np.log(1e-11), 0.2, n), 3.0,
+                                rng.uniform(60.0, 120.0, n), 0.03, 1.12)
+    flaws = lognormal_flaw_quantiles(0.0005, 0.6, 9)
+    plan = planner.plan(flaws, 2e6, 1e-4)
+    exhaustive = planner.plan(flaws, 2e6, 1e-4, exhaustive=True)
+
+    feasible = plan['feasible']
+    assert feasible.mean() > 0.9
+    assert np.all(plan['probability_of_failure'][feasible] <= 1e-4)
+    assert np.all(exhaustive['interval'][feasible] >= plan['interval'][feasible])
+    assert np.all(plan['uninspected_pof'][feasible] >= plan['probability_of_failure'][feasible])
+    # Components with a higher stress need more inspections
+    slow = planner.stress_range < 70.0
+    fast = planner.stress_range > 110.0
+    assert np.nanmean(plan['n_inspections'][fast]) > np.nanmean(plan['n_inspections'][slow])
+
+def test_components_that_never_fail_need_no_inspection():
+    planner = InspectionPlanner(POD, 1e-11, 3.0, [10.0, 100.0], 0.03, 1.12)
+    plan = planner.plan([0.0005], 2e6, 1e-4)
+    assert plan['uninspected_pof'].tolist() == [0.0, 1.0]
+    assert plan['n_inspections'][0] == 0.0
+    assert plan['n_inspections'][1] > 0.0
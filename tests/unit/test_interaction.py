@@ -0,0 +1,58 @@
+import pytest
+import numpy as np
+from griffith.interaction import CrackField
+from griffith.lefm import StressIntensityFactor
+
+def _random_field(n, span, seed=0):
+    rng = np.random.default_rng(seed)
+    return CrackField(rng.uniform(0.0, span, n), rng.lognormal(np.log(1e-3), 0.8, n),
+                      rng.uniform(0.0, 0.05, n), rng.lognormal(np.log(5e-4), 0.5, n))
+
+def test_interacting_pairs_match_all_pairs():
+    field = _random_field(1500, 5.0)
+    i, j = field.interacting_pairs()
+    I, J = np.triu_indices(len(field), 1)
+    s_x, s_z = field._gaps(I, J)
+    expected = ((s_x <= 2.0 * np.minimum(field.half_length[I], field.half_length[J]))
+                & (s_z <= field.half_height[I] + field.half_height[J]))
+    found = set(zip(np.minimum(i, j).tolist(), np.maximum(i, j).tolist()))
+    assert found == set(zip(I[expected].tolist(), J[expected].tolist()))
+
+def test_combined_flaws_are_rechecked():
+    # The third crack only interacts with the envelope of the first two
+    field = CrackField([0.0, 3.5, 12.5], [1.0, 1.0, 3.0])
+    cracks, labels = field.combine()
+    assert len(cracks) == 1
+    assert labels.tolist() == [0, 0, 0]
+    assert cracks.x[0] - cracks.half_length[0] == pytest.approx(-1.0)
+    assert cracks.x[0] + cracks.half_length[0] == pytest.approx(15.5)
+
+def test_combined_field_has_no_interactions_left():
+    field = _random_field(20000, 20.0)
+    cracks, labels = field.combine()
+    assert len(cracks) < len(field)
+    assert cracks.interacting_pairs()[0].size == 0
+    # Every input flaw lies inside its effective flaw
+    assert np.all(np.abs(field.x - cracks.x[labels]) + field.half_length <= cracks.half_length[labels] + 1e-12)
+
+def test_amplification_of_collinear_pair():
+    c, s = 0.01, 0.01
+    field = CrackField([0.0, 2 * c + s, 1.0], [c, c, c])
+    factors = field.interaction_factors()
+    pitch = 2 * c + s
+    expected = np.sqrt(pitch / (np.pi * c) * np.tan(np.pi * c / pitch))
+    assert factors == pytest.approx([expected, expected, 1.0])
+
+    results = field.assess(100e6, geometry_factor=1.12, rule='amplify', k_ic=50e6)
+    k_isolated = StressIntensityFactor(1.12).calculate_k1(100e6, c)
+    assert results['k1'] == pytest.approx([expected * k_isolated, expected * k_isolated, k_isolated])
+    assert results['utilisation'] == pytest.approx(results['k1'] / 50e6)
+
+    combined = field.assess(100e6, geometry_factor=1.12)
+    labels = combined['labels']
+    assert labels[0] == labels[1] != labels[2]
+    assert combined['k1'][labels[0]] == pytest.approx(StressIntensityFactor(1.12).calculate_k1(100e6, 2 * c + 0.5 * s))
+
+def test_invalid_rule():
+    with pytest.raises(ValueError):
+        CrackField([0.0], [0.01]).assess(100e6, rule='sum')
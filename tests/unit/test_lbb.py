@@ -0,0 +1,43 @@
+import pytest
+import numpy as np
+from griffith.lbb import Cylinder, ThroughWallCrack, folias_factor
+from griffith.solvers import critical_crack_length
+
+def test_critical_half_length_matches_root_finder():
+    crack = ThroughWallCrack(radius=np.array([0.1, 0.5, 2.0]), thickness=0.02, orientation='axial')
+    closed_form = crack.critical_half_length(100e6, 150e6)
+    for i, radius in enumerate((0.1, 0.5, 2.0)):
+        expected = critical_crack_length(ThroughWallCrack(radius, 0.02), 100e6, 150e6)
+        assert closed_form[i] == pytest.approx(expected, rel=1e-9)
+    k1 = 150e6 * folias_factor(closed_form, crack.radius, 0.02) * np.sqrt(np.pi * closed_form)
+    assert np.allclose(k1, 100e6)
+
+def test_flat_plate_limit_and_derivative():
+    crack = ThroughWallCrack(radius=1e12, thickness=0.02, orientation='circumferential')
+    assert crack.critical_half_length(80e6, 200e6) == pytest.approx((80 / 200) ** 2 / np.pi, rel=1e-9)
+
+    crack = ThroughWallCrack(radius=0.3, thickness=0.01)
+    c = np.array([0.005, 0.02, 0.1])
+    numerical = (crack.unit_k1(c * (1 + 1e-7)) - crack.unit_k1(c * (1 - 1e-7))) / (2e-7 * c)
+    assert np.allclose(crack.unit_k1_derivative(c), numerical, rtol=1e-6)
+
+def test_inventory_screening():
+    rng = np.random.default_rng(0)
+    n = 10_000
+    pipes = Cylinder(rng.uniform(0.05, 1.0, n), rng.uniform(0.005, 0.05, n), rng.uniform(1e6, 15e6, n))
+    k_ic = rng.uniform(50e6, 200e6, n)
+    axial = pipes.leak_before_break(k_ic, 'axial', flow_stress=400e6)
+    circumferential = pipes.leak_before_break(k_ic, 'circumferential', flow_stress=400e6)
+
+    assert axial['leak_before_break'].shape == (n,)
+    # The hoop stress is twice the axial stress and bulges axial cracks more
+    assert np.all(axial['critical_half_length'] <= circumferential['critical_half_length'])
+    assert np.all(axial['leak_before_break'] <= circumferential['leak_before_break'])
+    assert np.all(axial['critical_half_length'] <= axial['collapse_half_length'])
+    lbb = axial['leak_before_break']
+    assert np.all(axial['margin'][lbb] > 1.0)
+    assert np.all((axial['margin'] <= 1.0) | (axial['surface_k1'] >= k_ic) | lbb)
+
+def test_unknown_orientation():
+    with pytest.raises(ValueError):
+        Cylinder(1.0, 0.01, 2e6).leak_before_break(80e6, orientation='radial')
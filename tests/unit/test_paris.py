@@ -55,3 +55,43 @@ def test_paris_law_m_neq_2():
     expected_cycles = integral_val / term
 
     assert abs(cycles - expected_cycles) / expected_cycles < 1e-3
+
+@pytest.mark.parametrize("m", [2.0, 3.0])
+def test_inverse_design_round_trips(m):
+    integrator = ParisLawIntegrator(1e-11, m)
+    lives = np.array([1e4, 1e5, 1e6])
+
+    stress = integrator.allowable_stress_range(lives, 0.002, 0.03, 1.12)
+    assert np.allclose(integrator.predict_cycles(stress, 0.002, 0.03, 1.12), lives, rtol=1e-10)
+
+    flaw = integrator.max_initial_flaw(lives, 100.0, 0.03, 1.12)
+    assert np.all(np.diff(flaw) < 0)
+    assert np.allclose(integrator.predict_cycles(100.0, flaw, 0.03, 1.12), lives, rtol=1e-10)
+
+def test_inverse_design_with_geometry():
+    from scipy.integrate import quad
+    from griffith.geometry import CenterCrackedPlate
+
+    integrator = ParisLawIntegrator(1e-11, 3.0)
+    plate = CenterCrackedPlate(width=0.2, crack_length=0.01)
+    lives = np.array([1e4, 1e5, 1e6])
+
+    # Total crack length 2a grows at both tips: d(2a)/dN = 2 * C * dK^m
+    def life(stress, total_initial):
+        return quad(lambda a: 1.0 / (2 * 1e-11 * (stress * plate.unit_k1(a)) ** 3), total_initial, 0.15)[0]
+
+    flaw = integrator.max_initial_flaw(lives, 100.0, 0.15, geometry=plate)
+    for n, a_i in zip(lives, flaw):
+        assert life(100.0, a_i) == pytest.approx(n, rel=1e-8)
+
+    # Array of final lengths with scalar life and stress, as in the constant Y branch
+    flaw = integrator.max_initial_flaw(1e5, 100.0, np.array([0.1, 0.15]), geometry=plate)
+    assert flaw[1] == pytest.approx(integrator.max_initial_flaw(1e5, 100.0, 0.15, geometry=plate), rel=1e-10)
+    assert life(100.0, flaw[1]) == pytest.approx(1e5, rel=1e-8) and flaw[0] < flaw[1]
+
+    stress = integrator.allowable_stress_range(lives, 0.01, 0.15, geometry=plate)
+    for n, s in zip(lives, stress):
+        assert life(s, 0.01) == pytest.approx(n, rel=1e-8)
+
+    # m < 2: a vanishing flaw already exceeds a short life -> no feasible flaw
+    assert np.isnan(ParisLawIntegrator(1e-8, 1.5).max_initial_flaw(1e9, 100.0, 0.03, 1.12))
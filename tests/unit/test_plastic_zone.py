@@ -0,0 +1,73 @@
+import math
+import pytest
+import numpy as np
+from griffith.fatigue import ParisLawIntegrator
+from griffith.geometry import CenterCrackedPlate
+from griffith.plastic_zone import (PlasticZoneCorrectedGeometry, _residual, effective_crack_length,
+                                   plastic_zone_ctod)
+from griffith.solvers import critical_crack_length
+
+YIELD = 350e6
+
+@pytest.mark.parametrize('plane_stress, beta', [(True, 2.0), (False, 6.0)])
+def test_irwin_constant_y_matches_closed_form(plane_stress, beta):
+    """
+    With a constant Y, a_eff = a + (Y sigma sqrt(pi a_eff) / sigma_y)^2 / (beta pi)
+    gives a_eff = a / (1 - (Y sigma / sigma_y)^2 / beta).
+    """
+    stress = np.array([100e6, 200e6, 300e6])
+    result = effective_crack_length(stress, 0.01, YIELD, geometry_factor=1.12, plane_stress=plane_stress)
+    expected = 0.01 / (1.0 - (1.12 * stress / YIELD) ** 2 / beta)
+    assert result['crack_length'] == pytest.approx(expected, rel=1e-12)
+    assert result['k1'] == pytest.approx(1.12 * stress * np.sqrt(math.pi * expected), rel=1e-12)
+    assert result['converged'].all() and result['iterations'] <= 3
+
+def test_dugdale_infinite_plate_and_ctod():
+    stress = np.array([100e6, 200e6, 340e6, 360e6])
+    result = effective_crack_length(stress, 0.01, YIELD, model='dugdale')
+    expected = 0.01 / np.cos(math.pi * stress[:3] / (2.0 * YIELD))
+    assert result['crack_length'][:3] == pytest.approx(expected, rel=1e-12)
+    # No strip yield solution once sigma reaches sigma_y
+    assert result['converged'].tolist() == [True, True, True, False]
+    assert np.isnan(result['crack_length'][3])
+
+    delta = plastic_zone_ctod(stress[:3], 0.01, YIELD, 200e9, model='dugdale')
+    assert delta == pytest.approx(8.0 * YIELD * 0.01 / (math.pi * 200e9) * np.log(expected / 0.01), rel=1e-12)
+
+@pytest.mark.parametrize('model', ['irwin', 'dugdale'])
+def test_finite_width_batch_solves_fixed_point(model):
+    rng = np.random.default_rng(4)
+    width = rng.uniform(0.05, 0.5, 20000)
+    crack = rng.uniform(0.001, 0.9, 20000) * width
+    stress = rng.uniform(20e6, 300e6, 20000)
+    plate = CenterCrackedPlate(width, 0.01)
+
+    result = effective_crack_length(stress, crack, YIELD, plate, model=model)
+    converged = result['converged']
+    assert 0.2 < converged.mean() < 0.9 and result['iterations'] < 20
+    assert np.isnan(result['crack_length'][~converged]).all()
+
+    a_eff = result['crack_length'][converged]
+    h, _ = _residual(a_eff, crack[converged], stress[converged] / YIELD,
+                     CenterCrackedPlate(width[converged], 0.01), model, True)
+    assert np.abs(h / crack[converged]).max() < 1e-10
+    assert np.all(a_eff >= crack[converged])
+
+def test_corrected_geometry_in_fatigue_and_critical_size():
+    plate = CenterCrackedPlate(0.2, 0.01)
+    corrected = PlasticZoneCorrectedGeometry(plate, 150e6, YIELD)
+    a = np.array([0.01, 0.05])
+    step = 1e-7
+    numeric = (corrected.unit_k1(a + step) - corrected.unit_k1(a - step)) / (2.0 * step)
+    assert corrected.unit_k1_derivative(a) == pytest.approx(numeric, rel=1e-6)
+
+    integrator = ParisLawIntegrator(1.5e-11, 3.0)
+    assert (integrator.allowable_stress_range(1e6, 0.002, 0.05, geometry=corrected)
+            < integrator.allowable_stress_range(1e6, 0.002, 0.05, geometry=plate))
+    a_c = critical_crack_length(corrected, 50e6, 150e6)
+    assert a_c < critical_crack_length(plate, 50e6, 150e6)
+    assert corrected.calculate_k1(150e6, a_c) == pytest.approx(50e6, rel=1e-9)
+
+def test_unknown_model_raises():
+    with pytest.raises(ValueError):
+        effective_crack_length(100e6, 0.01, YIELD, model='tresca')
@@ -0,0 +1,72 @@
+import math
+import pytest
+import numpy as np
+from griffith.fatigue import ParisLawIntegrator
+from griffith.geometry import CenterCrackedPlate
+from griffith.precision import get_precision, precision, set_precision
+from griffith.r_curve import RCurveAnalysis
+from griffith.solvers import critical_crack_length, find_roots
+
+def _plates():
+    rng = np.random.default_rng(0)
+    width = rng.uniform(0.05, 0.5, 2000)
+    return CenterCrackedPlate(width, 0.01), width, rng.uniform(50e6, 300e6, 2000)
+
+def test_screening_runs_in_float32_close_to_standard():
+    plate, width, stress = _plates()
+    integrator = ParisLawIntegrator(1.5e-11, 3.0)
+    a_c = critical_crack_length(plate, 50e6, stress)
+    life = integrator.allowable_stress_range(1e6, 0.002, 0.5 * a_c, geometry=plate)
+
+    with precision('screening') as settings:
+        assert get_precision() is settings
+        a_c_fast = critical_crack_length(plate, 50e6, stress)
+        life_fast = integrator.allowable_stress_range(1e6, 0.002, 0.5 * a_c, geometry=plate)
+    assert get_precision().tier == 'standard'
+
+    assert a_c_fast.dtype == np.float32
+    assert a_c_fast == pytest.approx(a_c, rel=1e-5)
+    assert life_fast == pytest.approx(life, rel=1e-5)
+
+def test_certified_roots_report_error_bounds():
+    with precision('certified') as settings:
+        roots, converged = find_roots(lambda x: x * x - 2.0, np.zeros(3), np.array([2.0, 3.0, 4.0]),
+                                      fprime=lambda x: 2.0 * x, xtol=1e-6, rtol=0.0)
+    assert converged.all()
+    report, = settings.reports
+    assert report['source'] == 'find_roots'
+    assert report['unconverged'] == 0 and report['iterations'] > 0
+    assert np.all(np.abs(roots - math.sqrt(2.0)) <= report['error'])
+    assert report['max_error'] <= 1e-6
+
+def test_certified_r_curve_and_life_reports():
+    analysis = RCurveAnalysis(lambda da: 150e3 + 400e3 * np.sqrt(da), lambda da: 200e3 / np.sqrt(da))
+    plate = CenterCrackedPlate(0.2, 0.01)
+    with precision('certified') as settings:
+        stress = analysis.find_instability_load(0.05)
+        ParisLawIntegrator(1.5e-11, 3.0).allowable_stress_range(1e6, 0.002, 0.01, geometry=plate)
+    assert stress == analysis.find_instability_load(0.05)
+
+    sources = [report['source'] for report in settings.reports]
+    assert sources == ['_find_root', '_geometry_growth_damage']
+    root_report, life_report = settings.reports
+    assert root_report['criterion'] in ('bracket', 'residual') and root_report['error'] < 1e-9
+    assert life_report['nodes'] == 64 and life_report['max_relative_error'] < 1e-6
+
+def test_global_default_and_validation():
+    try:
+        set_precision('screening')
+        assert get_precision().dtype == np.float32
+        with precision('certified'):
+            assert get_precision().certified
+        assert get_precision().tier == 'screening'
+        # A global certified default keeps only its most recent reports
+        set_precision('certified', max_reports=2)
+        for stress in (150e6, 160e6, 170e6):
+            critical_crack_length(CenterCrackedPlate(0.2, 0.01), 50e6, stress)
+        assert get_precision().certified and len(get_precision().reports) == 2
+        assert all(report['source'] == 'find_roots' for report in get_precision().reports)
+    finally:
+        set_precision('standard')
+    with pytest.raises(ValueError):
+        precision('fast').__enter__()
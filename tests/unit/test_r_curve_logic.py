@@ -80,3 +80,75 @@ def test_find_instability_load_correctness():
 
     # We expect delta_a_crit to be close to initial_crack (0.02)
     assert abs(delta_a_crit - initial_crack) < 1e-5
+
+def _sqrt_resistance(delta_a):
+    return (150 + 400 * np.sqrt(delta_a)) * 1000
+
+def _sqrt_resistance_deriv(delta_a):
+    return (200 / np.sqrt(delta_a)) * 1000
+
+def test_geometry_instability_matches_infinite_plate():
+    """
+    With a constant geometry factor, the geometry-coupled tangency solver must
+    reproduce find_instability_load, for every initial crack in one call.
+    """
+    from griffith.lefm import StressIntensityFactor
+
+    analysis = RCurveAnalysis(_sqrt_resistance, _sqrt_resistance_deriv)
+    initial_cracks = np.array([0.01, 0.02, 0.05])
+
+    expected = [analysis.find_instability_load(a0, 200e9, 1.0) for a0 in initial_cracks]
+    sigma_c = analysis.find_geometry_instability(StressIntensityFactor(1.0), initial_cracks)
+
+    assert sigma_c.shape == (3,)
+    assert np.allclose(sigma_c, expected, rtol=1e-6)
+
+def test_geometry_instability_finite_width_cct():
+    """
+    A narrower CCT plate has a steeper driving force (dY/da > 0), so the
+    instability load must drop below the infinite-plate value.
+    """
+    from griffith.geometry import CenterCrackedPlate
+
+    analysis = RCurveAnalysis(_sqrt_resistance, _sqrt_resistance_deriv)
+    wide = analysis.find_geometry_instability(CenterCrackedPlate(width=10.0, crack_length=0.1), 0.1)
+    narrow = analysis.find_geometry_instability(CenterCrackedPlate(width=0.15, crack_length=0.1), 0.1)
+
+    assert narrow < wide
+    # Tangency: J(a_crit) equals R at the reported critical point
+    cv = analysis.critical_values
+    j_crit = RCurveAnalysis.driving_force_curves(
+        cv['geometry'], 0.1, cv['sigma_c'], cv['delta_a'], 200e9
+    )
+    assert abs(j_crit[0] - cv['r_crit']) / cv['r_crit'] < 1e-9
+
+def test_geometry_instability_displacement_control():
+    """
+    A constant compliance makes displacement control identical to load control.
+    """
+    from griffith.geometry import CenterCrackedPlate
+
+    analysis = RCurveAnalysis(_sqrt_resistance, _sqrt_resistance_deriv)
+    plate = CenterCrackedPlate(width=0.3, crack_length=0.1)
+
+    load_control = analysis.find_geometry_instability(plate, 0.1)
+    disp_control = analysis.find_geometry_instability(
+        plate, 0.1, control='displacement', compliance_func=lambda a: np.full_like(a, 1e-9)
+    )
+    assert abs(disp_control - load_control) / load_control < 1e-6
+    assert analysis.critical_values['displacement_c'] > 0
+
+    with pytest.raises(ValueError):
+        analysis.find_geometry_instability(plate, 0.1, control='displacement')
+
+def test_driving_force_curve_family_shape():
+    from griffith.geometry import CenterCrackedPlate
+
+    plate = CenterCrackedPlate(width=0.3, crack_length=0.1)
+    loads = np.linspace(100e6, 300e6, 5)
+    delta_a = np.linspace(0.0, 0.01, 7)
+    j = RCurveAnalysis.driving_force_curves(plate, 0.1, loads, delta_a)
+
+    assert j.shape == (5, 7)
+    assert np.all(np.diff(j, axis=0) > 0)
+    assert np.all(np.diff(j, axis=1) > 0)
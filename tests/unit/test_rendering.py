@@ -0,0 +1,77 @@
+import pytest
+import numpy as np
+from griffith import rendering
+from griffith.fatigue import ParisLawIntegrator
+from griffith.r_curve import RCurveAnalysis
+
+def test_lttb_keeps_endpoints_and_peaks():
+    x = np.linspace(0.0, 1.0, 10001)
+    y = np.sin(2 * np.pi * 5 * x)
+    y[5000] = 10.0 # A spike that uniform decimation could skip
+
+    xd, yd = rendering.lttb(x, y, 200)
+
+    assert len(xd) == 200
+    assert xd[0] == 0.0 and xd[-1] == 1.0
+    assert np.all(np.diff(xd) > 0)
+    assert yd.max() == 10.0
+
+    # Short series are returned untouched
+    xs, ys = rendering.lttb(x[:50], y[:50], 200)
+    assert len(xs) == 50
+
+def test_render_formats_and_cache():
+    rendering.clear_cache()
+    cycles, crack = rendering.growth_curve(ParisLawIntegrator(1.5e-11, 3.0), 150, 0.002, 0.02, 1.12)
+
+    png = rendering.render_growth_curve(cycles, crack, fmt='png')
+    assert png[:8] == b'\x89PNG\r\n\x1a\n'
+
+    svg = rendering.render_growth_curve(cycles, crack, fmt='svg')
+    assert b'<svg' in svg
+
+    fig = rendering.render_growth_curve(cycles, crack, fmt='plotly')
+    assert fig['data'][0]['x'][-1] == pytest.approx(cycles[-1])
+
+    # Identical inputs hit the cache and return the same object
+    assert rendering.render_growth_curve(cycles, crack, fmt='png') is png
+
+    # Plotly figures are copies: mutating one does not leak into later responses
+    fig['data'][0]['x'][-1] = -1.0
+    fig['layout']['title'] = 'edited'
+    again = rendering.render_growth_curve(cycles, crack, fmt='plotly')
+    assert again['data'][0]['x'][-1] == pytest.approx(cycles[-1])
+    assert again['layout']['title'] != 'edited'
+
+    with pytest.raises(ValueError):
+        rendering.render_growth_curve(cycles, crack, fmt='gif')
+
+def test_stability_diagram_from_analysis():
+    def resistance_func(delta_a):
+        return (150 + 400 * np.sqrt(delta_a)) * 1000
+
+    analysis = RCurveAnalysis(resistance_func=resistance_func)
+    analysis.find_instability_load(initial_crack=0.05)
+
+    delta_a, r_curve, j_applied = analysis.stability_diagram_data(50)
+    assert delta_a.shape == r_curve.shape == j_applied.shape == (50,)
+
+    fig = rendering.stability_diagram(analysis, fmt='plotly')
+    names = [trace['name'] for trace in fig['data']]
+    assert names[0] == 'Material Resistance (R-Curve)'
+    assert names[-1] == 'Instability Point'
+
+def test_cache_is_thread_safe(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    monkeypatch.setattr(rendering, '_CACHE_SIZE', 4)
+    rendering.clear_cache()
+    cycles, crack = rendering.growth_curve(ParisLawIntegrator(1.5e-11, 3.0), 150, 0.002, 0.02, 1.12)
+
+    def render(i):
+        fig = rendering.render_growth_curve(cycles, crack * (1.0 + i % 8), fmt='plotly')
+        return fig['data'][0]['y'][-1]
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(render, range(400)))
+    assert results == [pytest.approx(crack[-1] * 1000 * (1.0 + i % 8)) for i in range(400)]
+    assert len(rendering._FIGURE_CACHE) <= 4
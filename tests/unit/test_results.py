@@ -0,0 +1,90 @@
+import pickle
+import pytest
+import numpy as np
+from griffith.fatigue import ParisLawIntegrator
+from griffith.geometry import CenterCrackedPlate
+from griffith.materials import Steel
+from griffith.r_curve import RCurveAnalysis
+from griffith.results import FatigueLifeResult, InstabilityResult
+
+def _resistance(delta_a):
+    return (150 + 400 * np.sqrt(delta_a)) * 1000
+
+def _resistance_deriv(delta_a):
+    return 200 * 1000 / np.sqrt(delta_a)
+
+def test_instability_result_is_dict_compatible():
+    analysis = RCurveAnalysis(_resistance, _resistance_deriv)
+    sigma_c = analysis.find_instability_load(0.05, 200e9, 1.12)
+    cv = analysis.critical_values
+
+    assert isinstance(cv, InstabilityResult)
+    assert cv['sigma_c'] == pytest.approx(sigma_c)
+    assert np.isscalar(cv['delta_a'])
+    assert cv.get('geometry') is None
+    assert 'r_crit' in cv and np.isnan(cv['displacement_c'])
+    assert cv.a_crit == pytest.approx(0.05 + cv.delta_a)
+    assert set(cv.to_dict()) >= {'delta_a', 'a_crit', 'r_crit', 'sigma_c', 'geometry'}
+
+def test_item_assignment_like_the_old_dict():
+    analysis = RCurveAnalysis(_resistance, _resistance_deriv)
+    analysis.find_instability_load(0.05, 200e9, 1.12)
+    cv = analysis.critical_values
+    cv['sigma_c'] = 1.5e8
+    cv['displacement_c'] = None
+    cv['note'] = 'checked'
+    assert cv['sigma_c'] == 1.5e8 and np.isnan(cv.displacement_c) and cv['note'] == 'checked'
+
+    life = FatigueLifeResult(cycles=np.arange(4.0), m=3.0)
+    life['cycles'] = 0.0
+    life[1:3] = FatigueLifeResult(cycles=[5.0, 6.0], m=4.0)
+    assert life.cycles.tolist() == [0.0, 5.0, 6.0, 0.0] and life.m.tolist() == [3.0, 4.0, 4.0, 3.0]
+
+def test_batched_geometry_instability_columns_are_views():
+    analysis = RCurveAnalysis(_resistance, _resistance_deriv)
+    plate = CenterCrackedPlate(width=0.3, crack_length=0.1)
+    loads = analysis.find_geometry_instability(plate, np.linspace(0.02, 0.1, 50))
+    cv = analysis.critical_values
+
+    assert len(cv) == 50 and cv.shape == (50,)
+    assert np.array_equal(cv['sigma_c'], loads, equal_nan=True)
+    assert np.shares_memory(cv['sigma_c'], cv.data)
+    assert cv['geometry'] is plate and cv['control'] == 'load'
+    # Row selection keeps the result type and shared settings
+    subset = cv[cv['initial_crack'] > 0.05]
+    assert isinstance(subset, InstabilityResult) and subset['geometry'] is plate
+    assert np.all(subset['initial_crack'] > 0.05)
+    # One fixed-size record per result
+    assert cv.nbytes == 50 * len(InstabilityResult.FIELDS) * 8
+
+def test_fatigue_life_round_trips_through_npz(tmp_path):
+    integrator = ParisLawIntegrator(1.5e-11, 3.0)
+    stress = np.linspace(50.0, 150.0, 1000)
+    life = integrator.predict_life(stress, 0.002, 0.02, 1.12)
+    assert np.allclose(life.cycles, integrator.predict_cycles(stress, 0.002, 0.02, 1.12))
+    assert np.all(life['m'] == 3.0)
+
+    life.meta['units'] = 'MPa'
+    path = tmp_path / 'life.npz'
+    life.to_npz(path)
+    loaded = FatigueLifeResult.from_npz(path)
+    assert np.array_equal(loaded.data, life.data)
+    assert loaded.meta == {'units': 'MPa'}
+
+    joined = FatigueLifeResult.concatenate([life[:10], integrator.predict_life(100.0, 0.002, 0.02)])
+    assert joined.shape == (11,)
+    assert pickle.loads(pickle.dumps(joined)).data.tobytes() == joined.data.tobytes()
+
+def test_critical_size_result():
+    steel = Steel()
+    result = steel.critical_size(np.array([100e6, 200e6]), 1.12)
+    assert np.allclose(result.critical_crack_length, steel.critical_crack_length(np.array([100e6, 200e6]), 1.12))
+    assert result['material'] == 'Steel'
+
+    plate = CenterCrackedPlate(width=0.1, crack_length=0.01)
+    result = steel.critical_size(200e6, geometry=plate)
+    assert np.isnan(result['geometry_factor']) and result['geometry'] is plate
+
+def test_unknown_field_rejected():
+    with pytest.raises(ValueError):
+        FatigueLifeResult(cycles=1.0, life=2.0)
@@ -0,0 +1,80 @@
+import math
+import pytest
+import numpy as np
+from griffith.fatigue import ParisLawIntegrator
+from griffith.retardation import RetardedCrackGrowth
+
+C, M, YIELD, Y = 1.5e-11, 3.0, 350.0, 1.12
+
+def _wheeler_cycle_by_cycle(a, sequence, gamma=1.5):
+    boundary = a
+    for s in sequence:
+        k_max = Y * s * math.sqrt(math.pi * a)
+        zone = (k_max / YIELD) ** 2 / (2.0 * math.pi)
+        factor = 1.0 if a + zone >= boundary else (zone / (boundary - a)) ** gamma
+        a += factor * C * k_max ** M
+        boundary = max(boundary, a + (Y * s / YIELD) ** 2 / 2.0 * a)
+    return a
+
+def test_constant_amplitude_matches_paris_law():
+    state = RetardedCrackGrowth([0.002, 0.003], C, M, YIELD, Y)
+    state.advance(100.0, 0.0, 1e5)
+    expected = ParisLawIntegrator(C, M).predict_crack_length(100.0, np.array([0.002, 0.003]), 1e5, Y)
+    assert state.crack_length == pytest.approx(expected, rel=1e-12)
+    assert state.cycles.tolist() == [1e5, 1e5]
+    # An empty sequence leaves the fleet unchanged
+    assert state.advance([], []) is state
+    assert state.advance(np.empty((0, 2)), 0.0, 1.0).cycles.tolist() == [1e5, 1e5]
+    assert state.crack_length == pytest.approx(expected, rel=1e-12)
+
+def test_wheeler_block_matches_cycle_by_cycle():
+    """
+    A constant amplitude run after an overload, integrated as one block,
+    matches the explicit cycle by cycle recursion.
+    """
+    sequence = [250.0] + [100.0] * 100000
+    expected = _wheeler_cycle_by_cycle(0.002, sequence)
+    state = RetardedCrackGrowth(0.002, C, M, YIELD, Y).advance([250.0, 100.0], 0.0, [1, 100000])
+    assert state.crack_length[0] == pytest.approx(expected, rel=1e-3)
+
+    unretarded = ParisLawIntegrator(C, M).predict_crack_length(100.0, 0.002, 100000, Y)
+    assert state.crack_length[0] < unretarded
+
+def test_willenborg_shut_off_arrests_growth():
+    # Overload ratio 2.5 exceeds the shut-off ratio 2: no growth until the zone is left
+    state = RetardedCrackGrowth(0.002, C, M, YIELD, Y, model='willenborg')
+    state.advance([250.0, 100.0], 0.0, [1, 1e6])
+    after_overload = 0.002 + C * (Y * 250.0 * math.sqrt(math.pi * 0.002)) ** M
+    assert state.crack_length[0] == pytest.approx(after_overload, rel=1e-6)
+    assert state.retarded.all()
+
+def test_per_crack_sequences_match_individual_cracks():
+    rng = np.random.default_rng(3)
+    sequences = rng.uniform(40.0, 200.0, (500, 3))
+    sequences[::50] = 260.0
+    fleet = RetardedCrackGrowth([0.002, 0.004, 0.003], C, [2.8, 3.0, 3.2], YIELD, Y)
+    fleet.advance(sequences, 0.1 * sequences)
+    for i, m in enumerate([2.8, 3.0, 3.2]):
+        single = RetardedCrackGrowth([0.002, 0.004, 0.003][i], C, m, YIELD, Y)
+        single.advance(sequences[:, i], 0.1 * sequences[:, i])
+        assert single.crack_length[0] == pytest.approx(fleet.crack_length[i], rel=1e-12)
+
+def test_failed_cracks_are_frozen_and_model_is_validated():
+    state = RetardedCrackGrowth([0.002, 0.002], C, M, YIELD, Y, critical_length=0.01)
+    state.advance([[150.0, 10.0]], 0.0, 1e7)
+    assert state.failed.tolist() == [True, False]
+    # Only the cycles up to failure are counted, and the length stops at critical
+    to_failure = ParisLawIntegrator(C, M).predict_cycles(150.0, 0.002, 0.01, Y)
+    assert state.cycles == pytest.approx([to_failure, 1e7], rel=1e-12)
+    assert state.crack_length[0] == 0.01
+    state.advance([[150.0, 10.0]], 0.0, 1e5)
+    assert state.crack_length[0] == 0.01
+    assert state.cycles[0] == pytest.approx(to_failure, rel=1e-12)
+
+    # Failure inside an overload zone stops the count as well
+    retarded = RetardedCrackGrowth(0.0095, C, M, YIELD, Y, critical_length=0.01)
+    retarded.advance([300.0, 150.0], 0.0, [1.0, 1e7])
+    assert retarded.failed.all() and retarded.crack_length[0] == 0.01
+    assert retarded.cycles[0] < 1e7
+    with pytest.raises(ValueError):
+        RetardedCrackGrowth(0.002, C, M, YIELD, model='closure')
@@ -0,0 +1,68 @@
+import pytest
+import numpy as np
+from griffith.fatigue import ParisLawIntegrator, paris_cycles_sensitivities
+from griffith.geometry import CenterCrackedPlate
+from griffith.materials import Steel
+from griffith.r_curve import RCurveAnalysis
+from griffith.solvers import critical_crack_length_sensitivities
+
+def _central(func, x, rel=1e-6):
+    h = rel * x
+    return (func(x + h) - func(x - h)) / (2 * h)
+
+@pytest.mark.parametrize("m", [2.0, 3.2])
+def test_paris_gradients_match_finite_differences(m):
+    params = {'c': 1e-11, 'm': m, 'stress_range': 100.0, 'a_initial': 0.002, 'a_final': 0.03, 'geometry_factor': 1.12}
+    cycles, gradients = paris_cycles_sensitivities(**params)
+    assert cycles == pytest.approx(ParisLawIntegrator(1e-11, m).predict_cycles(100.0, 0.002, 0.03, 1.12), rel=1e-12)
+
+    for name, value in params.items():
+        # A larger step in m keeps (a^e - a_i^e) / e clear of cancellation near m = 2
+        rel = 1e-4 if name == 'm' else 1e-6
+        expected = _central(lambda x: paris_cycles_sensitivities(**dict(params, **{name: x}))[0], value, rel)
+        assert gradients[name] == pytest.approx(expected, rel=1e-6)
+
+def test_paris_gradients_are_batched():
+    stress = np.linspace(50.0, 150.0, 1000)
+    cycles, gradients = ParisLawIntegrator(1e-11, 3.0).predict_cycles_sensitivities(stress, 0.002, 0.03, 1.12)
+    assert cycles.shape == gradients['c'].shape == gradients['m'].shape == (1000,)
+    assert np.allclose(gradients['stress_range'], -3.0 * cycles / stress)
+
+def test_critical_crack_length_gradients():
+    steel = Steel()
+    a_c, gradients = steel.critical_crack_length_sensitivities(200e6, 1.12)
+    assert gradients['k_ic'] == pytest.approx(
+        _central(lambda k: (k / (1.12 * 200e6)) ** 2 / np.pi, steel.k_ic), rel=1e-8)
+    assert gradients['load'] == pytest.approx(-2 * a_c / 200e6)
+
+    plate = CenterCrackedPlate(width=0.1, crack_length=0.01)
+    a_c, gradients = critical_crack_length_sensitivities(plate, 50e6, np.array([200e6, 300e6]))
+    for i, stress in enumerate((200e6, 300e6)):
+        expected = _central(lambda k: critical_crack_length_sensitivities(plate, k, stress)[0], 50e6)
+        assert gradients['k_ic'][i] == pytest.approx(expected, rel=1e-6)
+        expected = _central(lambda s: critical_crack_length_sensitivities(plate, 50e6, s)[0], stress)
+        assert gradients['load'][i] == pytest.approx(expected, rel=1e-6)
+
+def test_instability_load_gradients():
+    """
+    R = r0 + r1 * sqrt(da); the envelope-theorem derivatives must match
+    re-solving the instability problem with perturbed parameters.
+    """
+    def solve(a0=0.02, youngs_modulus=200e9, geometry_factor=1.1, r0=150e3, r1=400e3):
+        analysis = RCurveAnalysis(lambda da: r0 + r1 * np.sqrt(da), lambda da: 0.5 * r1 / np.sqrt(da))
+        return analysis, analysis.find_instability_load(a0, youngs_modulus, geometry_factor)
+
+    analysis, sigma_c = solve()
+    _, gradients = analysis.instability_sensitivities(lambda da: {'r0': 1.0, 'r1': np.sqrt(da)})
+    checks = {'initial_crack': ('a0', 0.02), 'youngs_modulus': ('youngs_modulus', 200e9),
+              'geometry_factor': ('geometry_factor', 1.1), 'r0': ('r0', 150e3), 'r1': ('r1', 400e3)}
+    for key, (arg, value) in checks.items():
+        expected = _central(lambda x: solve(**{arg: x})[1], value, rel=1e-4)
+        assert gradients[key] == pytest.approx(expected, rel=1e-5)
+
+    plate = CenterCrackedPlate(width=0.2, crack_length=0.04)
+    analysis = RCurveAnalysis(lambda da: 150e3 + 400e3 * np.sqrt(da), lambda da: 200e3 / np.sqrt(da))
+    analysis.find_geometry_instability(plate, 0.04)
+    _, gradients = analysis.instability_sensitivities()
+    expected = _central(lambda a0: analysis.find_geometry_instability(plate, a0), 0.04, rel=1e-4)
+    assert gradients['initial_crack'] == pytest.approx(expected, rel=1e-5)
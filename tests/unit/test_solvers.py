@@ -0,0 +1,79 @@
+import pytest
+import numpy as np
+from griffith.geometry import CenterCrackedPlate, SingleEdgeNotchBend
+from griffith.lefm import StressIntensityFactor
+from griffith.materials import Steel
+from griffith.solvers import find_roots, critical_crack_length, critical_load
+
+def test_unit_k1_derivatives_match_finite_differences():
+    """
+    Analytic dg/da of the geometry classes against central differences.
+    """
+    h = 1e-7
+    cct = CenterCrackedPlate(width=0.1, crack_length=0.02)
+    crack = np.linspace(0.001, 0.095, 20)
+    numeric = (cct.unit_k1(crack + h) - cct.unit_k1(crack - h)) / (2 * h)
+    assert np.allclose(cct.unit_k1_derivative(crack), numeric, rtol=1e-6)
+
+    senb = SingleEdgeNotchBend(width=0.05, thickness=0.025, crack_length=0.02, span=0.2)
+    crack = np.linspace(0.002, 0.048, 20)
+    numeric = (senb.unit_k1(crack + h) - senb.unit_k1(crack - h)) / (2 * h)
+    assert np.allclose(senb.unit_k1_derivative(crack), numeric, rtol=1e-6)
+
+def test_find_roots_vectorized():
+    """
+    Solves x^3 = c for an array of c with and without the derivative.
+    """
+    c = np.linspace(0.1, 8.0, 50)
+    f = lambda x, c: x ** 3 - c
+    df = lambda x, c: 3 * x ** 2
+
+    roots, converged = find_roots(f, 0.0, 3.0, fprime=df, args=(c,))
+    assert converged.all()
+    assert np.allclose(roots, np.cbrt(c), rtol=1e-10)
+
+    roots, converged = find_roots(f, 0.0, 3.0, args=(c,))
+    assert converged.all()
+    assert np.allclose(roots, np.cbrt(c), rtol=1e-9)
+
+    # No sign change in the bracket
+    roots, converged = find_roots(f, 3.0, 4.0, args=(c,))
+    assert np.isnan(roots).all()
+    assert not converged.any()
+
+def test_critical_crack_length_constant_y_matches_closed_form():
+    geometry = StressIntensityFactor(geometry_factor=1.12)
+    a_c = critical_crack_length(geometry, 50e6, 200e6)
+    expected = StressIntensityFactor.critical_crack_length(50e6, 200e6, 1.12)
+    assert abs(a_c - expected) / expected < 1e-9
+
+def test_critical_crack_length_cct_batch():
+    """
+    Solves many CCT width/toughness/stress combinations in one call and
+    checks that K_I(a_c) = K_IC with the secant correction.
+    """
+    rng = np.random.default_rng(0)
+    n = 2000
+    width = rng.uniform(0.05, 1.0, n)
+    k_ic = rng.uniform(20e6, 150e6, n)
+    stress = rng.uniform(50e6, 400e6, n)
+
+    plate = CenterCrackedPlate(width=width, crack_length=0.01)
+    crack_c = critical_crack_length(plate, k_ic, stress)
+
+    assert np.all(crack_c < width)
+    assert np.allclose(stress * plate.unit_k1(crack_c), k_ic, rtol=1e-8)
+
+    # Finite width shortens the critical crack compared to Y = 1
+    infinite = 2 * StressIntensityFactor.critical_crack_length(k_ic, stress)
+    assert np.all(crack_c <= infinite)
+
+def test_critical_load_and_material():
+    plate = CenterCrackedPlate(width=0.1, crack_length=0.02)
+    sigma_c = critical_load(plate, 50e6)
+    assert abs(plate.calculate_k1(sigma_c) - 50e6) / 50e6 < 1e-12
+
+    steel = Steel(K_IC=50e6)
+    crack_c = steel.critical_crack_length(sigma_c, geometry=plate)
+    assert abs(crack_c - 0.02) < 1e-9
+    assert abs(steel.critical_load(plate) - sigma_c) < 1e-3
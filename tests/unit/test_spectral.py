@@ -0,0 +1,51 @@
+import pytest
+import numpy as np
+from griffith.fatigue import ParisLawIntegrator
+from griffith.spectral import SpectralFatigue, spectral_moments
+
+FREQUENCY = np.linspace(0.0, 50.0, 5001)
+
+def _band(f0, f1, level=1e12):
+    return np.where((FREQUENCY >= f0) & (FREQUENCY <= f1), level, 0.0)
+
+def test_moments_of_flat_band():
+    moments = spectral_moments(FREQUENCY, _band(10.0, 20.0, 2.0), orders=(0, 1, 2))
+    exact = [2.0 * (20 - 10), 2.0 * (20 ** 2 - 10 ** 2) / 2, 2.0 * (20 ** 3 - 10 ** 3) / 3]
+    assert moments == pytest.approx(exact, rel=2e-3)
+
+def test_dirlik_density_matches_closed_form_moment():
+    spectra = SpectralFatigue(FREQUENCY, np.stack([_band(2.0, 20.0), _band(1.0, 5.0) + _band(30.0, 40.0, 2e11)]))
+    ranges = np.linspace(0.0, 40.0 * np.sqrt(spectra.m0.max()), 200001)[:, np.newaxis]
+    density = spectra.range_pdf(ranges)
+    assert np.trapezoid(density, ranges, axis=0) == pytest.approx([1.0, 1.0], rel=1e-6)
+    _, moment = spectra.range_moment(3.0, 'dirlik')
+    assert np.trapezoid(density * ranges ** 3, ranges, axis=0) == pytest.approx(moment, rel=1e-6)
+
+def test_narrow_band_methods_agree():
+    spectra = SpectralFatigue(FREQUENCY, _band(10.0, 10.2))
+    rayleigh = np.prod(spectra.range_moment(3.0, 'rayleigh'))
+    assert np.prod(spectra.range_moment(3.0, 'dirlik')) == pytest.approx(rayleigh, rel=1e-2)
+    assert np.prod(spectra.range_moment(3.0, 'benasciutti_tovo')) == pytest.approx(rayleigh, rel=1e-2)
+
+def test_wide_band_is_less_damaging_than_rayleigh():
+    spectra = SpectralFatigue(FREQUENCY, np.stack([_band(1.0, 5.0) + _band(30.0, 40.0, 2e11), _band(2.0, 20.0)]))
+    rayleigh = np.prod(spectra.range_moment(3.0, 'rayleigh'), axis=0)
+    for method in ('dirlik', 'benasciutti_tovo'):
+        assert np.all(np.prod(spectra.range_moment(3.0, method), axis=0) < rayleigh)
+
+def test_growth_matches_constant_amplitude_integration():
+    psd = np.stack([_band(2.0, 20.0, level) for level in (1e12, 4e12, 9e12)])
+    spectra = SpectralFatigue(FREQUENCY, psd)
+    time = spectra.predict_time(1e-11 / 1e6 ** 3, 3.0, 0.002, 0.02, 1.12)
+    assert time.shape == (3,)
+
+    rate, delta_sigma = spectra.equivalent_stress_range(3.0)
+    cycles = ParisLawIntegrator(1e-11, 3.0).predict_cycles(delta_sigma / 1e6, 0.002, 0.02, 1.12)
+    assert time * rate == pytest.approx(cycles, rel=1e-10)
+    # Doubling the RMS stress shortens the life by 2^m
+    assert time[0] / time[1] == pytest.approx(8.0, rel=1e-10)
+    assert spectra.predict_crack_length(1e-11 / 1e6 ** 3, 3.0, 0.002, time, 1.12) == pytest.approx([0.02] * 3)
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        SpectralFatigue(FREQUENCY, _band(1.0, 2.0)).range_moment(3.0, 'steinberg')
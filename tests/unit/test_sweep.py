@@ -0,0 +1,60 @@
+import functools
+import pytest
+import numpy as np
+from griffith.cli import process_chunk
+from griffith.sweep import SweepStore
+
+_CCT = functools.partial(process_chunk, geometry='cct')
+
+def _parameters(crack_lengths):
+    return {'crack_length': crack_lengths, 'width': 0.1, 'stress': 200e6, 'k_ic': 50e6}
+
+def test_sweep_resumes_after_interruption(tmp_path):
+    crack_lengths = np.linspace(0.001, 0.05, 1000)
+    store = SweepStore.create(str(tmp_path), _parameters(crack_lengths), ('k1',), chunk_size=128)
+    assert store.n_chunks == 8
+
+    # An interrupted run: only part of the chunks were completed
+    store.run(_CCT, chunks=[0, 3])
+    resumed = SweepStore(str(tmp_path))
+    assert resumed.pending_chunks() == [1, 2, 4, 5, 6, 7]
+    assert resumed.completed().sum() == 256
+
+    assert resumed.run(_CCT) == 6
+    assert resumed.pending_chunks() == []
+    expected = _CCT({k: np.broadcast_to(v, crack_lengths.shape) for k, v in _parameters(crack_lengths).items()})
+    assert np.array_equal(resumed.read('k1'), expected['k1'])
+
+def test_partial_results_are_memory_mapped(tmp_path):
+    store = SweepStore.create(str(tmp_path), _parameters(np.linspace(0.001, 0.05, 300)), ('k1',), chunk_size=100)
+    store.run(_CCT, chunks=[1])
+    k1 = store.read('k1')
+    assert isinstance(k1, np.memmap)
+    done = store.completed()
+    assert done.tolist() == [False] * 100 + [True] * 100 + [False] * 100
+    assert np.all(k1[done] > 0.0) and np.all(k1[~done] == 0.0)
+
+def test_appended_ranges_are_run_by_worker_processes(tmp_path):
+    outputs = ('k1', 'critical_crack_length')
+    store = SweepStore.create(str(tmp_path), _parameters(np.linspace(0.001, 0.02, 250)), outputs, chunk_size=64)
+    store.run(_CCT)
+    assert store.append(_parameters(np.linspace(0.021, 0.05, 200))) == 1
+    assert store.pending_chunks() == [4, 5, 6, 7]
+
+    assert store.run(_CCT, workers=2) == 4
+    assert store.completed().all()
+    assert store.read('crack_length').size == 450
+    k1 = store.read('k1')
+    assert np.all(np.diff(k1) > 0.0)
+    assert np.allclose(store.read('critical_crack_length'), store.read('critical_crack_length', 0)[0])
+
+def test_invalid_use_is_rejected(tmp_path):
+    store = SweepStore.create(str(tmp_path), _parameters(np.linspace(0.001, 0.05, 10)), ('k1',))
+    with pytest.raises(ValueError):
+        SweepStore.create(str(tmp_path), _parameters(np.linspace(0.001, 0.05, 10)), ('k1',))
+    with pytest.raises(ValueError):
+        store.append({'crack_length': [0.01]})
+    with pytest.raises(ValueError):
+        store.write(0, {'k2': 1.0})
+    with pytest.raises(ValueError):
+        store.parameters(5)
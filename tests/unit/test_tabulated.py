@@ -0,0 +1,93 @@
+import math
+import pytest
+import numpy as np
+from scipy.interpolate import PchipInterpolator
+from griffith.fatigue import ParisLawIntegrator
+from griffith.geometry import CenterCrackedPlate
+from griffith.solvers import critical_crack_length
+from griffith.tabulated import TabulatedGeometry
+
+C, M = 1.5e-11, 3.0
+
+def _cct_tables(n_tables=20, n_points=400):
+    width = np.linspace(0.1, 0.5, n_tables)
+    a = np.geomspace(0.002, 0.9, n_points) * width[:, np.newaxis]
+    return width, a, CenterCrackedPlate(width[:, np.newaxis], 0.01).unit_k1(a)
+
+def test_interpolation_matches_pchip_and_constant_y():
+    a = np.geomspace(0.001, 0.05, 15)
+    g = 1.12 * np.sqrt(math.pi * a) * (1.0 + 3.0 * a)
+    table = TabulatedGeometry(a, g)
+    query = np.linspace(0.001, 0.05, 101)
+    spline = PchipInterpolator(a, g / np.sqrt(a))
+    assert table.unit_k1(query) == pytest.approx(spline(query) * np.sqrt(query), rel=1e-13)
+    assert table.unit_k1_derivative(query) == pytest.approx(
+        spline.derivative()(query) * np.sqrt(query) + 0.5 * spline(query) / np.sqrt(query), rel=1e-12)
+    assert np.isnan(table.unit_k1(0.06))
+
+    constant = TabulatedGeometry(a, 1.12 * np.sqrt(math.pi * a))
+    assert constant.unit_k1(query) == pytest.approx(1.12 * np.sqrt(math.pi * query), rel=1e-14)
+    # The small crack limit keeps Y constant below the table
+    assert constant.unit_k1(1e-4) == pytest.approx(1.12 * math.sqrt(math.pi * 1e-4), rel=1e-14)
+
+def test_many_tables_broadcast_like_a_geometry():
+    width, a, g = _cct_tables()
+    tables = TabulatedGeometry(a, g, crack_tips=2)
+    plate = CenterCrackedPlate(width, 0.01)
+    query = np.random.default_rng(2).uniform(0.003, 0.85, (7, width.size)) * width
+    assert tables.unit_k1(query) == pytest.approx(plate.unit_k1(query), rel=1e-5)
+    assert tables.unit_k1_derivative(query) == pytest.approx(plate.unit_k1_derivative(query), rel=1e-3)
+    assert critical_crack_length(tables, 50e6, 150e6) == pytest.approx(
+        critical_crack_length(plate, 50e6, 150e6), rel=1e-5)
+
+def test_growth_curve_matches_closed_form_and_quadrature():
+    a = np.geomspace(0.001, 0.05, 200)
+    constant = TabulatedGeometry(a, 1.12 * np.sqrt(math.pi * a))
+    curve = constant.growth_curve(C, M, 100e6)
+    expected = ParisLawIntegrator(C, M).predict_cycles(100e6, 0.001, a, 1.12)
+    assert curve['cycles'] == pytest.approx(expected, rel=1e-12)
+    assert curve['crack_length'].tolist() == a.tolist()
+
+    width, a, g = _cct_tables()
+    tables = TabulatedGeometry(a, g, crack_tips=2)
+    stress_range = np.linspace(60e6, 120e6, width.size)
+    curve = tables.growth_curve(C, M, stress_range, a_initial=a[:, 10])
+    assert curve['cycles'].shape == a.shape
+    assert np.all(curve['cycles'][:, :11] == 0.0) and np.all(curve['crack_length'][:, :11] == a[:, 10:11])
+    plate = CenterCrackedPlate(width, 0.01)
+    life = ParisLawIntegrator(C, M).predict_cycles(stress_range, a[:, 10], a[:, -1], geometry=plate, n_nodes=200)
+    assert curve['cycles'][:, -1] == pytest.approx(life, rel=1e-7)
+
+def test_growth_curve_from_outside_the_table():
+    a = np.geomspace(0.001, 0.05, 200)
+    constant = TabulatedGeometry(a, 1.12 * np.sqrt(math.pi * a))
+    # Below the table Y stays constant, so the extension matches the closed form
+    for m in (3.0, 2.0):
+        curve = constant.growth_curve(C, m, 100e6, a_initial=0.0005)
+        expected = ParisLawIntegrator(C, m).predict_cycles(100e6, 0.0005, a, 1.12)
+        assert curve['cycles'] == pytest.approx(expected, rel=1e-12)
+        assert curve['crack_length'].tolist() == a.tolist()
+    with pytest.raises(ValueError):
+        constant.growth_curve(C, M, 100e6, a_initial=0.06)
+
+def test_csv_and_npz_loading(tmp_path):
+    _, a, g = _cct_tables(n_tables=3, n_points=50)
+    shared = a[0]
+    csv_path = tmp_path / 'k_tables.csv'
+    np.savetxt(csv_path, np.column_stack([shared, g.T]), delimiter=',', header='a,plate_1,plate_2,plate_3',
+               comments='')
+    from_csv = TabulatedGeometry.from_csv(csv_path, crack_tips=2)
+    assert from_csv.names == ('plate_1', 'plate_2', 'plate_3')
+    assert from_csv.crack_length_table.shape == (3, 50)
+
+    npz_path = tmp_path / 'k_tables.npz'
+    np.savez(npz_path, crack_length=a, unit_k1=g)
+    from_npz = TabulatedGeometry.from_npz(npz_path, crack_tips=2)
+    assert from_npz.unit_k1(a[:, 5]) == pytest.approx(g[:, 5], rel=1e-14)
+    assert from_npz.max_crack_length.tolist() == a[:, -1].tolist()
+
+def test_invalid_tables_raise():
+    with pytest.raises(ValueError):
+        TabulatedGeometry([0.01, 0.005, 0.02], [1.0, 2.0, 3.0])
+    with pytest.raises(ValueError):
+        TabulatedGeometry([0.01, 0.02], [1.0, -2.0])
@@ -0,0 +1,61 @@
+import pytest
+import numpy as np
+from griffith.transient import MasterCurve, TransientAssessment
+from griffith.weight_function import WeightFunctionSIF
+
+POSITIONS = np.linspace(0.0, 0.2, 81)
+DEPTHS = np.linspace(0.002, 0.08, 20)
+
+def _cooldown(n_steps=300):
+    """
+    Inner surface cooled from 290 to 20 deg C while thermal stresses build up.
+    """
+    t = np.linspace(0.0, 3600.0, n_steps)
+    decay = np.exp(-t / 600.0)[:, None]
+    depth_profile = np.exp(-POSITIONS / 0.03)[None, :]
+    temperature = 290.0 - 270.0 * (1.0 - decay) * depth_profile
+    stress = 100e6 + 300e6 * (1.0 - decay) * depth_profile
+    return t, stress, temperature
+
+def test_master_curve():
+    curve = MasterCurve(t0=-50.0)
+    temperature = np.array([-100.0, -50.0, 0.0])
+    expected = (30.0 + 70.0 * np.exp(0.019 * (temperature + 50.0))) * 1e6
+    assert np.allclose(curve(temperature), expected, rtol=1e-2)
+    # Lower tolerance bound and longer crack fronts are less tough
+    assert np.all(MasterCurve(-50.0, probability=0.05)(temperature) < expected)
+    assert np.all(MasterCurve(-50.0, thickness=0.1)(temperature) < expected)
+    assert MasterCurve(-50.0, upper_shelf=150e6)(200.0) == 150e6
+
+def test_k1_matches_weight_function():
+    t, stress, _ = _cooldown(10)
+    transient = TransientAssessment(DEPTHS, POSITIONS, thickness=0.2)
+    sif = WeightFunctionSIF('edge', DEPTHS, POSITIONS, width=0.2)
+    assert np.allclose(transient.stress_intensity(stress), sif.calculate_k1(stress.T).T, rtol=1e-12)
+
+def test_first_crossing_matches_step_loop(tmp_path):
+    t, stress, temperature = _cooldown()
+    transient = TransientAssessment(DEPTHS, POSITIONS, thickness=0.2)
+    curve = MasterCurve(t0=150.0)
+    results = transient.assess(stress, temperature, curve, times=t, keep_history=True, block_steps=7)
+
+    crossed = results['first_crossing_step'] >= 0
+    assert 0 < crossed.sum() < DEPTHS.size
+    for i in range(DEPTHS.size):
+        margin = results['k1'][:, i] - results['k_ic'][:, i]
+        steps = np.flatnonzero(margin >= 0.0)
+        if steps.size == 0:
+            assert results['first_crossing_step'][i] == -1 and np.isnan(results['first_crossing_time'][i])
+            continue
+        k = steps[0]
+        assert results['first_crossing_step'][i] == k
+        expected = t[k - 1] + margin[k - 1] / (margin[k - 1] - margin[k]) * (t[k] - t[k - 1])
+        assert results['first_crossing_time'][i] == pytest.approx(expected)
+    ratio = results['k1'] / results['k_ic']
+    assert np.array_equal(results['max_ratio_step'], ratio.argmax(axis=0))
+
+    # Memory-mapped input streamed in different blocks gives the same answer
+    np.save(tmp_path / 'stress.npy', stress)
+    mapped = transient.assess(np.load(tmp_path / 'stress.npy', mmap_mode='r'), temperature, curve, times=t)
+    for key in ('first_crossing_step', 'first_crossing_time', 'max_ratio'):
+        assert np.allclose(mapped[key], results[key], equal_nan=True)
@@ -0,0 +1,58 @@
+import pytest
+import numpy as np
+from griffith.geometry import CenterCrackedPlate
+from griffith.weight_function import WeightFunctionSIF
+
+def test_center_crack_uniform_stress():
+    """
+    Uniform stress must reproduce K = sigma * sqrt(pi * a), and with a width
+    the secant-corrected CenterCrackedPlate solution.
+    """
+    depths = np.linspace(0.001, 0.05, 20)
+    positions = np.linspace(0.0, 0.1, 200)
+    stress = np.full(positions.size, 100e6)
+
+    infinite = WeightFunctionSIF('center', depths, positions)
+    assert np.allclose(infinite.calculate_k1(stress), 100e6 * np.sqrt(np.pi * depths), rtol=1e-10)
+
+    finite = WeightFunctionSIF('center', depths, positions, width=0.2)
+    plate = CenterCrackedPlate(width=0.2, crack_length=2 * depths)
+    assert np.allclose(finite.calculate_k1(stress), plate.calculate_k1(100e6, 2 * depths), rtol=1e-10)
+
+def test_edge_crack_uniform_stress():
+    """
+    Edge crack in a half-plane: K = 1.1215 * sigma * sqrt(pi * a).
+    """
+    depths = np.linspace(0.001, 0.01, 10)
+    positions = np.linspace(0.0, 0.01, 50)
+    wf = WeightFunctionSIF('edge', depths, positions)
+    k1 = wf.calculate_k1(np.full(positions.size, 100e6))
+    assert np.allclose(k1 / (100e6 * np.sqrt(np.pi * depths)), 1.1215, rtol=1e-3)
+
+def test_polynomial_matches_sampled_profile():
+    """
+    A quadratic through-thickness profile gives the same K whether passed as
+    polynomial coefficients or as samples, for several profiles at once.
+    """
+    thickness = 0.05
+    depths = np.linspace(0.001, 0.04, 30)
+    positions = np.linspace(0.0, thickness, 2000)
+    wf = WeightFunctionSIF('edge', depths, positions, width=thickness)
+
+    coeffs = np.array([[200e6, 100e6], [-300e6, 0.0], [50e6, 0.0]])
+    u = positions / thickness
+    samples = np.stack([200e6 - 300e6 * u + 50e6 * u * u, np.full(u.size, 100e6)], axis=1)
+
+    k_poly = wf.calculate_k1_polynomial(coeffs)
+    k_sampled = wf.calculate_k1(samples)
+
+    assert k_poly.shape == (30, 2)
+    assert np.allclose(k_sampled, k_poly, rtol=1e-5)
+
+def test_invalid_inputs():
+    with pytest.raises(ValueError):
+        WeightFunctionSIF('corner', [0.01])
+    with pytest.raises(ValueError):
+        WeightFunctionSIF('edge', [0.02], positions=np.linspace(0.0, 0.01, 10))
+    with pytest.raises(ValueError):
+        WeightFunctionSIF('edge', [0.005]).calculate_k1(np.ones(10))